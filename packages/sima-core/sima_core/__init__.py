@@ -8,9 +8,13 @@ from .types import (
     EventType,
     InputType,
     TickType,
+    VALID_STREAMS,
+    VALID_ACTORS,
+    VALID_EVENT_TYPES,
+    VALID_INPUT_TYPES,
 )
 from .events import Event, EventCreate
-from .ids import generate_id, generate_trace_id
+from .ids import generate_id, generate_trace_id, generate_ids_bulk
 from .time import utc_now, format_timestamp
 
 __all__ = [
@@ -19,10 +23,15 @@ __all__ = [
     "EventType",
     "InputType",
     "TickType",
+    "VALID_STREAMS",
+    "VALID_ACTORS",
+    "VALID_EVENT_TYPES",
+    "VALID_INPUT_TYPES",
     "Event",
     "EventCreate",
     "generate_id",
     "generate_trace_id",
+    "generate_ids_bulk",
     "utc_now",
     "format_timestamp",
 ]
@@ -1,19 +1,22 @@
 """
 Event definitions for SIMA's event-sourced architecture.
+
+Events are built internally from already-typed inputs, so they are plain
+slotted dataclasses rather than validating models.
 """
 
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
-
 from .types import Stream, Actor, EventType
 from .ids import generate_id
 from .time import utc_now
 
 
-class EventCreate(BaseModel):
+@dataclass(slots=True)
+class EventCreate:
     """Data for creating a new event."""
 
     trace_id: UUID
@@ -29,15 +32,20 @@ class EventCreate(BaseModel):
     latency_ms: int | None = None
     cost_usd: float | None = None
     parent_event_id: UUID | None = None
-    tags: list[str] = Field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict."""
+        return asdict(self)
 
 
-class Event(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Event:
     """A persisted event in the system."""
 
-    event_id: UUID = Field(default_factory=generate_id)
+    event_id: UUID = field(default_factory=generate_id)
     trace_id: UUID
-    ts: datetime = Field(default_factory=utc_now)
+    ts: datetime = field(default_factory=utc_now)
     actor: Actor
     stream: Stream
     event_type: EventType
@@ -50,12 +58,28 @@ class Event(BaseModel):
     latency_ms: int | None = None
     cost_usd: float | None = None
     parent_event_id: UUID | None = None
-    tags: list[str] = Field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
 
-    class Config:
-        from_attributes = True
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict."""
+        return asdict(self)
 
     @classmethod
     def from_create(cls, create: EventCreate) -> "Event":
         """Create an Event from EventCreate data."""
-        return cls(**create.model_dump())
+        return cls(
+            trace_id=create.trace_id,
+            actor=create.actor,
+            stream=create.stream,
+            event_type=create.event_type,
+            content_text=create.content_text,
+            content_json=create.content_json,
+            model_provider=create.model_provider,
+            model_id=create.model_id,
+            tokens_in=create.tokens_in,
+            tokens_out=create.tokens_out,
+            latency_ms=create.latency_ms,
+            cost_usd=create.cost_usd,
+            parent_event_id=create.parent_event_id,
+            tags=create.tags,
+        )
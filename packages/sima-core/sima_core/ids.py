@@ -1,15 +1,81 @@
 """
 ID generation utilities for SIMA.
+
+IDs are time-ordered (version 7) UUIDs: a 48-bit millisecond Unix
+timestamp followed by random bits. New IDs sort after older ones, so
+inserts land at the right edge of primary-key indexes instead of at
+random pages. Order within the same millisecond is random.
+
+Random bytes are drawn from the OS in blocks and sliced per ID, so the
+per-event path does not pay a syscall each time. Each thread keeps its
+own block to avoid contention.
 """
 
-from uuid import UUID, uuid4
+import os
+import threading
+import time
+from uuid import UUID
+
+# Number of UUIDs drawn from os.urandom() per refill
+POOL_SIZE = 256
+
+# Random bytes per UUID; the other 6 hold the timestamp
+_RANDOM_BYTES = 10
+
+_local = threading.local()
+
+
+def _reset_pool() -> None:
+    """Drop the inherited pool so a forked child never reuses parent bytes."""
+    global _local
+    _local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def _next_bytes() -> bytes:
+    """Take the next 10 random bytes from this thread's pool."""
+    buf = getattr(_local, "buf", None)
+    pos = getattr(_local, "pos", 0)
+    if buf is None or pos >= len(buf):
+        buf = _local.buf = os.urandom(_RANDOM_BYTES * POOL_SIZE)
+        pos = 0
+    _local.pos = pos + _RANDOM_BYTES
+    return buf[pos:pos + _RANDOM_BYTES]
+
+
+def _uuid7_from_bytes(ms: int, raw: bytes) -> UUID:
+    """Build a version 7 UUID from a millisecond timestamp and 10 random bytes."""
+    b = bytearray(ms.to_bytes(6, "big") + raw)
+    b[6] = (b[6] & 0x0F) | 0x70  # version 7
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 9562 variant
+    return UUID(bytes=bytes(b))
 
 
 def generate_id() -> UUID:
     """Generate a new unique ID."""
-    return uuid4()
+    return _uuid7_from_bytes(time.time_ns() // 1_000_000, _next_bytes())
 
 
 def generate_trace_id() -> UUID:
     """Generate a new trace ID."""
-    return uuid4()
+    return _uuid7_from_bytes(time.time_ns() // 1_000_000, _next_bytes())
+
+
+def generate_ids_bulk(n: int) -> list[UUID]:
+    """
+    Generate n unique IDs at once.
+
+    Draws all random bytes in a single call, for callers that emit
+    many events together.
+    """
+    if n <= 0:
+        return []
+    ms = time.time_ns() // 1_000_000
+    raw = os.urandom(_RANDOM_BYTES * n)
+    return [
+        _uuid7_from_bytes(ms, raw[i:i + _RANDOM_BYTES])
+        for i in range(0, len(raw), _RANDOM_BYTES)
+    ]
@@ -2,17 +2,43 @@
 Time utilities for SIMA.
 """
 
+import time
 from datetime import datetime, timezone
 
+_UTC = timezone.utc
+
+# Last formatted (whole-second UTC datetime, "YYYY-MM-DDTHH:MM:SS" prefix),
+# swapped as one tuple so concurrent callers never see a mixed pair
+_last_prefix: tuple[datetime | None, str] = (None, "")
+
 
 def utc_now() -> datetime:
     """Get current UTC timestamp."""
-    return datetime.now(timezone.utc)
+    return datetime.fromtimestamp(time.time(), _UTC)
 
 
 def format_timestamp(dt: datetime) -> str:
-    """Format a datetime as ISO 8601 string."""
-    return dt.isoformat()
+    """
+    Format a datetime as ISO 8601 string.
+
+    Output matches dt.isoformat(). UTC timestamps reuse the date/time
+    prefix of the previous call when they fall in the same second.
+    """
+    global _last_prefix
+
+    if dt.tzinfo is not _UTC:
+        return dt.isoformat()
+
+    second = dt.replace(microsecond=0)
+    cached_second, prefix = _last_prefix
+    if second != cached_second:
+        prefix = second.isoformat()[:19]
+        _last_prefix = (second, prefix)
+
+    us = dt.microsecond
+    if us:
+        return f"{prefix}.{us:06d}+00:00"
+    return f"{prefix}+00:00"
 
 
 def parse_timestamp(s: str) -> datetime:
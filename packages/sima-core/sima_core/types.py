@@ -75,3 +75,10 @@ class TickType(str, Enum):
     """Types of scheduled ticks."""
     MINUTE = "minute"
     AUTONOMOUS = "autonomous"
+
+
+# Raw string values, for cheap membership checks on untrusted input
+VALID_STREAMS: frozenset[str] = frozenset(s.value for s in Stream)
+VALID_ACTORS: frozenset[str] = frozenset(a.value for a in Actor)
+VALID_EVENT_TYPES: frozenset[str] = frozenset(e.value for e in EventType)
+VALID_INPUT_TYPES: frozenset[str] = frozenset(i.value for i in InputType)
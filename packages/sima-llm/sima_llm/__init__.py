@@ -2,11 +2,12 @@
 SIMA LLM - Multi-provider LLM router with tool calling support.
 """
 
-from .router import LLMRouter, LLMResponse
+from .router import LLMRouter, LLMResponse, Message, close_provider_clients
 from .tools import (
     DATETIME_TOOL_DEFINITION,
     PRAY_TOOL_DEFINITION,
     execute_datetime_tool,
+    execute_pray_tool,
     execute_tool,
     get_tool_definition,
     get_tool_definitions,
@@ -18,9 +19,12 @@ from .tools import (
 __all__ = [
     "LLMRouter",
     "LLMResponse",
+    "Message",
+    "close_provider_clients",
     "DATETIME_TOOL_DEFINITION",
     "PRAY_TOOL_DEFINITION",
     "execute_datetime_tool",
+    "execute_pray_tool",
     "execute_tool",
     "get_tool_definition",
     "get_tool_definitions",
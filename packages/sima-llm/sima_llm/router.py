@@ -7,17 +7,58 @@ This router handles:
 - Response parsing and validation
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import json
 import logging
+import os
+import threading
+import weakref
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Awaitable, Callable
 
-from .tools import execute_tool, get_tool_definitions
+from . import tools as _tools
+from .tools import execute_tool, get_async_tool_executor, get_tool_definitions
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Worker threads for complete_sync() when called from a running loop
+_sync_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_sync_executor_lock = threading.Lock()
+
+# Provider clients shared across routers, keyed by (provider, API key hash).
+# Clients of loop-bound providers are kept per event loop, so each loop
+# keeps its own warm pool; entries go away with their loop.
+_PROVIDER_CLIENTS: dict[tuple[str, str], Any] = {}
+_LOOP_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str], Any]
+] = weakref.WeakKeyDictionary()
+_PROVIDER_CLIENTS_LOCK = threading.Lock()
+
+# Providers whose async clients hold a connection pool tied to one event loop
+_LOOP_BOUND_PROVIDERS = frozenset({"openai", "xai"})
+
+# orjson is optional; fall back to stdlib json when it isn't installed.
+# Both libraries' decode errors subclass ValueError, so callers catch that.
+_dumps: Callable[[Any], str]
+_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+
+    def _orjson_dumps(obj: Any) -> str:
+        # Non-str keys are accepted by stdlib json, keep that behaviour
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    _dumps = _orjson_dumps
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+@dataclass(slots=True)
 class LLMResponse:
     """Response from LLM completion."""
 
@@ -37,12 +78,12 @@ class LLMResponse:
     """Token usage statistics."""
 
     raw_response: Any = None
-    """Raw provider response for debugging."""
+    """Raw provider response for debugging (the final chunk when streamed)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
-    """Chat message."""
+    """Chat message (accepted as input to complete())."""
 
     role: str
     content: str | None = None
@@ -51,19 +92,302 @@ class Message:
     name: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dict for API calls."""
-        d = {"role": self.role}
-        if self.content is not None:
-            d["content"] = self.content
-        if self.tool_calls is not None:
-            d["tool_calls"] = self.tool_calls
-        if self.tool_call_id is not None:
-            d["tool_call_id"] = self.tool_call_id
-        if self.name is not None:
-            d["name"] = self.name
+        """Convert to dict for API calls, omitting unset fields."""
+        content, tool_calls = self.content, self.tool_calls
+        tool_call_id, name = self.tool_call_id, self.name
+
+        d: dict[str, Any] = {"role": self.role}
+        if content is not None:
+            d["content"] = content
+        if tool_calls is not None:
+            d["tool_calls"] = tool_calls
+        if tool_call_id is not None:
+            d["tool_call_id"] = tool_call_id
+        if name is not None:
+            d["name"] = name
         return d
 
 
+def _provider_tools(provider: str, tool_names: list[str]) -> Any:
+    """
+    Get tool definitions in the given provider's format.
+
+    Results are cached per (provider, tool names) and invalidated when a
+    tool is registered.
+    """
+    return _provider_tools_cached(provider, tuple(tool_names), _tools._registry_version)
+
+
+@functools.lru_cache(maxsize=32)
+def _provider_tools_cached(
+    provider: str,
+    tool_names: tuple[str, ...],
+    registry_version: int,
+) -> Any:
+    """Build provider-shaped tool definitions (see _provider_tools)."""
+    definitions = get_tool_definitions(list(tool_names))
+    if not definitions:
+        return None
+
+    if provider == "google":
+        return [
+            {
+                "function_declarations": [
+                    {
+                        "name": t["function"]["name"],
+                        "description": t["function"]["description"],
+                        "parameters": t["function"]["parameters"],
+                    }
+                    for t in definitions
+                ]
+            }
+        ]
+    if provider == "bedrock":
+        return {
+            "tools": [
+                {
+                    "toolSpec": {
+                        "name": t["function"]["name"],
+                        "description": t["function"]["description"],
+                        "inputSchema": {"json": t["function"]["parameters"]},
+                    }
+                }
+                for t in definitions
+            ]
+        }
+    # OpenAI-compatible providers take the definitions as-is
+    return definitions
+
+
+def _get_sync_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the shared executor complete_sync() uses inside a running loop."""
+    global _sync_executor
+    if _sync_executor is None:
+        with _sync_executor_lock:
+            if _sync_executor is None:
+                _sync_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    thread_name_prefix="sima-sync",
+                )
+    return _sync_executor
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _assistant_message(
+    content: str | None,
+    tool_calls: list[dict[str, Any]] | None,
+) -> dict[str, Any]:
+    """Build an assistant message dict for the conversation."""
+    msg: dict[str, Any] = {"role": "assistant"}
+    if content is not None:
+        msg["content"] = content
+    if tool_calls is not None:
+        msg["tool_calls"] = tool_calls
+    return msg
+
+
+def _tool_message(content: str, tool_call_id: str, name: str) -> dict[str, Any]:
+    """Build a tool result message dict for the conversation."""
+    return {
+        "role": "tool",
+        "content": content,
+        "tool_call_id": tool_call_id,
+        "name": name,
+    }
+
+
+def _openai_usage(usage: Any) -> dict[str, int]:
+    """Token usage dict from an OpenAI-compatible usage object (or None)."""
+    if usage is None:
+        return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+    }
+
+
+def _to_google_messages(
+    messages: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    Convert OpenAI-style messages to Google contents.
+
+    Returns:
+        Tuple of (contents, system instruction).
+    """
+    loads = _loads
+    contents: list[dict[str, Any]] = []
+    append = contents.append
+    system_instruction = None
+
+    for msg in messages:
+        match msg["role"]:
+            case "user":
+                append({"role": "user", "parts": [msg["content"]]})
+            case "assistant":
+                append({"role": "model", "parts": [msg.get("content", "")]})
+            case "tool":
+                append(
+                    {
+                        "role": "function",
+                        "parts": [
+                            {
+                                "function_response": {
+                                    "name": msg.get("name", ""),
+                                    "response": loads(msg.get("content", "{}")),
+                                }
+                            }
+                        ],
+                    }
+                )
+            case "system":
+                system_instruction = msg["content"]
+
+    return contents, system_instruction
+
+
+def _to_bedrock_messages(
+    messages: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Convert OpenAI-style messages to Bedrock Converse messages.
+
+    Returns:
+        Tuple of (messages, system content blocks).
+    """
+    loads = _loads
+    converted: list[dict[str, Any]] = []
+    append = converted.append
+    system_parts: list[dict[str, Any]] = []
+
+    for msg in messages:
+        match msg["role"]:
+            case "user":
+                append({"role": "user", "content": [{"text": msg["content"]}]})
+            case "assistant":
+                content = []
+                if text := msg.get("content"):
+                    content.append({"text": text})
+                for tc in msg.get("tool_calls") or ():
+                    content.append(
+                        {
+                            "toolUse": {
+                                "toolUseId": tc["id"],
+                                "name": tc["function"]["name"],
+                                "input": loads(tc["function"]["arguments"]),
+                            }
+                        }
+                    )
+                append({"role": "assistant", "content": content})
+            case "tool":
+                append(
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "toolResult": {
+                                    "toolUseId": msg.get("tool_call_id", ""),
+                                    "content": [{"json": loads(msg.get("content", "{}"))}],
+                                }
+                            }
+                        ],
+                    }
+                )
+            case "system":
+                system_parts.append({"text": msg["content"]})
+
+    return converted, system_parts
+
+
+def _create_client(provider: str, api_key: str | None) -> Any:
+    """Create a new client for the given provider."""
+    if provider == "openai":
+        try:
+            from openai import AsyncOpenAI
+
+            return AsyncOpenAI(api_key=api_key)
+        except ImportError:
+            raise ImportError("openai package required for OpenAI provider")
+    elif provider == "google":
+        try:
+            import google.generativeai as genai
+
+            genai.configure(api_key=api_key)
+            return genai
+        except ImportError:
+            raise ImportError("google-generativeai package required for Google provider")
+    elif provider == "xai":
+        try:
+            from openai import AsyncOpenAI
+
+            return AsyncOpenAI(api_key=api_key, base_url="https://api.x.ai/v1")
+        except ImportError:
+            raise ImportError("openai package required for xAI provider")
+    elif provider == "bedrock":
+        try:
+            import boto3
+
+            return boto3.client("bedrock-runtime")
+        except ImportError:
+            raise ImportError("boto3 package required for Bedrock provider")
+    else:
+        raise ValueError(f"Unknown provider: {provider}")
+
+
+def _get_client(provider: str, api_key: str | None) -> Any:
+    """
+    Get or create the shared client for a provider and API key.
+
+    Clients are shared by every LLMRouter so connection pools stay warm.
+    Keys are hashed so they are not held as dict keys in plain text.
+    Async clients are tied to the event loop they were created on, so each
+    loop gets its own; close them with close_provider_clients() before a
+    short-lived loop ends.
+    """
+    key = (provider, hashlib.sha256((api_key or "").encode()).hexdigest())
+
+    clients = _PROVIDER_CLIENTS
+    if provider in _LOOP_BOUND_PROVIDERS:
+        loop = _running_loop()
+        if loop is not None:
+            with _PROVIDER_CLIENTS_LOCK:
+                clients = _LOOP_CLIENTS.setdefault(loop, {})
+
+    client = clients.get(key)
+    if client is not None:
+        return client
+
+    with _PROVIDER_CLIENTS_LOCK:
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = _create_client(provider, api_key)
+        return client
+
+
+async def close_provider_clients() -> None:
+    """Close the async provider clients created on the running event loop."""
+    with _PROVIDER_CLIENTS_LOCK:
+        clients = _LOOP_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+async def _run_and_close_clients(coro: Awaitable[LLMResponse]) -> LLMResponse:
+    """Await coro, then close the clients it created on this loop."""
+    try:
+        return await coro
+    finally:
+        await close_provider_clients()
+
+
 class LLMRouter:
     """
     Multi-provider LLM router with tool calling support.
@@ -79,6 +403,7 @@ class LLMRouter:
         fast_model: str | None = None,
         api_keys: dict[str, str] | None = None,
         max_tool_iterations: int = 5,
+        stream_tool_calls: bool = False,
     ):
         """
         Initialize the LLM router.
@@ -90,6 +415,12 @@ class LLMRouter:
             fast_model: Model for fast/cheap completions.
             api_keys: Dict of provider -> API key.
             max_tool_iterations: Max tool call rounds before stopping.
+            stream_tool_calls: Stream OpenAI-compatible responses when tools
+                are auto-executed, so each tool call starts running as soon
+                as the model has finished emitting it. Off by default: a
+                tool started early still runs (and cannot always be
+                stopped) if the response then fails, so only enable this
+                when every offered tool is free of side effects.
         """
         self.primary_provider = primary_provider
         self.primary_model = primary_model
@@ -97,56 +428,11 @@ class LLMRouter:
         self.fast_model = fast_model or primary_model
         self.api_keys = api_keys or {}
         self.max_tool_iterations = max_tool_iterations
-
-        # Provider clients (lazy initialized)
-        self._clients: dict[str, Any] = {}
+        self.stream_tool_calls = stream_tool_calls
 
     def _get_client(self, provider: str) -> Any:
-        """Get or create a client for the given provider."""
-        if provider in self._clients:
-            return self._clients[provider]
-
-        if provider == "openai":
-            try:
-                from openai import OpenAI
-
-                client = OpenAI(api_key=self.api_keys.get("openai"))
-                self._clients[provider] = client
-                return client
-            except ImportError:
-                raise ImportError("openai package required for OpenAI provider")
-        elif provider == "google":
-            try:
-                import google.generativeai as genai
-
-                genai.configure(api_key=self.api_keys.get("google"))
-                self._clients[provider] = genai
-                return genai
-            except ImportError:
-                raise ImportError("google-generativeai package required for Google provider")
-        elif provider == "xai":
-            try:
-                from openai import OpenAI
-
-                client = OpenAI(
-                    api_key=self.api_keys.get("xai"),
-                    base_url="https://api.x.ai/v1",
-                )
-                self._clients[provider] = client
-                return client
-            except ImportError:
-                raise ImportError("openai package required for xAI provider")
-        elif provider == "bedrock":
-            try:
-                import boto3
-
-                client = boto3.client("bedrock-runtime")
-                self._clients[provider] = client
-                return client
-            except ImportError:
-                raise ImportError("boto3 package required for Bedrock provider")
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+        """Get the shared client for the given provider and this router's key."""
+        return _get_client(provider, self.api_keys.get(provider))
 
     async def complete(
         self,
@@ -178,78 +464,58 @@ class LLMRouter:
         provider = provider or self.primary_provider
         model = model or self.primary_model
 
-        # Get tool definitions
-        tool_definitions = get_tool_definitions(tools) if tools else None
+        # Get tool definitions (already in the provider's format)
+        tool_definitions = _provider_tools(provider, tools) if tools else None
 
-        # Build conversation
-        conversation = [Message(**m) if isinstance(m, dict) else m for m in messages]
+        # Build conversation (plain dicts, passed to providers as-is)
+        conversation = [m.to_dict() if isinstance(m, Message) else m for m in messages]
         all_tool_results: list[dict[str, Any]] = []
 
+        # Tool calls started while the response was still streaming, keyed
+        # by position in the response (streamed ids may be missing)
+        started: dict[int, asyncio.Task] = {}
+        on_tool_call: Callable[[int, dict[str, Any]], None] | None = None
+        if auto_execute_tools and tool_definitions and self.stream_tool_calls:
+
+            def on_tool_call(index: int, tool_call: dict[str, Any]) -> None:
+                started[index] = asyncio.create_task(self._run_tool_call(tool_call))
+
         for iteration in range(self.max_tool_iterations):
-            response = await self._call_provider(
-                provider=provider,
-                model=model,
-                messages=[m.to_dict() for m in conversation],
-                tools=tool_definitions,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                json_mode=json_mode,
-            )
+            try:
+                response = await self._call_provider(
+                    provider=provider,
+                    model=model,
+                    messages=conversation,
+                    tools=tool_definitions,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    json_mode=json_mode,
+                    on_tool_call=on_tool_call,
+                )
+            except BaseException:
+                for task in started.values():
+                    task.cancel()
+                started.clear()
+                raise
 
             # If no tool calls or we don't auto-execute, return response
             if not response.tool_calls or not auto_execute_tools:
                 response.tool_results = all_tool_results
                 return response
 
-            # Execute tool calls
-            assistant_msg = Message(
-                role="assistant",
-                content=response.content,
-                tool_calls=response.tool_calls,
-            )
-            conversation.append(assistant_msg)
-
-            for tool_call in response.tool_calls:
-                tool_name = tool_call.get("function", {}).get("name", "")
-                arguments_str = tool_call.get("function", {}).get("arguments", "{}")
-                tool_call_id = tool_call.get("id", "")
-
-                try:
-                    arguments = json.loads(arguments_str) if arguments_str else {}
-                except json.JSONDecodeError:
-                    arguments = {}
-
-                logger.info(f"Executing tool: {tool_name} with args: {arguments}")
-
-                try:
-                    result = execute_tool(tool_name, arguments)
-                    result_str = json.dumps(result)
-                    all_tool_results.append(
-                        {
-                            "tool_name": tool_name,
-                            "arguments": arguments,
-                            "result": result,
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Tool execution error: {e}")
-                    result_str = json.dumps({"error": str(e)})
-                    all_tool_results.append(
-                        {
-                            "tool_name": tool_name,
-                            "arguments": arguments,
-                            "error": str(e),
-                        }
-                    )
+            # Execute tool calls; calls from one turn are independent,
+            # so they run concurrently and are appended in call order
+            conversation.append(_assistant_message(response.content, response.tool_calls))
 
-                # Add tool result to conversation
-                tool_result_msg = Message(
-                    role="tool",
-                    content=result_str,
-                    tool_call_id=tool_call_id,
-                    name=tool_name,
+            outcomes = await asyncio.gather(
+                *(
+                    started.pop(index) if index in started else self._run_tool_call(tool_call)
+                    for index, tool_call in enumerate(response.tool_calls)
                 )
+            )
+            for tool_result_msg, tool_record in outcomes:
                 conversation.append(tool_result_msg)
+                all_tool_results.append(tool_record)
 
             # Continue to next iteration
 
@@ -257,7 +523,7 @@ class LLMRouter:
         final_response = await self._call_provider(
             provider=provider,
             model=model,
-            messages=[m.to_dict() for m in conversation],
+            messages=conversation,
             tools=None,  # No more tools for final response
             temperature=temperature,
             max_tokens=max_tokens,
@@ -266,17 +532,77 @@ class LLMRouter:
         final_response.tool_results = all_tool_results
         return final_response
 
+    async def _run_tool_call(
+        self,
+        tool_call: dict[str, Any],
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Execute a single tool call.
+
+        Uses the registered async executor for the tool if there is one,
+        otherwise runs the sync executor in a worker thread.
+
+        Returns:
+            Tuple of (tool result message, tool result record).
+        """
+        tool_name = tool_call.get("function", {}).get("name", "")
+        arguments_str = tool_call.get("function", {}).get("arguments", "{}")
+        tool_call_id = tool_call.get("id", "")
+
+        # Tool arguments are always a JSON object; anything else (empty,
+        # truncated stream output, plain text) is rejected without parsing
+        arguments: dict[str, Any] = {}
+        if arguments_str and arguments_str.lstrip()[:1] == "{":
+            try:
+                arguments = _loads(arguments_str)
+            except ValueError:
+                pass
+
+        logger.info("Executing tool: %s with args: %s", tool_name, arguments)
+
+        try:
+            async_executor = get_async_tool_executor(tool_name)
+            if async_executor is not None:
+                result = await async_executor(arguments)
+            else:
+                result = await asyncio.to_thread(execute_tool, tool_name, arguments)
+            result_str = _dumps(result)
+            record = {
+                "tool_name": tool_name,
+                "arguments": arguments,
+                "result": result,
+            }
+        except Exception as e:
+            logger.error("Tool execution error: %s", e)
+            result_str = _dumps({"error": str(e)})
+            record = {
+                "tool_name": tool_name,
+                "arguments": arguments,
+                "error": str(e),
+            }
+
+        return _tool_message(result_str, tool_call_id, tool_name), record
+
     async def _call_provider(
         self,
         provider: str,
         model: str,
         messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]] | None,
+        tools: Any,
         temperature: float,
         max_tokens: int,
         json_mode: bool,
+        on_tool_call: Callable[[int, dict[str, Any]], None] | None = None,
     ) -> LLMResponse:
-        """Call a specific provider."""
+        """
+        Call a specific provider.
+
+        tools must already be in the provider's format (see _provider_tools).
+        on_tool_call, if given, is called with each tool call's index in the
+        response and the call itself as soon as it is complete; only
+        streaming providers call it, and the last call of a response is
+        never reported early.
+        """
         if provider in ("openai", "xai"):
             return await self._call_openai_compatible(
                 provider=provider,
@@ -286,6 +612,7 @@ class LLMRouter:
                 temperature=temperature,
                 max_tokens=max_tokens,
                 json_mode=json_mode,
+                on_tool_call=on_tool_call,
             )
         elif provider == "google":
             return await self._call_google(
@@ -317,8 +644,9 @@ class LLMRouter:
         temperature: float,
         max_tokens: int,
         json_mode: bool,
+        on_tool_call: Callable[[int, dict[str, Any]], None] | None = None,
     ) -> LLMResponse:
-        """Call OpenAI-compatible API (OpenAI, xAI)."""
+        """Call OpenAI-compatible API (OpenAI, xAI), streaming if on_tool_call is set."""
         client = self._get_client(provider)
 
         kwargs: dict[str, Any] = {
@@ -335,7 +663,10 @@ class LLMRouter:
         if json_mode:
             kwargs["response_format"] = {"type": "json_object"}
 
-        response = client.chat.completions.create(**kwargs)
+        if on_tool_call is not None:
+            return await self._stream_openai_compatible(client, kwargs, on_tool_call)
+
+        response = await client.chat.completions.create(**kwargs)
         choice = response.choices[0]
 
         tool_calls = []
@@ -356,14 +687,81 @@ class LLMRouter:
             content=choice.message.content,
             tool_calls=tool_calls,
             finish_reason=choice.finish_reason or "stop",
-            usage={
-                "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-                "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-                "total_tokens": response.usage.total_tokens if response.usage else 0,
-            },
+            usage=_openai_usage(response.usage),
             raw_response=response,
         )
 
+    async def _stream_openai_compatible(
+        self,
+        client: Any,
+        kwargs: dict[str, Any],
+        on_tool_call: Callable[[int, dict[str, Any]], None],
+    ) -> LLMResponse:
+        """
+        Stream an OpenAI-compatible completion, reporting tool calls early.
+
+        Tool calls are streamed one after another by index, so a call is
+        complete once a delta for a later index arrives. It is passed to
+        on_tool_call at that point while the rest of the response streams.
+        """
+        stream = await client.chat.completions.create(
+            **kwargs,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        content_parts: list[str] = []
+        tool_calls: list[dict[str, Any]] = []
+        dispatched = 0
+        finish_reason = None
+        usage = None
+        chunk = None
+
+        async for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+
+            choice = chunk.choices[0]
+            delta = choice.delta
+            if delta.content:
+                content_parts.append(delta.content)
+
+            for tc_delta in delta.tool_calls or ():
+                index = tc_delta.index
+                while len(tool_calls) <= index:
+                    tool_calls.append(
+                        {
+                            "id": "",
+                            "type": "function",
+                            "function": {"name": "", "arguments": ""},
+                        }
+                    )
+                while dispatched < index:
+                    on_tool_call(dispatched, tool_calls[dispatched])
+                    dispatched += 1
+
+                tool_call = tool_calls[index]
+                if tc_delta.id:
+                    tool_call["id"] = tc_delta.id
+                if tc_delta.function is not None:
+                    if tc_delta.function.name:
+                        tool_call["function"]["name"] = tc_delta.function.name
+                    if tc_delta.function.arguments:
+                        tool_call["function"]["arguments"] += tc_delta.function.arguments
+
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+
+        return LLMResponse(
+            content="".join(content_parts) if content_parts else None,
+            tool_calls=tool_calls,
+            finish_reason=finish_reason or "stop",
+            usage=_openai_usage(usage),
+            raw_response=chunk,
+        )
+
     async def _call_google(
         self,
         model: str,
@@ -373,51 +771,10 @@ class LLMRouter:
         max_tokens: int,
         json_mode: bool,
     ) -> LLMResponse:
-        """Call Google Generative AI API."""
+        """Call Google Generative AI API (tools in function_declarations form)."""
         genai = self._get_client("google")
 
-        # Convert messages to Google format
-        google_messages = []
-        system_instruction = None
-
-        for msg in messages:
-            if msg["role"] == "system":
-                system_instruction = msg["content"]
-            elif msg["role"] == "user":
-                google_messages.append({"role": "user", "parts": [msg["content"]]})
-            elif msg["role"] == "assistant":
-                google_messages.append({"role": "model", "parts": [msg.get("content", "")]})
-            elif msg["role"] == "tool":
-                # Handle tool results
-                google_messages.append(
-                    {
-                        "role": "function",
-                        "parts": [
-                            {
-                                "function_response": {
-                                    "name": msg.get("name", ""),
-                                    "response": json.loads(msg.get("content", "{}")),
-                                }
-                            }
-                        ],
-                    }
-                )
-
-        # Convert tools to Google format
-        google_tools = None
-        if tools:
-            google_tools = [
-                {
-                    "function_declarations": [
-                        {
-                            "name": t["function"]["name"],
-                            "description": t["function"]["description"],
-                            "parameters": t["function"]["parameters"],
-                        }
-                        for t in tools
-                    ]
-                }
-            ]
+        google_messages, system_instruction = _to_google_messages(messages)
 
         model_instance = genai.GenerativeModel(
             model_name=model,
@@ -431,10 +788,10 @@ class LLMRouter:
         if json_mode:
             generation_config.response_mime_type = "application/json"
 
-        response = model_instance.generate_content(
+        response = await model_instance.generate_content_async(
             google_messages,
             generation_config=generation_config,
-            tools=google_tools,
+            tools=tools,
         )
 
         # Extract tool calls from response
@@ -451,7 +808,7 @@ class LLMRouter:
                             "type": "function",
                             "function": {
                                 "name": fc.name,
-                                "arguments": json.dumps(dict(fc.args)),
+                                "arguments": _dumps(dict(fc.args)),
                             },
                         }
                     )
@@ -470,69 +827,15 @@ class LLMRouter:
         self,
         model: str,
         messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]] | None,
+        tools: dict[str, Any] | None,
         temperature: float,
         max_tokens: int,
         json_mode: bool,
     ) -> LLMResponse:
-        """Call AWS Bedrock API."""
+        """Call AWS Bedrock API (tools as a toolConfig dict)."""
         client = self._get_client("bedrock")
 
-        # Convert messages to Bedrock format (Claude)
-        system_parts = []
-        bedrock_messages = []
-
-        for msg in messages:
-            if msg["role"] == "system":
-                system_parts.append({"text": msg["content"]})
-            elif msg["role"] == "user":
-                bedrock_messages.append({"role": "user", "content": [{"text": msg["content"]}]})
-            elif msg["role"] == "assistant":
-                content = []
-                if msg.get("content"):
-                    content.append({"text": msg["content"]})
-                if msg.get("tool_calls"):
-                    for tc in msg["tool_calls"]:
-                        content.append(
-                            {
-                                "toolUse": {
-                                    "toolUseId": tc["id"],
-                                    "name": tc["function"]["name"],
-                                    "input": json.loads(tc["function"]["arguments"]),
-                                }
-                            }
-                        )
-                bedrock_messages.append({"role": "assistant", "content": content})
-            elif msg["role"] == "tool":
-                bedrock_messages.append(
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "toolResult": {
-                                    "toolUseId": msg.get("tool_call_id", ""),
-                                    "content": [{"json": json.loads(msg.get("content", "{}"))}],
-                                }
-                            }
-                        ],
-                    }
-                )
-
-        # Convert tools to Bedrock format
-        tool_config = None
-        if tools:
-            tool_config = {
-                "tools": [
-                    {
-                        "toolSpec": {
-                            "name": t["function"]["name"],
-                            "description": t["function"]["description"],
-                            "inputSchema": {"json": t["function"]["parameters"]},
-                        }
-                    }
-                    for t in tools
-                ]
-            }
+        bedrock_messages, system_parts = _to_bedrock_messages(messages)
 
         request = {
             "modelId": model,
@@ -545,10 +848,11 @@ class LLMRouter:
 
         if system_parts:
             request["system"] = system_parts
-        if tool_config:
-            request["toolConfig"] = tool_config
+        if tools:
+            request["toolConfig"] = tools
 
-        response = client.converse(**request)
+        # boto3 is blocking, keep it off the event loop
+        response = await asyncio.to_thread(client.converse, **request)
 
         # Parse response
         tool_calls = []
@@ -565,7 +869,7 @@ class LLMRouter:
                         "type": "function",
                         "function": {
                             "name": tu["name"],
-                            "arguments": json.dumps(tu["input"]),
+                            "arguments": _dumps(tu["input"]),
                         },
                     }
                 )
@@ -600,42 +904,23 @@ class LLMRouter:
 
         See complete() for parameter documentation.
         """
-        import asyncio
-
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop is None:
-            return asyncio.run(
-                self.complete(
-                    messages=messages,
-                    tools=tools,
-                    provider=provider,
-                    model=model,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    json_mode=json_mode,
-                    auto_execute_tools=auto_execute_tools,
-                )
+        # The call runs on a throwaway loop; its clients are closed with it
+        coro = _run_and_close_clients(
+            self.complete(
+                messages=messages,
+                tools=tools,
+                provider=provider,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                json_mode=json_mode,
+                auto_execute_tools=auto_execute_tools,
             )
-        else:
-            # Running in async context, use thread
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    self.complete(
-                        messages=messages,
-                        tools=tools,
-                        provider=provider,
-                        model=model,
-                        temperature=temperature,
-                        max_tokens=max_tokens,
-                        json_mode=json_mode,
-                        auto_execute_tools=auto_execute_tools,
-                    ),
-                )
-                return future.result()
+        )
+
+        if _running_loop() is None:
+            return asyncio.run(coro)
+
+        # Running in async context, use the shared worker threads
+        future = _get_sync_executor().submit(asyncio.run, coro)
+        return future.result()
@@ -5,8 +5,10 @@ This module provides callable tools that LLM modules can invoke during generatio
 Tools are defined in OpenAI function calling format for compatibility across providers.
 """
 
-from datetime import datetime
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from typing import Any, Callable
+import time
 import zoneinfo
 import logging
 
@@ -18,6 +20,14 @@ TOOL_REGISTRY: dict[str, dict[str, Any]] = {}
 # Async tool executors (for tools that need async, like Telegram)
 ASYNC_TOOL_EXECUTORS: dict[str, Callable] = {}
 
+# Bumped on every register_tool() so cached definitions can be invalidated
+_registry_version = 0
+
+# Timezone name -> (UTC minute, fixed offset in effect during that minute).
+# Offset changes happen on whole minutes, so within one minute the zone's
+# transition table does not need to be consulted again.
+_OFFSET_CACHE: dict[str, tuple[int, timezone]] = {}
+
 
 PRAY_TOOL_DEFINITION = {
     "type": "function",
@@ -77,6 +87,68 @@ DATETIME_TOOL_DEFINITION = {
 }
 
 
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_WEEKDAYS_SHORT = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def _format_utc_offset(now: datetime) -> str:
+    """Format the UTC offset of an aware datetime like strftime("%z")."""
+    offset = now.utcoffset()
+    assert offset is not None, "datetime must be timezone-aware"
+    total = int(offset.total_seconds())
+    sign = "+" if total >= 0 else "-"
+    minutes, seconds = divmod(abs(total), 60)
+    hours, minutes = divmod(minutes, 60)
+    if seconds:
+        return f"{sign}{hours:02d}{minutes:02d}{seconds:02d}"
+    return f"{sign}{hours:02d}{minutes:02d}"
+
+
+def _local_now(tz: zoneinfo.ZoneInfo, timezone_str: str) -> tuple[float, datetime]:
+    """
+    Current time in tz, reusing the zone's UTC offset within a minute.
+
+    Returns:
+        Tuple of (POSIX timestamp, aware datetime for that instant).
+    """
+    t = time.time()
+    minute = int(t // 60)
+    cached = _OFFSET_CACHE.get(timezone_str)
+    if cached is not None and cached[0] == minute:
+        return t, datetime.fromtimestamp(t, cached[1])
+
+    now = datetime.fromtimestamp(t, tz)
+    offset = now.utcoffset()
+    assert offset is not None, "datetime must be timezone-aware"
+    _OFFSET_CACHE[timezone_str] = (minute, timezone(offset))
+    return t, now
+
+
+@lru_cache(maxsize=1)
+def _valid_timezones() -> frozenset[str]:
+    """All IANA timezone names on this system (scanned once, on first use)."""
+    return frozenset(zoneinfo.available_timezones())
+
+
+@lru_cache(maxsize=128)
+def _get_zoneinfo(timezone_str: str) -> tuple[zoneinfo.ZoneInfo, str]:
+    """
+    Resolve a timezone name, falling back to UTC if it is unknown.
+
+    Unknown names are rejected by a set lookup rather than a failed
+    search of the tz database.
+
+    Returns:
+        Tuple of (timezone, name actually used).
+    """
+    if timezone_str in _valid_timezones():
+        try:
+            return zoneinfo.ZoneInfo(timezone_str), timezone_str
+        except (KeyError, zoneinfo.ZoneInfoNotFoundError):
+            pass
+    return zoneinfo.ZoneInfo("UTC"), "UTC"
+
+
 def execute_datetime_tool(arguments: dict[str, Any] | None = None) -> dict[str, Any]:
     """
     Execute the get_current_datetime tool.
@@ -91,59 +163,60 @@ def execute_datetime_tool(arguments: dict[str, Any] | None = None) -> dict[str,
     timezone_str = arguments.get("timezone", "UTC")
     output_format = arguments.get("format", "full")
 
-    try:
-        tz = zoneinfo.ZoneInfo(timezone_str)
-    except (KeyError, zoneinfo.ZoneInfoNotFoundError):
-        tz = zoneinfo.ZoneInfo("UTC")
-        timezone_str = "UTC"
+    tz, timezone_str = _get_zoneinfo(timezone_str)
 
-    now = datetime.now(tz)
-
-    # Build full result
-    full_result = {
-        "datetime_iso": now.isoformat(),
-        "date": now.strftime("%Y-%m-%d"),
-        "time": now.strftime("%H:%M:%S"),
-        "day_of_week": now.strftime("%A"),
-        "day_of_week_short": now.strftime("%a"),
-        "hour": now.hour,
-        "minute": now.minute,
-        "second": now.second,
-        "timezone": timezone_str,
-        "timezone_offset": now.strftime("%z"),
-        "unix_timestamp": int(now.timestamp()),
-        "is_weekend": now.weekday() >= 5,
-        "week_number": now.isocalendar()[1],
-        "day_of_year": now.timetuple().tm_yday,
-    }
+    t, now = _local_now(tz, timezone_str)
 
-    # Return based on format
-    if output_format == "date_only":
+    # Only compute the fields the requested format returns
+    if output_format == "iso":
         return {
-            "date": full_result["date"],
-            "day_of_week": full_result["day_of_week"],
-            "is_weekend": full_result["is_weekend"],
-            "week_number": full_result["week_number"],
-            "day_of_year": full_result["day_of_year"],
-            "timezone": full_result["timezone"],
+            "datetime_iso": now.isoformat(),
+            "unix_timestamp": int(t),
+            "timezone": timezone_str,
         }
-    elif output_format == "time_only":
+
+    if output_format == "time_only":
         return {
-            "time": full_result["time"],
-            "hour": full_result["hour"],
-            "minute": full_result["minute"],
-            "second": full_result["second"],
-            "timezone": full_result["timezone"],
-            "timezone_offset": full_result["timezone_offset"],
+            "time": f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}",
+            "hour": now.hour,
+            "minute": now.minute,
+            "second": now.second,
+            "timezone": timezone_str,
+            "timezone_offset": _format_utc_offset(now),
         }
-    elif output_format == "iso":
+
+    weekday = now.weekday()
+    date_str = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+    week_number = now.isocalendar().week
+    day_of_year = now.toordinal() - date(now.year, 1, 1).toordinal() + 1
+
+    if output_format == "date_only":
         return {
-            "datetime_iso": full_result["datetime_iso"],
-            "unix_timestamp": full_result["unix_timestamp"],
-            "timezone": full_result["timezone"],
+            "date": date_str,
+            "day_of_week": _WEEKDAYS[weekday],
+            "is_weekend": weekday >= 5,
+            "week_number": week_number,
+            "day_of_year": day_of_year,
+            "timezone": timezone_str,
         }
-    else:  # full
-        return full_result
+
+    # full (English day names regardless of process locale)
+    return {
+        "datetime_iso": now.isoformat(),
+        "date": date_str,
+        "time": f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}",
+        "day_of_week": _WEEKDAYS[weekday],
+        "day_of_week_short": _WEEKDAYS_SHORT[weekday],
+        "hour": now.hour,
+        "minute": now.minute,
+        "second": now.second,
+        "timezone": timezone_str,
+        "timezone_offset": _format_utc_offset(now),
+        "unix_timestamp": int(t),
+        "is_weekend": weekday >= 5,
+        "week_number": week_number,
+        "day_of_year": day_of_year,
+    }
 
 
 def execute_pray_tool(arguments: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -156,15 +229,6 @@ def execute_pray_tool(arguments: dict[str, Any] | None = None) -> dict[str, Any]
     arguments = arguments or {}
     message = arguments.get("message", "")
 
-    # Check if an async executor was registered
-    if "pray" in ASYNC_TOOL_EXECUTORS:
-        # Return a marker that async execution is needed
-        return {
-            "status": "async_pending",
-            "message": message,
-            "note": "Message will be sent via async executor",
-        }
-
     logger.warning("pray tool called but no Telegram executor registered")
     return {
         "status": "not_configured",
@@ -180,6 +244,15 @@ TOOL_EXECUTORS: dict[str, Callable] = {
 }
 
 
+# Built-in definitions take precedence over registered tools of the same name
+_BUILTIN_TOOL_DEFINITIONS: dict[str, dict[str, Any]] = {
+    "get_current_datetime": DATETIME_TOOL_DEFINITION,
+    "pray": PRAY_TOOL_DEFINITION,
+}
+
+_EMPTY_ENTRY: dict[str, Any] = {}
+
+
 def get_tool_definition(tool_name: str) -> dict[str, Any] | None:
     """
     Get the tool definition for a given tool name.
@@ -190,13 +263,10 @@ def get_tool_definition(tool_name: str) -> dict[str, Any] | None:
     Returns:
         Tool definition dict in OpenAI function calling format, or None if not found.
     """
-    builtin_tools = {
-        "get_current_datetime": DATETIME_TOOL_DEFINITION,
-        "pray": PRAY_TOOL_DEFINITION,
-    }
-    if tool_name in builtin_tools:
-        return builtin_tools[tool_name]
-    return TOOL_REGISTRY.get(tool_name, {}).get("definition")
+    definition = _BUILTIN_TOOL_DEFINITIONS.get(tool_name)
+    if definition is not None:
+        return definition
+    return TOOL_REGISTRY.get(tool_name, _EMPTY_ENTRY).get("definition")
 
 
 def get_tool_definitions(tool_names: list[str]) -> list[dict[str, Any]]:
@@ -209,12 +279,8 @@ def get_tool_definitions(tool_names: list[str]) -> list[dict[str, Any]]:
     Returns:
         List of tool definition dicts.
     """
-    definitions = []
-    for name in tool_names:
-        defn = get_tool_definition(name)
-        if defn:
-            definitions.append(defn)
-    return definitions
+    get = get_tool_definition
+    return [defn for name in tool_names if (defn := get(name))]
 
 
 def execute_tool(tool_name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -250,8 +316,10 @@ def register_tool(
         definition: Tool definition in OpenAI function calling format.
         executor: Callable that executes the tool.
     """
+    global _registry_version
     TOOL_REGISTRY[name] = {"definition": definition}
     TOOL_EXECUTORS[name] = executor
+    _registry_version += 1
 
 
 def register_async_tool_executor(name: str, executor: Callable) -> None:
@@ -259,14 +327,14 @@ def register_async_tool_executor(name: str, executor: Callable) -> None:
     Register an async executor for a tool.
 
     This is used for tools that need async execution (e.g., Telegram API calls).
-    The async executor will be called by The Brain after the LLM returns.
+    When registered, LLMRouter awaits it in place of the sync executor.
 
     Args:
         name: Tool name.
         executor: Async callable that executes the tool.
     """
     ASYNC_TOOL_EXECUTORS[name] = executor
-    logger.info(f"Registered async executor for tool: {name}")
+    logger.info("Registered async executor for tool: %s", name)
 
 
 def get_async_tool_executor(name: str) -> Callable | None:
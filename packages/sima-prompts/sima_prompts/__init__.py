@@ -3,10 +3,11 @@ SIMA Prompts - Prompt registry and renderer.
 """
 
 from .registry import PromptRegistry, PromptConfig
-from .renderer import render_prompt
+from .renderer import clear_render_cache, render_prompt
 
 __all__ = [
     "PromptRegistry",
     "PromptConfig",
     "render_prompt",
+    "clear_render_cache",
 ]
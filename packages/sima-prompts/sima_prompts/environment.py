@@ -0,0 +1,104 @@
+"""
+Shared Jinja2 environment for prompt templates.
+
+Templates are loaded through the environment's loader rather than
+from_string(), so identical sources share one compiled Template in
+memory and their compiled code is kept in Jinja's on-disk bytecode
+cache across restarts. Set SIMA_JINJA_CACHE_DIR to choose the cache
+directory (defaults to a per-user directory under the system temp dir).
+"""
+
+import hashlib
+import logging
+import os
+import threading
+
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    StrictUndefined,
+    Template,
+    TemplateNotFound,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _SourceLoader(BaseLoader):
+    """Serves sources handed over by compile_template(), keyed by their hash."""
+
+    def __init__(self):
+        self.sources: dict[str, str] = {}
+
+    def get_source(self, environment, template):
+        try:
+            source = self.sources[template]
+        except KeyError:
+            raise TemplateNotFound(template)
+        # Names are content hashes, so a cached template never goes stale
+        return source, None, lambda: True
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    """Create the on-disk bytecode cache, or None if it cannot be used."""
+    try:
+        return FileSystemBytecodeCache(directory=os.getenv("SIMA_JINJA_CACHE_DIR"))
+    except (OSError, RuntimeError) as e:
+        logger.warning("Jinja bytecode cache disabled: %s", e)
+        return None
+
+
+_loader = _SourceLoader()
+_loader_lock = threading.Lock()
+
+# Create Jinja2 environment
+env = Environment(
+    loader=_loader,
+    undefined=StrictUndefined,
+    autoescape=False,
+    bytecode_cache=_bytecode_cache(),
+)
+
+_SYNTAX_MARKERS = ("{{", "{%", "{#")
+
+
+def has_template_syntax(content: str) -> bool:
+    """Check whether content contains any Jinja2 expressions, tags or comments."""
+    return any(marker in content for marker in _SYNTAX_MARKERS)
+
+
+def _load_template(content: str) -> Template:
+    """Compile content via the loader (memory cache, then bytecode cache)."""
+    name = hashlib.sha1(content.encode("utf-8")).hexdigest()
+    with _loader_lock:
+        _loader.sources[name] = content
+        try:
+            return env.get_template(name)
+        finally:
+            del _loader.sources[name]
+
+
+def compile_template(content: str) -> Template | str:
+    """
+    Compile a message template.
+
+    Content without any Jinja2 syntax is rendered once here and returned
+    as a string, so rendering it later costs nothing.
+
+    Args:
+        content: Template source.
+
+    Returns:
+        Compiled template, or a string to use verbatim: the pre-rendered
+        text of a static message, or the raw content of a template that
+        cannot be compiled.
+    """
+    try:
+        template = _load_template(content)
+        if not has_template_syntax(content):
+            # Still rendered so newline handling matches templated messages
+            return template.render()
+        return template
+    except Exception:
+        return content
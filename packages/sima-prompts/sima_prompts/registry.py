@@ -15,6 +15,15 @@ from pathlib import Path
 from typing import Any
 
 import yaml
+from jinja2 import Template
+
+from .environment import compile_template
+
+# libyaml's C loader is much faster; fall back to pure Python without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 @dataclass
@@ -42,6 +51,25 @@ class PromptConfig:
     source_path: Path | None = None
     """Path to the source YAML file."""
 
+    # Parallel to messages and rebuilt whenever messages is assigned, so
+    # rendering never re-reads the message dicts or recompiles. Replace
+    # messages instead of editing it in place.
+    roles: list[str] = field(init=False, repr=False, compare=False)
+    """Role of each message."""
+
+    contents: list[str] = field(init=False, repr=False, compare=False)
+    """Raw content of each message."""
+
+    templates: list[Template | str] = field(init=False, repr=False, compare=False)
+    """Compiled template per message, or a string to use verbatim (see compile_template)."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "messages":
+            super().__setattr__("roles", [msg["role"] for msg in value])
+            super().__setattr__("contents", [msg["content"] for msg in value])
+            super().__setattr__("templates", [compile_template(msg["content"]) for msg in value])
+
 
 class PromptRegistry:
     """
@@ -66,6 +94,9 @@ class PromptRegistry:
 
         self.prompts_dir = Path(prompts_dir)
         self._cache: dict[str, PromptConfig] = {}
+        # list_modules() result and the directory mtime it was read at
+        self._modules_cache: list[str] = []
+        self._modules_mtime_ns: int | None = None
 
     def load(self, module_name: str) -> PromptConfig:
         """
@@ -103,8 +134,8 @@ class PromptRegistry:
                 f"in {self.prompts_dir}"
             )
 
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
+        with open(yaml_path, "rb") as f:
+            raw = yaml.load(f, Loader=_YamlLoader)
 
         if not isinstance(raw, dict):
             raise ValueError(f"Invalid prompt YAML in {yaml_path}: expected dict")
@@ -141,7 +172,6 @@ class PromptRegistry:
             raw_yaml=raw,
             source_path=yaml_path,
         )
-
         self._cache[module_name] = config
         return config
 
@@ -175,18 +205,27 @@ class PromptRegistry:
         """
         List all available module names in the prompts directory.
 
+        The listing is cached until the directory's mtime changes.
+
         Returns:
             List of module names.
         """
-        modules = []
-        if not self.prompts_dir.exists():
-            return modules
-
-        for path in self.prompts_dir.iterdir():
-            if path.suffix in (".yaml", ".yml"):
-                modules.append(path.stem)
-
-        return sorted(modules)
+        try:
+            mtime_ns = os.stat(self.prompts_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        if mtime_ns != self._modules_mtime_ns:
+            modules = []
+            with os.scandir(self.prompts_dir) as entries:
+                for entry in entries:
+                    stem, suffix = os.path.splitext(entry.name)
+                    if suffix in (".yaml", ".yml"):
+                        modules.append(stem)
+            self._modules_cache = sorted(modules)
+            self._modules_mtime_ns = mtime_ns
+
+        return list(self._modules_cache)
 
     def reload(self, module_name: str | None = None) -> None:
         """
@@ -2,19 +2,73 @@
 Prompt Renderer - Render prompt templates with Jinja2.
 """
 
+import threading
+from collections import OrderedDict
 from typing import Any
 
-from jinja2 import Environment, BaseLoader, StrictUndefined
+from jinja2 import Template
 
+from .environment import compile_template
 from .registry import PromptConfig
 
 
-# Create Jinja2 environment
-_env = Environment(
-    loader=BaseLoader(),
-    undefined=StrictUndefined,
-    autoescape=False,
-)
+# Max rendered prompts kept by render_prompt()
+RENDER_CACHE_SIZE = 256
+
+# (id(config), frozen variables) -> (config, templates rendered from, result),
+# in LRU order
+_render_cache: OrderedDict[
+    tuple[int, Any],
+    tuple[PromptConfig, list[Template | str], list[dict[str, str]]],
+] = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+
+class _Uncacheable(Exception):
+    """Raised when variables contain values that cannot be keyed safely."""
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert plain data into a hashable key that renders identically.
+
+    Only str, numbers, bool, None, lists, tuples and dicts are accepted.
+    Types are kept in the key because Jinja renders 1, 1.0, True and
+    [1] vs (1,) differently, and dict order is kept because loops see it.
+
+    Raises:
+        _Uncacheable: For any other value type.
+    """
+    cls = type(value)
+    if cls is str or value is None:
+        return value
+    if cls is float:
+        # repr keeps 0.0 and -0.0 apart (they compare equal) and makes nan match itself
+        return (float, repr(value))
+    if cls is int or cls is bool:
+        return (cls, value)
+    if cls is dict:
+        return (dict, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if cls is list or cls is tuple:
+        return (cls, tuple(_freeze(v) for v in value))
+    raise _Uncacheable(cls.__name__)
+
+
+def clear_render_cache() -> None:
+    """Drop all memoized render_prompt() results."""
+    with _render_cache_lock:
+        _render_cache.clear()
+
+
+def _render_template(template: Template | str, content: str, variables: dict[str, Any]) -> str:
+    """Render a compiled template, falling back to the raw content on failure."""
+    if isinstance(template, str):
+        return template
+    try:
+        return template.render(**variables)
+    except Exception:
+        # If template fails, return content as-is
+        return content
 
 
 def render_prompt(
@@ -30,6 +84,10 @@ def render_prompt(
     - Conditionals: {% if senses %}...{% endif %}
     - Loops: {% for item in items %}...{% endfor %}
 
+    Results are memoized per config for variables made only of plain data
+    (see _freeze); other variables are rendered every time. A memoized
+    result is dropped once config.messages is reassigned.
+
     Args:
         config: PromptConfig loaded from registry.
         variables: Dict of variable name -> value for substitution.
@@ -37,26 +95,35 @@ def render_prompt(
     Returns:
         List of rendered messages with 'role' and 'content'.
     """
-    rendered = []
-
-    for msg in config.messages:
-        role = msg["role"]
-        content = msg["content"]
-
-        # Render with Jinja2
-        try:
-            template = _env.from_string(content)
-            rendered_content = template.render(**variables)
-        except Exception:
-            # If template fails, return content as-is
-            rendered_content = content
-
-        rendered.append({
+    try:
+        key = (id(config), _freeze(variables))
+    except _Uncacheable:
+        return _render(config, variables)
+
+    templates = config.templates
+    with _render_cache_lock:
+        cached = _render_cache.get(key)
+        if cached is not None and cached[0] is config and cached[1] is templates:
+            _render_cache.move_to_end(key)
+            return [dict(msg) for msg in cached[2]]
+
+    rendered = _render(config, variables)
+    with _render_cache_lock:
+        _render_cache[key] = (config, templates, rendered)
+        if len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+    return [dict(msg) for msg in rendered]
+
+
+def _render(config: PromptConfig, variables: dict[str, Any]) -> list[dict[str, str]]:
+    """Render every message of a config."""
+    return [
+        {
             "role": role,
-            "content": rendered_content,
-        })
-
-    return rendered
+            "content": _render_template(template, content, variables),
+        }
+        for role, content, template in zip(config.roles, config.contents, config.templates)
+    ]
 
 
 def render_messages(
@@ -73,16 +140,12 @@ def render_messages(
     Returns:
         List of rendered messages.
     """
-    rendered = []
-    for msg in messages:
-        try:
-            template = _env.from_string(msg["content"])
-            rendered_content = template.render(**variables)
-        except Exception:
-            rendered_content = msg["content"]
-
-        rendered.append({
+    return [
+        {
             "role": msg["role"],
-            "content": rendered_content,
-        })
-    return rendered
+            "content": _render_template(
+                compile_template(msg["content"]), msg["content"], variables
+            ),
+        }
+        for msg in messages
+    ]
@@ -2,7 +2,14 @@
 SIMA Storage - Database models, migrations, and S3 helpers.
 """
 
-from .database import get_engine, get_session, init_db
+from .access import MemoryAccessBuffer
+from .database import (
+    copy_records_to_table,
+    get_engine,
+    get_readonly_session,
+    get_session,
+    init_db,
+)
 from .models import EventModel, TraceModel, MemoryModel
 from .repository import EventRepository, TraceRepository, MemoryRepository
 
@@ -10,7 +17,9 @@ __all__ = [
     # Database
     "get_engine",
     "get_session",
+    "get_readonly_session",
     "init_db",
+    "copy_records_to_table",
     # Models
     "EventModel",
     "TraceModel",
@@ -19,4 +28,6 @@ __all__ = [
     "EventRepository",
     "TraceRepository",
     "MemoryRepository",
+    # Access tracking
+    "MemoryAccessBuffer",
 ]
@@ -0,0 +1,98 @@
+"""
+Buffered memory access tracking for SIMA.
+
+Reading a memory bumps its access_count and last_accessed_at. Writing that
+on every read turns each read into an UPDATE (a new row version, WAL and
+vacuum work), so accesses are counted in process and written together
+with MemoryRepository.record_accesses once enough have piled up or the
+oldest has waited long enough.
+
+Counts still buffered when a process exits are lost, so access_count is
+approximate.
+"""
+
+import os
+import time
+from collections import Counter
+from datetime import datetime
+from uuid import UUID
+
+from sima_core.time import utc_now
+
+DEFAULT_FLUSH_EVERY = int(os.getenv("SIMA_ACCESS_FLUSH_EVERY", "64"))
+DEFAULT_FLUSH_SECONDS = float(os.getenv("SIMA_ACCESS_FLUSH_SECONDS", "30"))
+
+# Pending accesses per memory: (access count, latest access time)
+AccessBatch = dict[UUID, tuple[int, datetime]]
+
+
+class MemoryAccessBuffer:
+    """
+    Accumulates memory accesses until a batched write is due.
+
+    Usage:
+        buffer.record(memory_id)
+        if buffer.due:
+            await repo.record_accesses(buffer.drain())
+
+    There is no background task: callers check due after recording, so the
+    buffer also works where the process may be frozen between requests.
+    """
+
+    def __init__(
+        self,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            flush_every: Number of buffered accesses that makes a flush due.
+            flush_seconds: Max time the oldest buffered access waits.
+        """
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+
+        self._counts: Counter[UUID] = Counter()
+        self._last_accessed: dict[UUID, datetime] = {}
+        self._total = 0
+        self._first_at: float | None = None
+
+    def record(self, memory_id: UUID) -> None:
+        """Count one access to a memory."""
+        if self._first_at is None:
+            self._first_at = time.monotonic()
+        self._counts[memory_id] += 1
+        self._last_accessed[memory_id] = utc_now()
+        self._total += 1
+
+    @property
+    def pending(self) -> int:
+        """Number of accesses buffered but not yet drained."""
+        return self._total
+
+    @property
+    def due(self) -> bool:
+        """Whether the buffered accesses should be written now."""
+        if self._first_at is None:
+            return False
+        return (
+            self._total >= self.flush_every
+            or time.monotonic() - self._first_at >= self.flush_seconds
+        )
+
+    def drain(self) -> AccessBatch:
+        """Take every buffered access and reset the buffer."""
+        batch = {
+            memory_id: (count, self._last_accessed[memory_id])
+            for memory_id, count in self._counts.items()
+        }
+        self._counts.clear()
+        self._last_accessed.clear()
+        self._total = 0
+        self._first_at = None
+        return batch
@@ -4,7 +4,7 @@ Async SQLAlchemy database engine and session management.
 
 import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Iterable, Sequence
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
@@ -14,7 +14,17 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+# Pool sized for concurrent event writes from the brain and API; override per
+# deployment with DATABASE_POOL_SIZE / DATABASE_MAX_OVERFLOW
+POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "20"))
+MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "30"))
+POOL_RECYCLE_SECONDS = 1800
+
+# Prepared statements kept per asyncpg connection (SQLAlchemy's default is 100)
+PREPARED_STATEMENT_CACHE_SIZE = 1024
+
 _engine: AsyncEngine | None = None
+_readonly_engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
@@ -30,16 +40,37 @@ def get_engine() -> AsyncEngine:
     """Get or create the async database engine."""
     global _engine
     if _engine is None:
+        url = get_database_url()
+        connect_args = {}
+        if url.startswith("postgresql+asyncpg://"):
+            connect_args = {
+                "prepared_statement_cache_size": PREPARED_STATEMENT_CACHE_SIZE,
+                "server_settings": {
+                    # Our queries are short; JIT compile time would dominate
+                    "jit": "off",
+                    "application_name": "sima",
+                },
+            }
         _engine = create_async_engine(
-            get_database_url(),
+            url,
             echo=os.getenv("DATABASE_ECHO", "false").lower() == "true",
-            pool_size=5,
-            max_overflow=10,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_recycle=POOL_RECYCLE_SECONDS,
             pool_pre_ping=True,
+            connect_args=connect_args,
         )
     return _engine
 
 
+def get_readonly_engine() -> AsyncEngine:
+    """Get the autocommit view of the engine (shares its connection pool)."""
+    global _readonly_engine
+    if _readonly_engine is None:
+        _readonly_engine = get_engine().execution_options(isolation_level="AUTOCOMMIT")
+    return _readonly_engine
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get or create the session factory."""
     global _session_factory
@@ -65,6 +96,55 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+@asynccontextmanager
+async def get_readonly_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager for sessions that only read.
+
+    Statements run in autocommit mode, so there is no BEGIN or COMMIT
+    round-trip around them. Each statement sees its own snapshot, and
+    nothing written through the session is committed.
+    """
+    factory = get_session_factory()
+    async with factory(bind=get_readonly_engine()) as session:
+        yield session
+
+
+async def copy_records_to_table(
+    session: AsyncSession,
+    table_name: str,
+    records: Iterable[Sequence[Any]],
+    columns: Sequence[str],
+) -> None:
+    """
+    Bulk-load rows with PostgreSQL COPY inside the session's transaction.
+
+    Uses asyncpg's binary COPY protocol, which streams all rows in one
+    round-trip instead of one INSERT per row. Values must already be in
+    the driver's native types (UUID, datetime, str for enum labels, ...);
+    ORM defaults and events do not run. Requires an asyncpg engine.
+
+    Args:
+        session: Session whose connection and transaction to use.
+        table_name: Target table.
+        records: Row tuples, in the order of columns.
+        columns: Column names to load.
+
+    Raises:
+        RuntimeError: If the session's connection has no driver connection.
+    """
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    if driver is None:
+        raise RuntimeError("Session connection has no driver connection for COPY")
+    if not driver.is_in_transaction():
+        # The driver opens its transaction lazily on the first statement;
+        # start it now so the COPY commits or rolls back with the session
+        await conn.execute(text("SELECT 1"))
+    await driver.copy_records_to_table(table_name, records=records, columns=columns)
+
+
 async def init_db() -> None:
     """Initialize database connection pool."""
     engine = get_engine()
@@ -75,8 +155,9 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     """Close database connection pool."""
-    global _engine, _session_factory
+    global _engine, _readonly_engine, _session_factory
     if _engine is not None:
         await _engine.dispose()
         _engine = None
+        _readonly_engine = None
         _session_factory = None
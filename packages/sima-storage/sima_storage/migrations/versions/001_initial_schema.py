@@ -17,20 +17,49 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Enum types, defined once and shared by the columns that use them.
+# create_type=False: they are created explicitly in upgrade(), not per column.
+input_type_enum = postgresql.ENUM(
+    "user_message", "minute_tick", "autonomous_tick",
+    name="input_type_enum",
+    create_type=False,
+)
+stream_enum = postgresql.ENUM(
+    "external", "conscious", "subconscious", "sleep",
+    name="stream_enum",
+    create_type=False,
+)
+actor_enum = postgresql.ENUM(
+    "telegram_in", "perception", "memory", "planner", "critic",
+    "attention_gate", "workspace", "metacog", "ast", "speaker",
+    "monologue", "sleep", "telegram_out", "system",
+    name="actor_enum",
+    create_type=False,
+)
+event_type_enum = postgresql.ENUM(
+    "message_in", "tick", "percept", "candidate", "selection",
+    "workspace_update", "broadcast", "metacog_report", "belief_revision",
+    "attention_prediction", "attention_comparison", "monologue",
+    "message_out", "sleep_start", "sleep_digest", "memory_consolidation",
+    "sleep_end", "error", "pause", "resume",
+    name="event_type_enum",
+    create_type=False,
+)
+
 
 def upgrade() -> None:
     # Note: ParadeDB pg_search extension not available on standard RDS
     # BM25 indexes skipped - can add later if ParadeDB becomes available
 
+    bind = op.get_bind()
+    for enum in (input_type_enum, stream_enum, actor_enum, event_type_enum):
+        enum.create(bind, checkfirst=True)
+
     # Create traces table
     op.create_table(
         "traces",
         sa.Column("trace_id", postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column(
-            "input_type",
-            sa.Enum("user_message", "minute_tick", "autonomous_tick", name="input_type_enum", create_type=False),
-            nullable=False,
-        ),
+        sa.Column("input_type", input_type_enum, nullable=False),
         sa.Column("started_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
         sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("telegram_chat_id", sa.Integer(), nullable=True),
@@ -50,35 +79,9 @@ def upgrade() -> None:
         sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("trace_id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("ts", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
-        sa.Column(
-            "actor",
-            sa.Enum(
-                "telegram_in", "perception", "memory", "planner", "critic",
-                "attention_gate", "workspace", "metacog", "ast", "speaker",
-                "monologue", "sleep", "telegram_out", "system",
-                name="actor_enum",
-                create_type=False,
-            ),
-            nullable=False,
-        ),
-        sa.Column(
-            "stream",
-            sa.Enum("external", "conscious", "subconscious", "sleep", name="stream_enum", create_type=False),
-            nullable=False,
-        ),
-        sa.Column(
-            "event_type",
-            sa.Enum(
-                "message_in", "tick", "percept", "candidate", "selection",
-                "workspace_update", "broadcast", "metacog_report", "belief_revision",
-                "attention_prediction", "attention_comparison", "monologue",
-                "message_out", "sleep_start", "sleep_digest", "memory_consolidation",
-                "sleep_end", "error", "pause", "resume",
-                name="event_type_enum",
-                create_type=False,
-            ),
-            nullable=False,
-        ),
+        sa.Column("actor", actor_enum, nullable=False),
+        sa.Column("stream", stream_enum, nullable=False),
+        sa.Column("event_type", event_type_enum, nullable=False),
         sa.Column("content_text", sa.Text(), nullable=True),
         sa.Column("content_json", postgresql.JSONB(), nullable=True),
         sa.Column("model_provider", sa.String(50), nullable=True),
@@ -0,0 +1,36 @@
+"""Composite event indexes for trace replay and per-stream listing.
+
+Replaces the single-column trace_id and stream indexes with (trace_id, ts)
+and (stream, ts), matching list_by_trace (WHERE trace_id ORDER BY ts) and
+list_recent filtered by stream (ORDER BY ts DESC). The leading column still
+serves plain equality lookups, so the old indexes are redundant. ix_events_ts
+stays for unfiltered list_recent, which needs ORDER BY ts DESC LIMIT n.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_trace_id_ts", "events", ["trace_id", "ts"])
+    op.create_index("ix_events_stream_ts", "events", ["stream", "ts"])
+    op.drop_index("ix_events_trace_id", table_name="events")
+    op.drop_index("ix_events_stream", table_name="events")
+
+
+def downgrade() -> None:
+    op.create_index("ix_events_trace_id", "events", ["trace_id"])
+    op.create_index("ix_events_stream", "events", ["stream"])
+    op.drop_index("ix_events_stream_ts", table_name="events")
+    op.drop_index("ix_events_trace_id_ts", table_name="events")
@@ -0,0 +1,27 @@
+"""GIN index on events.tags for tag containment lookups.
+
+Serves EventRepository.list_by_tag (WHERE tags @> ARRAY[...]), which would
+otherwise scan the whole events table.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_tags", "events", ["tags"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_tags", table_name="events")
@@ -0,0 +1,35 @@
+"""Cover per-trace token and cost totals in the (trace_id, ts) index.
+
+Rebuilds ix_events_trace_id_ts with INCLUDE (tokens_in, tokens_out,
+cost_usd) so EventRepository.get_trace_stats can be answered by an
+index-only scan instead of a heap fetch per event.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_events_trace_id_ts", table_name="events")
+    op.create_index(
+        "ix_events_trace_id_ts",
+        "events",
+        ["trace_id", "ts"],
+        postgresql_include=["tokens_in", "tokens_out", "cost_usd"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_trace_id_ts", table_name="events")
+    op.create_index("ix_events_trace_id_ts", "events", ["trace_id", "ts"])
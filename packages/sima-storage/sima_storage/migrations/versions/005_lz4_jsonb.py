@@ -0,0 +1,32 @@
+"""Compress large JSONB payloads with LZ4.
+
+events.content_json and memories.metadata_json can hold large workspace
+and perception payloads that get TOASTed. LZ4 decompresses several times
+faster than the default pglz at a similar ratio. Requires PostgreSQL 14+
+built with lz4 (RDS and the ParadeDB image both are). Only newly written
+values use the new method; existing rows keep pglz until rewritten.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE events ALTER COLUMN content_json SET COMPRESSION lz4")
+    op.execute("ALTER TABLE memories ALTER COLUMN metadata_json SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE memories ALTER COLUMN metadata_json SET COMPRESSION default")
+    op.execute("ALTER TABLE events ALTER COLUMN content_json SET COMPRESSION default")
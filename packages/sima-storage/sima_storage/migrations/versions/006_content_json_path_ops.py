@@ -0,0 +1,36 @@
+"""Rebuild the content_json GIN index with jsonb_path_ops.
+
+Event payloads are only filtered by containment (@>), which jsonb_path_ops
+supports with a smaller, faster index than the default jsonb_ops. Key
+existence operators (?, ?|, ?&) are not used on content_json.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_events_content_json", table_name="events")
+    op.create_index(
+        "ix_events_content_json",
+        "events",
+        ["content_json"],
+        postgresql_using="gin",
+        postgresql_ops={"content_json": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_content_json", table_name="events")
+    op.create_index("ix_events_content_json", "events", ["content_json"], postgresql_using="gin")
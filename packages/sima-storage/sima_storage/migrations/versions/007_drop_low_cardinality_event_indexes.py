@@ -0,0 +1,33 @@
+"""Drop the single-column actor and event_type indexes on events.
+
+Both columns are low-cardinality enums (14 and 20 values), so each index
+matches a large slice of the table while still costing a b-tree update on
+every insert. Their readers (list_recent / get_latest_by_type filters)
+sort by ts DESC with a LIMIT and are served by walking ix_events_ts.
+Trace and stream lookups already use the (trace_id, ts) and (stream, ts)
+composites from revision 002.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_events_actor", table_name="events")
+    op.drop_index("ix_events_event_type", table_name="events")
+
+
+def downgrade() -> None:
+    op.create_index("ix_events_event_type", "events", ["event_type"])
+    op.create_index("ix_events_actor", "events", ["actor"])
@@ -0,0 +1,34 @@
+"""Partial index on in-flight traces.
+
+Only traces still running have completed_at NULL, so this index stays
+tiny and serves TraceRepository.list_inflight without touching the full
+started_at index.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_traces_inflight",
+        "traces",
+        ["started_at"],
+        postgresql_where=sa.text("completed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_traces_inflight", table_name="traces")
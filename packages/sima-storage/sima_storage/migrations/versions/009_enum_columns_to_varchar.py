@@ -0,0 +1,77 @@
+"""Store enum columns as VARCHAR(32) with CHECK constraints.
+
+PostgreSQL enum types can only be extended with ALTER TYPE ... ADD VALUE
+and never shrunk, which makes adding an actor or event type a blocking,
+one-way migration. Convert traces.input_type and events.actor, stream and
+event_type to VARCHAR(32) guarded by CHECK constraints, then drop the
+enum types. Extending a set is now a constraint swap. Existing values
+are kept as their text labels; indexes on these columns are rebuilt by
+the type change.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type name, allowed values) as of this revision
+ENUM_COLUMNS = [
+    ("traces", "input_type", "input_type_enum", (
+        "user_message", "minute_tick", "autonomous_tick",
+    )),
+    ("events", "actor", "actor_enum", (
+        "telegram_in", "perception", "memory", "planner", "critic",
+        "attention_gate", "workspace", "metacog", "ast", "speaker",
+        "monologue", "sleep", "telegram_out", "system",
+    )),
+    ("events", "stream", "stream_enum", (
+        "external", "conscious", "subconscious", "sleep",
+    )),
+    ("events", "event_type", "event_type_enum", (
+        "message_in", "tick", "percept", "candidate", "selection",
+        "workspace_update", "broadcast", "metacog_report", "belief_revision",
+        "attention_prediction", "attention_comparison", "monologue",
+        "message_out", "sleep_start", "sleep_digest", "memory_consolidation",
+        "sleep_end", "error", "pause", "resume",
+    )),
+]
+
+
+def upgrade() -> None:
+    for table, column, type_name, values in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(32),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        allowed = ", ".join(f"'{v}'" for v in values)
+        op.create_check_constraint(f"ck_{table}_{column}", table, f"{column} IN ({allowed})")
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table, column, type_name, values in ENUM_COLUMNS:
+        enum = postgresql.ENUM(*values, name=type_name, create_type=False)
+        enum.create(bind, checkfirst=True)
+        op.drop_constraint(f"ck_{table}_{column}", table, type_="check")
+        op.alter_column(
+            table,
+            column,
+            type_=enum,
+            existing_nullable=False,
+            postgresql_using=f"{column}::{type_name}",
+        )
@@ -0,0 +1,31 @@
+"""Composite (event_type, ts) index on events.
+
+get_latest_by_type asks for the newest event of one type. Walking
+ix_events_ts backwards reaches rare types (such as attention predictions,
+one per trace) only after skipping every newer event of other types. With
+event_type leading, the newest match is the first entry of a backward
+range scan. The optional actor filter is checked on that row; its only
+caller pairs each type with a single actor, so no wider index is needed.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_event_type_ts", "events", ["event_type", "ts"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_event_type_ts", table_name="events")
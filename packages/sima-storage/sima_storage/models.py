@@ -3,18 +3,20 @@ SQLAlchemy models for SIMA's event-sourced architecture.
 """
 
 from datetime import datetime
+from enum import Enum
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy import (
+    CheckConstraint,
     DateTime,
-    Enum as SQLEnum,
     Float,
     ForeignKey,
     Index,
     Integer,
     String,
     Text,
+    TypeDecorator,
     text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PGUUID
@@ -29,6 +31,39 @@ class Base(DeclarativeBase):
     pass
 
 
+class EnumString(TypeDecorator):
+    """
+    A str Enum stored as VARCHAR(32) rather than a PostgreSQL enum type.
+
+    Allowed values are enforced by a CHECK constraint (see enum_check), so
+    adding a value is a constraint swap instead of ALTER TYPE. Values are
+    returned as the Python Enum.
+    """
+
+    impl = String(32)
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[Enum]):
+        super().__init__()
+        self.enum_cls = enum_cls
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_cls(value).value
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_cls(value)
+
+
+def enum_check(column: str, enum_cls: type[Enum], table: str) -> CheckConstraint:
+    """CHECK constraint restricting column to the values of enum_cls."""
+    values = ", ".join(f"'{e.value}'" for e in enum_cls)
+    return CheckConstraint(f"{column} IN ({values})", name=f"ck_{table}_{column}")
+
+
 class TraceModel(Base):
     """A trace represents a single cognitive cycle triggered by an input."""
 
@@ -39,12 +74,7 @@ class TraceModel(Base):
         primary_key=True,
     )
     input_type: Mapped[str] = mapped_column(
-        SQLEnum(
-            InputType,
-            name="input_type_enum",
-            create_type=False,
-            values_callable=lambda x: [e.value for e in x],
-        ),
+        EnumString(InputType),
         nullable=False,
     )
     started_at: Mapped[datetime] = mapped_column(
@@ -82,15 +112,24 @@ class TraceModel(Base):
     )
 
     # Relationships
+    # Deleting a trace leaves its events to the FK's ON DELETE CASCADE
+    # instead of loading and deleting them one by one
     events: Mapped[list["EventModel"]] = relationship(
         "EventModel",
         back_populates="trace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     __table_args__ = (
+        enum_check("input_type", InputType, "traces"),
         Index("ix_traces_started_at", "started_at"),
         Index("ix_traces_input_type", "input_type"),
+        Index(
+            "ix_traces_inflight",
+            "started_at",
+            postgresql_where=text("completed_at IS NULL"),
+        ),
     )
 
 
@@ -99,6 +138,7 @@ class EventModel(Base):
 
     __tablename__ = "events"
 
+    # Time-ordered (v7) UUIDs from sima_core.ids, so inserts append to the index
     event_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
@@ -114,30 +154,15 @@ class EventModel(Base):
         server_default=text("NOW()"),
     )
     actor: Mapped[str] = mapped_column(
-        SQLEnum(
-            Actor,
-            name="actor_enum",
-            create_type=False,
-            values_callable=lambda x: [e.value for e in x],
-        ),
+        EnumString(Actor),
         nullable=False,
     )
     stream: Mapped[str] = mapped_column(
-        SQLEnum(
-            Stream,
-            name="stream_enum",
-            create_type=False,
-            values_callable=lambda x: [e.value for e in x],
-        ),
+        EnumString(Stream),
         nullable=False,
     )
     event_type: Mapped[str] = mapped_column(
-        SQLEnum(
-            EventType,
-            name="event_type_enum",
-            create_type=False,
-            values_callable=lambda x: [e.value for e in x],
-        ),
+        EnumString(EventType),
         nullable=False,
     )
     content_text: Mapped[str | None] = mapped_column(
@@ -193,12 +218,25 @@ class EventModel(Base):
     )
 
     __table_args__ = (
-        Index("ix_events_trace_id", "trace_id"),
+        enum_check("actor", Actor, "events"),
+        enum_check("stream", Stream, "events"),
+        enum_check("event_type", EventType, "events"),
+        Index(
+            "ix_events_trace_id_ts",
+            "trace_id",
+            "ts",
+            postgresql_include=["tokens_in", "tokens_out", "cost_usd"],
+        ),
         Index("ix_events_ts", "ts"),
-        Index("ix_events_actor", "actor"),
-        Index("ix_events_stream", "stream"),
-        Index("ix_events_event_type", "event_type"),
-        Index("ix_events_content_json", "content_json", postgresql_using="gin"),
+        Index("ix_events_stream_ts", "stream", "ts"),
+        Index("ix_events_event_type_ts", "event_type", "ts"),
+        Index(
+            "ix_events_content_json",
+            "content_json",
+            postgresql_using="gin",
+            postgresql_ops={"content_json": "jsonb_path_ops"},
+        ),
+        Index("ix_events_tags", "tags", postgresql_using="gin"),
     )
 
 
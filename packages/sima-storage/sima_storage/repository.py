@@ -1,19 +1,133 @@
 """
 Repository classes for database CRUD operations.
+
+JSONB filters on events.content_json should use containment
+(content_json @> '{"key": "value"}', see list_by_json_contains and
+filter_json_eq). The GIN index only serves @>; predicates written as
+content_json->>'key' = 'value' scan the whole table.
 """
 
-from datetime import datetime
-from typing import Sequence
+import json
+from datetime import timedelta
+from typing import Any, AsyncIterator, Sequence
 from uuid import UUID
 
-from sqlalchemy import func, select, update, text
+from sqlalchemy import Integer, String, bindparam, func, select, update, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sima_core.events import Event, EventCreate
+from sima_core.ids import generate_id, generate_ids_bulk
+from sima_core.time import utc_now
 from sima_core.types import Actor, EventType, InputType, Stream
 
+from .access import AccessBatch
+from .database import copy_records_to_table
 from .models import EventModel, MemoryModel, TraceModel, SystemStateModel
 
+# Below this many events a single INSERT ... UNNEST beats COPY's setup cost
+COPY_MIN_ROWS = 64
+
+# Rows per flush/COPY in bulk inserts. PostgreSQL batch-insert throughput
+# levels off around 1,000 rows and degrades past ~10k, so measure before
+# raising this.
+INSERT_BATCH_SIZE = 1000
+
+# events columns written by EventRepository.bulk_insert_copy, in record order
+_EVENT_BULK_COLUMNS = (
+    "event_id",
+    "trace_id",
+    "ts",
+    "actor",
+    "stream",
+    "event_type",
+    "content_text",
+    "content_json",
+    "model_provider",
+    "model_id",
+    "tokens_in",
+    "tokens_out",
+    "latency_ms",
+    "cost_usd",
+    "parent_event_id",
+    "tags",
+)
+
+# Adds buffered access counts; GREATEST skips a NULL last_accessed_at
+_MEMORY_ACCESS_UPDATE = text("""
+    UPDATE memories
+    SET access_count = memories.access_count + data.delta,
+        last_accessed_at = GREATEST(memories.last_accessed_at, data.ts)
+    FROM UNNEST(
+        CAST(:memory_id AS uuid[]),
+        CAST(:delta AS integer[]),
+        CAST(:ts AS timestamptz[])
+    ) AS data(memory_id, delta, ts)
+    WHERE memories.memory_id = data.memory_id
+""")
+
+# ParadeDB BM25 searches, built once so every call sends identical SQL with
+# typed parameters and reuses asyncpg's per-connection prepared statement.
+# A single ORDER BY score LIMIT lets the BM25 index return its top-k directly.
+_SEARCH_EVENTS = select(EventModel).from_statement(
+    text("""
+        SELECT * FROM events
+        WHERE content_text @@@ paradedb.parse(:query)
+        ORDER BY paradedb.score(event_id) DESC
+        LIMIT :limit
+    """).bindparams(bindparam("query", type_=String), bindparam("limit", type_=Integer))
+)
+_SEARCH_MEMORIES = select(MemoryModel).from_statement(
+    text("""
+        SELECT * FROM memories
+        WHERE content @@@ paradedb.parse(:query)
+        ORDER BY paradedb.score(memory_id) DESC
+        LIMIT :limit
+    """).bindparams(bindparam("query", type_=String), bindparam("limit", type_=Integer))
+)
+
+# Planner row estimate for traces; -1 until the table is first analyzed
+_TRACES_RELTUPLES = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = 'traces'::regclass"
+)
+
+# One statement for a whole batch: each column is bound as one typed array.
+# tags is passed as jsonb[] because UNNEST cannot split a varchar[][] per row.
+_EVENT_UNNEST_INSERT = text("""
+    INSERT INTO events (
+        event_id, trace_id, ts, actor, stream, event_type, content_text,
+        content_json, model_provider, model_id, tokens_in, tokens_out,
+        latency_ms, cost_usd, parent_event_id, tags
+    )
+    SELECT
+        event_id, trace_id, ts, actor, stream, event_type, content_text,
+        content_json, model_provider, model_id, tokens_in, tokens_out,
+        latency_ms, cost_usd, parent_event_id,
+        ARRAY(SELECT jsonb_array_elements_text(tags))::varchar[]
+    FROM UNNEST(
+        CAST(:event_id AS uuid[]),
+        CAST(:trace_id AS uuid[]),
+        CAST(:ts AS timestamptz[]),
+        CAST(:actor AS varchar[]),
+        CAST(:stream AS varchar[]),
+        CAST(:event_type AS varchar[]),
+        CAST(:content_text AS text[]),
+        CAST(:content_json AS jsonb[]),
+        CAST(:model_provider AS varchar[]),
+        CAST(:model_id AS varchar[]),
+        CAST(:tokens_in AS integer[]),
+        CAST(:tokens_out AS integer[]),
+        CAST(:latency_ms AS integer[]),
+        CAST(:cost_usd AS float8[]),
+        CAST(:parent_event_id AS uuid[]),
+        CAST(:tags AS jsonb[])
+    ) AS t(
+        event_id, trace_id, ts, actor, stream, event_type, content_text,
+        content_json, model_provider, model_id, tokens_in, tokens_out,
+        latency_ms, cost_usd, parent_event_id, tags
+    )
+""")
+
 
 class TraceRepository:
     """Repository for trace operations."""
@@ -83,14 +197,40 @@ class TraceRepository:
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def list_inflight(self, limit: int = 100) -> Sequence[TraceModel]:
+        """List traces that have not completed yet, oldest first."""
+        query = (
+            select(TraceModel)
+            .where(TraceModel.completed_at.is_(None))
+            .order_by(TraceModel.started_at)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
     async def count(self, input_type: InputType | None = None) -> int:
         """Count traces."""
-        query = select(func.count(TraceModel.trace_id))
+        # count(*) rather than count(trace_id) so a filtered count can be
+        # answered by an index-only scan of ix_traces_input_type
+        query = select(func.count()).select_from(TraceModel)
         if input_type is not None:
             query = query.where(TraceModel.input_type == input_type)
         result = await self.session.execute(query)
         return result.scalar_one()
 
+    async def count_estimate(self) -> int:
+        """
+        Approximate number of traces, from the planner's statistics.
+
+        Costs a single catalog lookup regardless of table size. Falls back
+        to an exact count when the table has never been analyzed.
+        """
+        result = await self.session.execute(_TRACES_RELTUPLES)
+        estimate = result.scalar_one_or_none()
+        if estimate is None or estimate < 0:
+            return await self.count()
+        return estimate
+
 
 class EventRepository:
     """Repository for event operations."""
@@ -123,8 +263,48 @@ class EventRepository:
         await self.session.flush()
         return model
 
-    async def create_many(self, events: list[EventCreate]) -> list[EventModel]:
-        """Create multiple events."""
+    async def create_fast(self, event_create: EventCreate) -> UUID:
+        """
+        Insert one event with a core INSERT ... RETURNING.
+
+        Skips ORM model construction and identity-map registration; use
+        create() when the mapped model is needed.
+
+        Returns:
+            ID of the inserted event.
+        """
+        e = event_create
+        stmt = (
+            pg_insert(EventModel)
+            .values(
+                event_id=generate_id(),
+                trace_id=e.trace_id,
+                ts=utc_now(),
+                actor=e.actor,
+                stream=e.stream,
+                event_type=e.event_type,
+                content_text=e.content_text,
+                content_json=e.content_json,
+                model_provider=e.model_provider,
+                model_id=e.model_id,
+                tokens_in=e.tokens_in,
+                tokens_out=e.tokens_out,
+                latency_ms=e.latency_ms,
+                cost_usd=e.cost_usd,
+                parent_event_id=e.parent_event_id,
+                tags=e.tags,
+            )
+            .returning(EventModel.event_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def create_many(
+        self,
+        events: list[EventCreate],
+        batch_size: int = INSERT_BATCH_SIZE,
+    ) -> list[EventModel]:
+        """Create multiple events, flushing every batch_size rows."""
         models = []
         for event_create in events:
             event = Event.from_create(event_create)
@@ -148,10 +328,70 @@ class EventRepository:
             )
             models.append(model)
 
-        self.session.add_all(models)
-        await self.session.flush()
+        for start in range(0, len(models), batch_size):
+            self.session.add_all(models[start:start + batch_size])
+            await self.session.flush()
         return models
 
+    async def bulk_insert_copy(
+        self,
+        events: list[EventCreate],
+        batch_size: int = INSERT_BATCH_SIZE,
+    ) -> list[UUID]:
+        """
+        Insert events with PostgreSQL COPY, without building ORM models.
+
+        Batches smaller than COPY_MIN_ROWS are written with one
+        INSERT ... SELECT FROM UNNEST statement instead, and a single event
+        with create_fast. Either way rows go out batch_size at a time, all
+        within the session's transaction. Inserted rows are not added to
+        the session's identity map.
+
+        Returns:
+            IDs of the inserted events, in input order.
+        """
+        if len(events) == 1:
+            return [await self.create_fast(events[0])]
+
+        event_ids = generate_ids_bulk(len(events))
+        records = [
+            (
+                event_id,
+                e.trace_id,
+                utc_now(),
+                e.actor.value,
+                e.stream.value,
+                e.event_type.value,
+                e.content_text,
+                json.dumps(e.content_json) if e.content_json is not None else None,
+                e.model_provider,
+                e.model_id,
+                e.tokens_in,
+                e.tokens_out,
+                e.latency_ms,
+                e.cost_usd,
+                e.parent_event_id,
+                e.tags,
+            )
+            for event_id, e in zip(event_ids, events)
+        ]
+        for start in range(0, len(records), batch_size):
+            batch = records[start:start + batch_size]
+            if len(records) < COPY_MIN_ROWS:
+                await self._insert_unnest(batch)
+            else:
+                await copy_records_to_table(self.session, "events", batch, _EVENT_BULK_COLUMNS)
+        return event_ids
+
+    async def _insert_unnest(self, records: list[tuple]) -> None:
+        """Insert bulk-column records with a single UNNEST statement."""
+        params = {
+            name: list(values)
+            for name, values in zip(_EVENT_BULK_COLUMNS, zip(*records))
+        }
+        params["tags"] = [json.dumps(tags) for tags in params["tags"]]
+        await self.session.execute(_EVENT_UNNEST_INSERT, params)
+
     async def get(self, event_id: UUID) -> EventModel | None:
         """Get an event by ID."""
         result = await self.session.execute(
@@ -167,6 +407,38 @@ class EventRepository:
         event_type: EventType | None = None,
     ) -> Sequence[EventModel]:
         """List events for a trace."""
+        query = self._by_trace_query(trace_id, stream, actor, event_type)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def list_by_trace_stream(
+        self,
+        trace_id: UUID,
+        stream: Stream | None = None,
+        actor: Actor | None = None,
+        event_type: EventType | None = None,
+        yield_per: int = 500,
+    ) -> AsyncIterator[EventModel]:
+        """
+        Iterate over a trace's events without loading them all at once.
+
+        Rows are fetched yield_per at a time through a server-side cursor,
+        which asyncpg only allows inside a transaction: use a get_session()
+        session, not get_readonly_session().
+        """
+        query = self._by_trace_query(trace_id, stream, actor, event_type)
+        result = await self.session.stream(query.execution_options(yield_per=yield_per))
+        async for event in result.scalars():
+            yield event
+
+    @staticmethod
+    def _by_trace_query(
+        trace_id: UUID,
+        stream: Stream | None,
+        actor: Actor | None,
+        event_type: EventType | None,
+    ):
+        """Build the ordered, filtered select for a trace's events."""
         query = (
             select(EventModel)
             .where(EventModel.trace_id == trace_id)
@@ -180,8 +452,7 @@ class EventRepository:
         if event_type is not None:
             query = query.where(EventModel.event_type == event_type)
 
-        result = await self.session.execute(query)
-        return result.scalars().all()
+        return query
 
     async def list_recent(
         self,
@@ -205,34 +476,100 @@ class EventRepository:
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def recent_summary(
+        self,
+        stream: Stream,
+        minutes: int = 60,
+    ) -> list[dict]:
+        """
+        Count a stream's events per minute over the last few minutes.
+
+        Only stream and ts are read, so this is an index-only range scan of
+        ix_events_stream_ts and stays cheap without a precomputed rollup.
+
+        Returns:
+            One {"bucket", "event_count"} dict per minute that has events,
+            newest first.
+        """
+        bucket = func.date_trunc("minute", EventModel.ts).label("bucket")
+        result = await self.session.execute(
+            select(bucket, func.count().label("event_count"))
+            .where(EventModel.stream == stream)
+            .where(EventModel.ts >= utc_now() - timedelta(minutes=minutes))
+            .group_by(bucket)
+            .order_by(bucket.desc())
+        )
+        return [
+            {"bucket": row.bucket, "event_count": row.event_count}
+            for row in result
+        ]
+
+    async def list_by_tag(
+        self,
+        tag: str,
+        limit: int = 100,
+    ) -> Sequence[EventModel]:
+        """List the most recent events carrying a tag."""
+        # tags @> ARRAY[tag] so the lookup can use the GIN index on tags
+        query = (
+            select(EventModel)
+            .where(EventModel.tags.contains([tag]))
+            .order_by(EventModel.ts.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def list_by_json_contains(
+        self,
+        predicate: dict,
+        limit: int = 100,
+    ) -> Sequence[EventModel]:
+        """List the most recent events whose content_json contains predicate."""
+        # content_json @> :predicate, the form the jsonb_path_ops GIN index serves
+        query = (
+            select(EventModel)
+            .where(EventModel.content_json.contains(predicate))
+            .order_by(EventModel.ts.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def filter_json_eq(
+        self,
+        field: str,
+        value: Any,
+        limit: int = 100,
+    ) -> Sequence[EventModel]:
+        """
+        List the most recent events whose content_json[field] equals value.
+
+        Written as containment so it uses the GIN index. For scalar values
+        this is exact equality; list and object values match when the
+        stored value contains them.
+        """
+        return await self.list_by_json_contains({field: value}, limit=limit)
+
     async def search_content(
         self,
         query_text: str,
         limit: int = 20,
     ) -> Sequence[EventModel]:
-        """Full-text search on content using ParadeDB BM25."""
-        # Use ParadeDB pg_search BM25 search
-        query = text("""
-            SELECT e.* FROM events e
-            WHERE e.event_id IN (
-                SELECT event_id FROM events
-                WHERE content_text @@@ paradedb.parse(:query)
-                ORDER BY paradedb.score(event_id) DESC
-                LIMIT :limit
-            )
-            ORDER BY ts DESC
-        """)
+        """Full-text search on content using ParadeDB BM25, best match first."""
         result = await self.session.execute(
-            query,
+            _SEARCH_EVENTS,
             {"query": query_text, "limit": limit}
         )
         return result.scalars().all()
 
     async def get_trace_stats(self, trace_id: UUID) -> dict:
         """Get aggregate stats for a trace."""
+        # count(*) rather than count(event_id): every column read here is in
+        # ix_events_trace_id_ts, so Postgres can use an index-only scan
         result = await self.session.execute(
             select(
-                func.count(EventModel.event_id).label("event_count"),
+                func.count().label("event_count"),
                 func.sum(EventModel.tokens_in).label("total_tokens_in"),
                 func.sum(EventModel.tokens_out).label("total_tokens_out"),
                 func.sum(EventModel.cost_usd).label("total_cost"),
@@ -305,19 +642,9 @@ class MemoryRepository:
         memory_type: str | None = None,
         limit: int = 10,
     ) -> Sequence[MemoryModel]:
-        """Search memories using BM25."""
-        # Use ParadeDB pg_search for BM25 ranking
-        base_query = text("""
-            SELECT m.* FROM memories m
-            WHERE m.memory_id IN (
-                SELECT memory_id FROM memories
-                WHERE content @@@ paradedb.parse(:query)
-                ORDER BY paradedb.score(memory_id) DESC
-                LIMIT :limit
-            )
-        """)
+        """Search memories using BM25, best match first."""
         result = await self.session.execute(
-            base_query,
+            _SEARCH_MEMORIES,
             {"query": query_text, "limit": limit}
         )
         return result.scalars().all()
@@ -364,6 +691,27 @@ class MemoryRepository:
             )
         )
 
+    async def record_accesses(self, accesses: AccessBatch) -> None:
+        """
+        Apply a batch of buffered accesses with a single UPDATE.
+
+        Args:
+            accesses: Per memory, the number of accesses and the latest
+                access time, as drained from a MemoryAccessBuffer.
+        """
+        if not accesses:
+            return
+        # Lock rows in a fixed order so concurrent flushes cannot deadlock
+        memory_ids = sorted(accesses)
+        await self.session.execute(
+            _MEMORY_ACCESS_UPDATE,
+            {
+                "memory_id": memory_ids,
+                "delta": [accesses[m][0] for m in memory_ids],
+                "ts": [accesses[m][1] for m in memory_ids],
+            },
+        )
+
 
 class SystemStateRepository:
     """Repository for system state operations."""
@@ -380,20 +728,16 @@ class SystemStateRepository:
 
     async def set(self, key: str, value: str) -> None:
         """Set a system state value (upsert)."""
-        # Check if exists
-        existing = await self.session.execute(
-            select(SystemStateModel).where(SystemStateModel.key == key)
+        # Single INSERT ... ON CONFLICT: one round-trip, no read-modify-write race
+        stmt = (
+            pg_insert(SystemStateModel)
+            .values(key=key, value=value)
+            .on_conflict_do_update(
+                index_elements=[SystemStateModel.key],
+                set_={"value": value, "updated_at": func.now()},
+            )
         )
-        model = existing.scalar_one_or_none()
-
-        if model:
-            model.value = value
-            model.updated_at = datetime.utcnow()
-        else:
-            model = SystemStateModel(key=key, value=value)
-            self.session.add(model)
-
-        await self.session.flush()
+        await self.session.execute(stmt)
 
     async def is_paused(self) -> bool:
         """Check if the system is paused."""
@@ -1,21 +1,90 @@
 """
 S3 helpers for large payload storage.
+
+One S3 client is kept for the running event loop so uploads and downloads
+reuse its pooled connections instead of paying a TLS handshake and
+endpoint resolution per call. The client is replaced when the loop
+changes, and should be closed with close_s3_client() before the loop ends.
 """
 
+import asyncio
+import io
 import json
 import os
-from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+import time
+from functools import lru_cache
+from types import ModuleType
+from typing import Any
 from uuid import UUID
 
 import aioboto3
+from aiobotocore.config import AioConfig
+from boto3.s3.transfer import TransferConfig
+
+# orjson is optional; fall back to stdlib json when it isn't installed
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Seconds an idle pooled connection is kept open for reuse
+KEEPALIVE_TIMEOUT = 60.0
+
+# Bodies above this size are sent as a multipart upload, in parts of the
+# same size uploaded concurrently
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CONCURRENCY = 8
+
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_THRESHOLD,
+    max_concurrency=MULTIPART_CONCURRENCY,
+)
+
+# A cached presigned URL is reused while at least this share of the
+# requested lifetime is left, so callers always get a URL valid for
+# most of expires_in
+PRESIGNED_URL_MIN_REMAINING = 0.5
+
+# Max presigned URLs kept; entries too old to reuse are dropped when it is reached
+PRESIGNED_URL_CACHE_SIZE = 1024
+
+# (bucket, key, expires_in) -> (url, monotonic time the URL expires)
+_url_cache: dict[tuple[str, str, int], tuple[str, float]] = {}
+
+_client: Any | None = None
+_client_context: Any | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_client_lock: asyncio.Lock | None = None
+
+
+def _dumps(obj: Any, default: Any = None) -> bytes:
+    """Encode obj as UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=default).encode("utf-8")
 
 
+def _loads(data: bytes) -> Any:
+    """Decode UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1)
 def get_s3_config() -> dict:
-    """Get S3 configuration from environment."""
+    """
+    Get S3 configuration from environment.
+
+    Read once and cached; callers must not modify the returned dict.
+    Call invalidate_s3_config() after changing the environment.
+    """
     config = {
         "bucket": os.getenv("S3_BUCKET", "sima-events-dev"),
         "region": os.getenv("AWS_REGION", "us-east-1"),
+        "pool_size": int(os.getenv("S3_POOL_SIZE", "64")),
     }
 
     # LocalStack endpoint for local development
@@ -26,18 +95,86 @@ def get_s3_config() -> dict:
     return config
 
 
-@asynccontextmanager
-async def get_s3_client() -> AsyncGenerator[Any, None]:
-    """Get an async S3 client."""
-    config = get_s3_config()
-    session = aioboto3.Session()
+def invalidate_s3_config() -> None:
+    """Forget the cached S3 configuration so the next call re-reads it."""
+    get_s3_config.cache_clear()
+
+
+async def get_s3_client() -> Any:
+    """
+    Get the shared async S3 client for the running event loop.
+
+    Created on first use; callers must not close it.
+    """
+    global _client, _client_context, _client_loop, _client_lock
+
+    loop = asyncio.get_running_loop()
+    if _client_loop is not loop:
+        # A client from a finished loop cannot be used or closed here
+        _client = None
+        _client_context = None
+        _client_loop = loop
+        _client_lock = asyncio.Lock()
+
+    if _client is not None:
+        return _client
+
+    lock = _client_lock
+    assert lock is not None
+    async with lock:
+        if _client is None:
+            config = get_s3_config()
+            session = aioboto3.Session()
+
+            client_kwargs = {
+                "region_name": config["region"],
+                "config": AioConfig(
+                    max_pool_connections=config["pool_size"],
+                    connector_args={"keepalive_timeout": KEEPALIVE_TIMEOUT},
+                    retries={"max_attempts": 5, "mode": "adaptive"},
+                ),
+            }
+            if "endpoint_url" in config:
+                client_kwargs["endpoint_url"] = config["endpoint_url"]
+
+            context = session.client("s3", **client_kwargs)
+            _client = await context.__aenter__()
+            _client_context = context
+    return _client
 
-    client_kwargs = {"region_name": config["region"]}
-    if "endpoint_url" in config:
-        client_kwargs["endpoint_url"] = config["endpoint_url"]
 
-    async with session.client("s3", **client_kwargs) as client:
-        yield client
+async def close_s3_client() -> None:
+    """Close the shared S3 client, if one was created on this loop."""
+    global _client, _client_context, _client_loop, _client_lock
+
+    context, loop = _client_context, _client_loop
+    _client = None
+    _client_context = None
+    _client_loop = None
+    _client_lock = None
+
+    if context is not None and loop is asyncio.get_running_loop():
+        await context.__aexit__(None, None, None)
+
+
+async def _put_json(client: Any, bucket: str, key: str, body: bytes) -> None:
+    """Upload a JSON body, in concurrent parts when it is large."""
+    if len(body) > MULTIPART_THRESHOLD:
+        await client.upload_fileobj(
+            io.BytesIO(body),
+            bucket,
+            key,
+            ExtraArgs={"ContentType": "application/json"},
+            Config=_TRANSFER_CONFIG,
+        )
+        return
+
+    await client.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=body,
+        ContentType="application/json",
+    )
 
 
 def make_event_key(trace_id: UUID, event_id: UUID) -> str:
@@ -57,24 +194,19 @@ async def store_large_payload(
     size_threshold: int = 100_000,  # 100KB
 ) -> str | None:
     """
-    Store a large payload in S3 if it exceeds the threshold.
+    Store a large payload in S3 if its encoded size reaches size_threshold bytes.
     Returns the S3 key if stored, None if payload was small enough.
     """
-    payload_str = json.dumps(payload)
+    payload_bytes = _dumps(payload)
 
-    if len(payload_str) < size_threshold:
+    if len(payload_bytes) < size_threshold:
         return None
 
     config = get_s3_config()
     key = make_event_key(trace_id, event_id)
 
-    async with get_s3_client() as client:
-        await client.put_object(
-            Bucket=config["bucket"],
-            Key=key,
-            Body=payload_str.encode("utf-8"),
-            ContentType="application/json",
-        )
+    client = await get_s3_client()
+    await _put_json(client, config["bucket"], key, payload_bytes)
 
     return key
 
@@ -83,13 +215,14 @@ async def retrieve_payload(s3_key: str) -> dict[str, Any]:
     """Retrieve a payload from S3."""
     config = get_s3_config()
 
-    async with get_s3_client() as client:
-        response = await client.get_object(
-            Bucket=config["bucket"],
-            Key=s3_key,
-        )
-        body = await response["Body"].read()
-        return json.loads(body.decode("utf-8"))
+    client = await get_s3_client()
+    response = await client.get_object(
+        Bucket=config["bucket"],
+        Key=s3_key,
+    )
+    async with response["Body"] as stream:
+        body = await stream.read()
+    return _loads(body)
 
 
 async def store_trace_export(trace_id: UUID, data: dict[str, Any]) -> str:
@@ -97,28 +230,44 @@ async def store_trace_export(trace_id: UUID, data: dict[str, Any]) -> str:
     config = get_s3_config()
     key = make_trace_key(trace_id)
 
-    async with get_s3_client() as client:
-        await client.put_object(
-            Bucket=config["bucket"],
-            Key=key,
-            Body=json.dumps(data, default=str).encode("utf-8"),
-            ContentType="application/json",
-        )
+    client = await get_s3_client()
+    await _put_json(client, config["bucket"], key, _dumps(data, default=str))
 
     return key
 
 
 async def generate_presigned_url(s3_key: str, expires_in: int = 3600) -> str:
-    """Generate a presigned URL for downloading from S3."""
+    """
+    Generate a presigned URL for downloading from S3.
+
+    URLs are cached per process and handed out again while at least half
+    of expires_in remains, so repeat requests skip signing.
+    """
     config = get_s3_config()
+    cache_key = (config["bucket"], s3_key, expires_in)
+    now = time.monotonic()
 
-    async with get_s3_client() as client:
-        url = await client.generate_presigned_url(
-            "get_object",
-            Params={
-                "Bucket": config["bucket"],
-                "Key": s3_key,
-            },
-            ExpiresIn=expires_in,
-        )
-        return url
+    cached = _url_cache.get(cache_key)
+    if cached is not None and cached[1] - now >= expires_in * PRESIGNED_URL_MIN_REMAINING:
+        return cached[0]
+
+    client = await get_s3_client()
+    url = await client.generate_presigned_url(
+        "get_object",
+        Params={
+            "Bucket": config["bucket"],
+            "Key": s3_key,
+        },
+        ExpiresIn=expires_in,
+    )
+
+    if len(_url_cache) >= PRESIGNED_URL_CACHE_SIZE:
+        for stale in [
+            k for k, (_, expiry) in _url_cache.items()
+            if expiry - now < k[2] * PRESIGNED_URL_MIN_REMAINING
+        ]:
+            del _url_cache[stale]
+        if len(_url_cache) >= PRESIGNED_URL_CACHE_SIZE:
+            _url_cache.clear()
+    _url_cache[cache_key] = (url, now + expires_in)
+    return url
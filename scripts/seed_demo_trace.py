@@ -263,7 +263,7 @@ async def seed_demo_trace():
             ),
         ]
 
-        await event_repo.create_many(events)
+        await event_repo.bulk_insert_copy(events)
 
         # Complete trace
         await trace_repo.complete(
@@ -15,10 +15,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from mangum import Mangum
 
 from sima_storage.database import init_db, close_db
+from sima_storage.s3 import close_s3_client
 
 from .settings import settings
 from .auth import LoginRequest, TokenResponse, login
 from .routes import traces_router, events_router, metrics_router, admin_router, memories_router, webhook_router
+from .routes.memories import flush_memory_accesses
 
 # Configure logging
 logging.basicConfig(
@@ -38,6 +40,8 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Database connection failed: {e}")
     yield
+    await flush_memory_accesses()
+    await close_s3_client()
     await close_db()
     logger.info("Shutting down SIMA API")
 
@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy import delete
 
-from sima_storage.database import get_session
+from sima_storage.database import get_readonly_session, get_session
 from sima_storage.models import EventModel, TraceModel, MemoryModel
 from sima_storage.repository import SystemStateRepository, MemoryRepository
 
@@ -49,7 +49,7 @@ async def get_system_status(
 
     Lab-only endpoint.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = SystemStateRepository(session)
         paused = await repo.is_paused()
 
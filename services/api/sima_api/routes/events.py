@@ -9,8 +9,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from sima_core.types import Actor, EventType, Stream
-from sima_storage.database import get_session
+from sima_core.types import Actor, EventType, Stream, VALID_STREAMS
+from sima_storage.database import get_readonly_session
 from sima_storage.repository import EventRepository
 
 from ..auth import require_lab_auth
@@ -55,7 +55,7 @@ async def get_event(
 
     Lab-only endpoint.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = EventRepository(session)
         event = await repo.get(event_id)
 
@@ -94,16 +94,13 @@ async def list_events(
 
     Lab-only endpoint.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = EventRepository(session)
 
         # Parse stream filter
         filter_stream = None
-        if stream:
-            try:
-                filter_stream = Stream(stream)
-            except ValueError:
-                pass
+        if stream in VALID_STREAMS:
+            filter_stream = Stream(stream)
 
         events = await repo.list_recent(
             limit=limit,
@@ -150,7 +147,7 @@ async def search_events(
 
     Lab-only endpoint.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = EventRepository(session)
 
         try:
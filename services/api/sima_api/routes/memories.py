@@ -9,7 +9,8 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from sima_storage.database import get_session
+from sima_storage.access import MemoryAccessBuffer
+from sima_storage.database import get_readonly_session, get_session
 from sima_storage.repository import MemoryRepository
 
 from ..auth import optional_lab_auth, require_admin_auth
@@ -17,6 +18,20 @@ from ..auth import optional_lab_auth, require_admin_auth
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/memories", tags=["memories"])
 
+_access_buffer = MemoryAccessBuffer()
+
+
+async def flush_memory_accesses() -> None:
+    """Write buffered memory access counts to the database."""
+    accesses = _access_buffer.drain()
+    if not accesses:
+        return
+    try:
+        async with get_session() as session:
+            await MemoryRepository(session).record_accesses(accesses)
+    except Exception as e:
+        logger.warning("Failed to record %d memory accesses: %s", len(accesses), e)
+
 
 class MemoryItem(BaseModel):
     """Memory list item."""
@@ -67,7 +82,7 @@ async def list_memories(
     - L2: Consolidated memories
     - L3: Core / identity memories
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = MemoryRepository(session)
 
         if memory_type:
@@ -161,7 +176,7 @@ async def get_core_memories(
     Returns L3 core memories at the top, followed by recent L1/L2.
     This is the primary endpoint for the Memories panel.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = MemoryRepository(session)
 
         # Get L3 core memories (sorted by relevance)
@@ -216,27 +231,28 @@ async def get_memory(
 
     Public endpoint.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = MemoryRepository(session)
         memory = await repo.get(memory_id)
 
         if not memory:
             raise HTTPException(status_code=404, detail="Memory not found")
 
-        # Record access
-        await repo.record_access(memory_id)
-        await session.commit()
+    # Record access; counts are written in batches
+    _access_buffer.record(memory_id)
+    if _access_buffer.due:
+        await flush_memory_accesses()
 
-        return MemoryItem(
-            memory_id=str(memory.memory_id),
-            memory_type=memory.memory_type,
-            content=memory.content,
-            created_at=memory.created_at.isoformat(),
-            updated_at=memory.updated_at.isoformat(),
-            relevance_score=memory.relevance_score,
-            access_count=memory.access_count + 1,  # Include current access
-            metadata_json=memory.metadata_json,
-        )
+    return MemoryItem(
+        memory_id=str(memory.memory_id),
+        memory_type=memory.memory_type,
+        content=memory.content,
+        created_at=memory.created_at.isoformat(),
+        updated_at=memory.updated_at.isoformat(),
+        relevance_score=memory.relevance_score,
+        access_count=memory.access_count + 1,  # Include current access
+        metadata_json=memory.metadata_json,
+    )
 
 
 @router.get("/search")
@@ -250,7 +266,7 @@ async def search_memories(
 
     Public endpoint.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = MemoryRepository(session)
 
         try:
@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
 from sima_core.types import Actor, EventType
-from sima_storage.database import get_session
+from sima_storage.database import get_readonly_session
 from sima_storage.repository import EventRepository, TraceRepository
 
 from ..auth import require_lab_auth
@@ -72,9 +72,9 @@ async def get_overview_metrics(
 
     Lab-only endpoint.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         trace_repo = TraceRepository(session)
-        total_traces = await trace_repo.count()
+        total_traces = await trace_repo.count_estimate()
 
         # Calculate totals from recent traces
         traces = await trace_repo.list_recent(limit=1000)
@@ -135,9 +135,9 @@ async def get_theory_indicators(
         focus_shift_rate=0.22,
     )
 
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         trace_repo = TraceRepository(session)
-        total_traces = await trace_repo.count()
+        total_traces = await trace_repo.count_estimate()
 
         traces = await trace_repo.list_recent(limit=100)
         total_tokens = sum(t.total_tokens or 0 for t in traces)
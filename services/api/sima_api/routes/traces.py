@@ -9,8 +9,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from sima_core.types import InputType
-from sima_storage.database import get_session
+from sima_core.types import InputType, VALID_INPUT_TYPES
+from sima_storage.database import get_readonly_session
 from sima_storage.repository import TraceRepository, EventRepository
 
 from ..auth import require_lab_auth, optional_lab_auth
@@ -66,16 +66,13 @@ async def list_traces(
 
     Public endpoint - returns limited info without auth.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = TraceRepository(session)
 
         # Parse input type if provided
         filter_input_type = None
-        if input_type:
-            try:
-                filter_input_type = InputType(input_type)
-            except ValueError:
-                pass
+        if input_type in VALID_INPUT_TYPES:
+            filter_input_type = InputType(input_type)
 
         traces = await repo.list_recent(
             limit=limit,
@@ -117,7 +114,7 @@ async def get_trace(
 
     Lab-only endpoint - requires authentication.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         trace_repo = TraceRepository(session)
         event_repo = EventRepository(session)
 
@@ -167,7 +164,7 @@ async def get_trace_public(trace_id: UUID):
     """
     Get public trace info (limited data, no auth required).
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         trace_repo = TraceRepository(session)
         trace = await trace_repo.get(trace_id)
 
@@ -9,8 +9,8 @@ from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 
-from sima_core.types import Stream
-from sima_storage.database import get_session
+from sima_core.types import Stream, VALID_STREAMS
+from sima_storage.database import get_readonly_session
 from sima_storage.repository import EventRepository
 
 logger = logging.getLogger(__name__)
@@ -109,15 +109,12 @@ async def websocket_events(
             except asyncio.TimeoutError:
                 # Poll for new events
                 try:
-                    async with get_session() as session:
+                    async with get_readonly_session() as session:
                         repo = EventRepository(session)
                         # Get stream filter
                         stream_filter = None
-                        if stream != "all":
-                            try:
-                                stream_filter = Stream(stream)
-                            except ValueError:
-                                pass
+                        if stream in VALID_STREAMS:
+                            stream_filter = Stream(stream)
 
                         # Get recent events
                         events = await repo.list_recent(
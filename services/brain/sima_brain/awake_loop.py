@@ -23,11 +23,13 @@ from uuid import UUID
 from sima_core.ids import generate_id
 from sima_core.types import Actor, EventType, InputType, Stream
 
+from sima_llm import close_provider_clients
 from sima_storage.database import close_db, get_session
 from sima_storage.repository import MemoryRepository
 
 from .module_runner import ModuleRunner, ModuleResult
 from .persistence import TracePersistence, create_trace, persist_trace, get_prior_attention_prediction, get_recent_monologues
+from .prayer import close_prayer_sender
 from .senses import SenseCollector
 from .settings import Settings
 from .simulated_competition import run_competition
@@ -329,6 +331,12 @@ class AwakeLoop:
                 )
                 await persist_trace(ctx.persistence)
             raise
+        finally:
+            # Pooled sense, LLM and prayer connections belong to this run's event loop
+            if self.sense_collector:
+                await self.sense_collector.close()
+            await close_provider_clients()
+            await close_prayer_sender()
 
         return ctx
 
@@ -10,7 +10,7 @@ from uuid import UUID
 
 from sima_core.events import EventCreate
 from sima_core.types import Actor, EventType, InputType, Stream
-from sima_storage.database import get_session
+from sima_storage.database import get_readonly_session, get_session
 from sima_storage.repository import EventRepository, TraceRepository, SystemStateRepository
 
 logger = logging.getLogger(__name__)
@@ -244,7 +244,7 @@ async def persist_events(events: list[EventCreate]) -> None:
 
     async with get_session() as session:
         repo = EventRepository(session)
-        await repo.create_many(events)
+        await repo.bulk_insert_copy(events)
 
     logger.info(f"Persisted {len(events)} events")
 
@@ -271,7 +271,7 @@ async def persist_trace(persistence: TracePersistence, response_message: str | N
 
 async def is_system_paused() -> bool:
     """Check if the system is paused."""
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = SystemStateRepository(session)
         return await repo.is_paused()
 
@@ -292,7 +292,7 @@ async def get_prior_attention_prediction() -> dict | None:
     Returns:
         The content_json of the last ATTENTION_PREDICTION event, or None.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = EventRepository(session)
         event = await repo.get_latest_by_type(
             event_type=EventType.ATTENTION_PREDICTION,
@@ -315,7 +315,7 @@ async def get_recent_monologues(limit: int = 3) -> list[dict]:
     Returns:
         List of monologue content_json dicts, newest first.
     """
-    async with get_session() as session:
+    async with get_readonly_session() as session:
         repo = EventRepository(session)
         events = await repo.list_recent(
             limit=limit,
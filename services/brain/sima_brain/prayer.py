@@ -144,6 +144,17 @@ async def execute_prayer(arguments: dict[str, Any] | None = None) -> dict[str, A
     return await _prayer_sender.send_prayer(message)
 
 
+async def close_prayer_sender() -> None:
+    """
+    Close the prayer sender's HTTP client.
+
+    The client is bound to the event loop it was created on, so call this
+    before that loop ends; the next prayer opens a fresh client.
+    """
+    if _prayer_sender is not None:
+        await _prayer_sender.close()
+
+
 def setup_prayer_tool(bot_token: str, tal_chat_id: int) -> None:
     """
     Set up the prayer tool with Telegram credentials.
@@ -5,10 +5,12 @@ Collects both fast senses (every tick) and slow senses (cached).
 Returns a unified sensory payload for perception.
 """
 
+import asyncio
 import logging
 from typing import Any
 
 from .heartbeat import HeartbeatSense
+from .http import close_http_client
 from .breathing import BreathingSense
 from .thought_burden import ThoughtBurdenSense
 from .tiredness import TirednessSense
@@ -16,6 +18,10 @@ from .weather import WeatherSense
 
 logger = logging.getLogger(__name__)
 
+# Longest a tick waits on a slow sense before using its cached reading.
+# Kept below the HTTP timeout so one hung request can't stall the tick.
+SLOW_SENSE_DEADLINE = 5.0
+
 
 class SenseCollector:
     """
@@ -91,19 +97,26 @@ class SenseCollector:
         """
         logger.debug("Collecting sensory data...")
 
-        # Collect fast senses (always collected)
-        heartbeat_data = await self.heartbeat.collect()
-        breathing_data = await self.breathing.collect()
-        thought_burden_data = await self.thought_burden.collect(
-            memories=memories,
-            additional_context_tokens=additional_context_tokens,
+        # Slow senses (may return cached data) go in the same gather as the
+        # fast ones, so a weather request overlaps the local readings
+        weather = self._collect_weather() if self.weather else asyncio.sleep(0)
+
+        (
+            heartbeat_data,
+            breathing_data,
+            thought_burden_data,
+            tiredness_data,
+            weather_data,
+        ) = await asyncio.gather(
+            self.heartbeat.collect(),
+            self.breathing.collect(),
+            self.thought_burden.collect(
+                memories=memories,
+                additional_context_tokens=additional_context_tokens,
+            ),
+            self.tiredness.collect(),
+            weather,
         )
-        tiredness_data = await self.tiredness.collect()
-
-        # Collect slow senses (may return cached data)
-        weather_data = None
-        if self.weather:
-            weather_data = await self.weather.collect()
 
         payload = {
             "heartbeat_rate": heartbeat_data,
@@ -126,6 +139,18 @@ class SenseCollector:
 
         return payload
 
+    async def _collect_weather(self) -> dict[str, Any] | None:
+        """Collect weather within SLOW_SENSE_DEADLINE, else return the cached reading."""
+        weather = self.weather
+        if weather is None:
+            return None
+        try:
+            return await asyncio.wait_for(weather.collect(), SLOW_SENSE_DEADLINE)
+        except TimeoutError:
+            # The refresh itself is shielded and keeps filling the cache
+            logger.warning(f"Weather sense timed out after {SLOW_SENSE_DEADLINE}s")
+            return weather.cached_data
+
     async def collect_fast_only(
         self,
         memories: list[dict[str, Any]] | None = None,
@@ -159,6 +184,10 @@ class SenseCollector:
             "tiredness": tiredness_data,
         }
 
+    async def close(self) -> None:
+        """Release network resources held by the senses (call before the loop ends)."""
+        await close_http_client()
+
     def get_summary(self) -> dict[str, Any]:
         """
         Get a summary of the most recent sense readings.
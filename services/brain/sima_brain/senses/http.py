@@ -0,0 +1,84 @@
+"""
+Shared HTTP client for senses that call external APIs.
+
+One httpx.AsyncClient is kept for the running event loop so fetches made
+during a trace reuse pooled connections instead of opening a new
+connection each time. The awake loop runs every trace in its own
+asyncio.run(), so the client is replaced when the loop changes and
+should be closed with close_http_client() before the loop ends.
+"""
+
+import asyncio
+import json
+from typing import Any, Callable
+
+import httpx
+
+# orjson is optional; fall back to stdlib json when it isn't installed
+_loads: Callable[[str | bytes], Any]
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Timeout for external sense API requests (seconds)
+API_TIMEOUT = 10.0
+
+# Connect timeout, kept short so an unreachable host fails fast
+CONNECT_TIMEOUT = 2.0
+
+# Idle pooled connections outlive the gap between ticks
+KEEPALIVE_EXPIRY = 60.0
+
+# HTTP/2 needs the optional h2 package; without it httpx speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for the running event loop.
+
+    Must be called from a coroutine.
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(API_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=40,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created on this loop."""
+    global _client, _client_loop
+
+    client, loop = _client, _client_loop
+    _client = None
+    _client_loop = None
+
+    # A client from a finished loop cannot be closed from this one; its
+    # connections went away with that loop
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
+def response_json(response: httpx.Response) -> Any:
+    """Decode a response body as JSON (orjson when available)."""
+    return _loads(response.content)
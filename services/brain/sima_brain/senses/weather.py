@@ -10,11 +10,12 @@ Sampling: Every 15 minutes (slow sense, cached)
 Source: Open-Meteo API (free, no API key required)
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
-import httpx
+from .http import get_http_client, response_json
 
 logger = logging.getLogger(__name__)
 
@@ -96,10 +97,22 @@ class WeatherSense:
         self._cached_data: dict[str, Any] | None = None
         self._cache_timestamp: datetime | None = None
 
+        # HTTP validators from the last full response, sent on the next
+        # fetch so an unchanged forecast comes back as 304 Not Modified
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._last_fetched: dict[str, Any] | None = None
+
+        # Refresh in progress, shared by concurrent collect() calls
+        self._inflight: asyncio.Task | None = None
+
     async def collect(self) -> dict[str, Any] | None:
         """
         Collect current weather data, using cache if valid.
 
+        Concurrent calls made while a refresh is running wait for that
+        refresh instead of starting their own request.
+
         Returns:
             Weather data structure, or None if unavailable.
         """
@@ -108,12 +121,20 @@ class WeatherSense:
             logger.debug("Using cached weather data")
             return self._cached_data
 
-        # Fetch fresh data
+        task = self._inflight
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._inflight = asyncio.ensure_future(self._refresh())
+        # Shielded so a cancelled caller doesn't abort the shared refresh
+        return await asyncio.shield(task)
+
+    async def _refresh(self) -> dict[str, Any] | None:
+        """Fetch fresh data into the cache, falling back to stale data on failure."""
+        now = datetime.now(timezone.utc)
         try:
-            data = await self._fetch_weather()
+            data = await self._fetch_weather(now)
             if data:
                 self._cached_data = data
-                self._cache_timestamp = datetime.now(timezone.utc)
+                self._cache_timestamp = now
             return data
         except Exception as e:
             logger.warning(f"Failed to fetch weather: {e}")
@@ -131,10 +152,13 @@ class WeatherSense:
         age = datetime.now(timezone.utc) - self._cache_timestamp
         return age < timedelta(minutes=self.cache_minutes)
 
-    async def _fetch_weather(self) -> dict[str, Any] | None:
+    async def _fetch_weather(self, now: datetime | None = None) -> dict[str, Any] | None:
         """
         Fetch weather data from Open-Meteo API.
 
+        Args:
+            now: Time to stamp as sampled_at (default: current UTC time).
+
         Returns:
             Parsed weather data structure, or None on failure.
         """
@@ -154,19 +178,38 @@ class WeatherSense:
             "forecast_days": 1,
         }
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(OPEN_METEO_URL, params=params)
-            response.raise_for_status()
-            raw = response.json()
+        sampled_at = (now or datetime.now(timezone.utc)).isoformat()
+
+        headers = {}
+        if self._last_fetched is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+        client = get_http_client()
+        response = await client.get(OPEN_METEO_URL, params=params, headers=headers)
+
+        if response.status_code == 304 and self._last_fetched is not None:
+            logger.debug("Weather not modified since last fetch")
+            return {**self._last_fetched, "sampled_at": sampled_at}
+
+        response.raise_for_status()
+        raw = response_json(response)
 
-        return self._parse_response(raw)
+        data = self._parse_response(raw, sampled_at)
+        self._etag = response.headers.get("etag")
+        self._last_modified = response.headers.get("last-modified")
+        self._last_fetched = data
+        return data
 
-    def _parse_response(self, raw: dict[str, Any]) -> dict[str, Any]:
+    def _parse_response(self, raw: dict[str, Any], sampled_at: str | None = None) -> dict[str, Any]:
         """
         Parse Open-Meteo API response into our schema.
 
         Args:
             raw: Raw API response JSON.
+            sampled_at: ISO timestamp of the sample (default: now).
 
         Returns:
             Structured weather data.
@@ -212,7 +255,7 @@ class WeatherSense:
                 "sunrise": sunrise_str,
                 "sunset": sunset_str,
             },
-            "sampled_at": datetime.now(timezone.utc).isoformat(),
+            "sampled_at": sampled_at or datetime.now(timezone.utc).isoformat(),
             "description": f"Weather conditions in {self.location_name.split(',')[0]}",
         }
 
@@ -222,6 +265,9 @@ class WeatherSense:
         return self._cached_data
 
     def clear_cache(self) -> None:
-        """Clear the weather cache, forcing a refresh on next collect."""
+        """Clear the weather cache, forcing a full refresh on next collect."""
         self._cached_data = None
         self._cache_timestamp = None
+        self._etag = None
+        self._last_modified = None
+        self._last_fetched = None
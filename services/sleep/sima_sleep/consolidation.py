@@ -406,5 +406,5 @@ class SleepConsolidator:
             await ctx.session.flush()
 
         # Create events
-        await ctx.event_repo.create_many(ctx.events_to_persist)
+        await ctx.event_repo.bulk_insert_copy(ctx.events_to_persist)
         logger.info(f"Persisted {len(ctx.events_to_persist)} sleep events")
@@ -9,8 +9,13 @@ from uuid import uuid4
 
 from sima_core.types import Actor, EventType, InputType, Stream
 from sima_core.events import EventCreate
-from sima_storage.database import get_session, init_db, close_db
-from sima_storage.repository import TraceRepository, EventRepository
+from sima_storage.database import get_readonly_session, get_session, init_db, close_db
+from sima_storage.repository import (
+    COPY_MIN_ROWS,
+    EventRepository,
+    SystemStateRepository,
+    TraceRepository,
+)
 
 
 @pytest.fixture
@@ -108,6 +113,63 @@ class TestTraceRepository:
             count = await repo.count()
             assert count >= 0
 
+    async def test_count_estimate_traces(self, setup_db):
+        """Test that the trace count estimate is non-negative."""
+        async with get_session() as session:
+            repo = TraceRepository(session)
+            estimate = await repo.count_estimate()
+            assert estimate >= 0
+
+    async def test_delete_trace_cascades_events(self, setup_db):
+        """Test that deleting a trace removes its events in the database."""
+        trace_id = uuid4()
+
+        async with get_session() as session:
+            trace = await TraceRepository(session).create(
+                trace_id=trace_id,
+                input_type=InputType.MINUTE_TICK,
+            )
+            event_id = await EventRepository(session).create_fast(EventCreate(
+                trace_id=trace_id,
+                actor=Actor.SYSTEM,
+                stream=Stream.SUBCONSCIOUS,
+                event_type=EventType.TICK,
+            ))
+            await session.delete(trace)
+            await session.flush()
+
+            assert await EventRepository(session).get(event_id) is None
+
+    async def test_list_inflight_traces(self, setup_db):
+        """Test that only uncompleted traces are listed as in flight."""
+        running_id = uuid4()
+        done_id = uuid4()
+
+        async with get_session() as session:
+            repo = TraceRepository(session)
+            await repo.create(trace_id=running_id, input_type=InputType.MINUTE_TICK)
+            await repo.create(trace_id=done_id, input_type=InputType.MINUTE_TICK)
+            await repo.complete(done_id)
+
+            inflight_ids = {t.trace_id for t in await repo.list_inflight(limit=1000)}
+            assert running_id in inflight_ids
+            assert done_id not in inflight_ids
+
+    async def test_readonly_session_reads_committed_trace(self, setup_db):
+        """Test reading a committed trace through a read-only session."""
+        trace_id = uuid4()
+
+        async with get_session() as session:
+            await TraceRepository(session).create(
+                trace_id=trace_id,
+                input_type=InputType.MINUTE_TICK,
+            )
+
+        async with get_readonly_session() as session:
+            trace = await TraceRepository(session).get(trace_id)
+            assert trace is not None
+            assert trace.input_type == InputType.MINUTE_TICK
+
 
 @pytest.mark.asyncio
 class TestEventRepository:
@@ -140,6 +202,31 @@ class TestEventRepository:
             assert event.trace_id == trace_id
             assert event.actor == Actor.PERCEPTION
 
+    async def test_create_event_fast(self, setup_db):
+        """Test creating an event without an ORM model."""
+        trace_id = uuid4()
+
+        async with get_session() as session:
+            await TraceRepository(session).create(
+                trace_id=trace_id,
+                input_type=InputType.USER_MESSAGE,
+            )
+
+            event_repo = EventRepository(session)
+            event_id = await event_repo.create_fast(EventCreate(
+                trace_id=trace_id,
+                actor=Actor.PERCEPTION,
+                stream=Stream.SUBCONSCIOUS,
+                event_type=EventType.PERCEPT,
+                content_json={"test": "data"},
+            ))
+
+            event = await event_repo.get(event_id)
+            assert event is not None
+            assert event.trace_id == trace_id
+            assert event.actor == Actor.PERCEPTION
+            assert event.content_json == {"test": "data"}
+
     async def test_list_events_by_trace(self, setup_db):
         """Test listing events for a trace."""
         trace_id = uuid4()
@@ -176,6 +263,10 @@ class TestEventRepository:
             events = await event_repo.list_by_trace(trace_id)
             assert len(events) == 2
 
+            # Stream the same events in small batches
+            streamed = [e async for e in event_repo.list_by_trace_stream(trace_id, yield_per=1)]
+            assert [e.event_id for e in streamed] == [e.event_id for e in events]
+
     async def test_filter_events_by_stream(self, setup_db):
         """Test filtering events by stream."""
         trace_id = uuid4()
@@ -212,3 +303,210 @@ class TestEventRepository:
             )
             assert len(conscious_events) == 1
             assert conscious_events[0].stream == Stream.CONSCIOUS
+
+    async def test_recent_summary(self, setup_db):
+        """Test per-minute event counts for a stream."""
+        trace_id = uuid4()
+
+        async with get_session() as session:
+            await TraceRepository(session).create(
+                trace_id=trace_id,
+                input_type=InputType.MINUTE_TICK,
+            )
+
+            event_repo = EventRepository(session)
+            await event_repo.bulk_insert_copy([
+                EventCreate(
+                    trace_id=trace_id,
+                    actor=Actor.SYSTEM,
+                    stream=Stream.SLEEP,
+                    event_type=EventType.TICK,
+                )
+                for _ in range(3)
+            ])
+
+            summary = await event_repo.recent_summary(Stream.SLEEP, minutes=5)
+            assert sum(row["event_count"] for row in summary) >= 3
+
+    async def test_list_events_by_tag(self, setup_db):
+        """Test listing events by tag."""
+        trace_id = uuid4()
+
+        async with get_session() as session:
+            trace_repo = TraceRepository(session)
+            await trace_repo.create(
+                trace_id=trace_id,
+                input_type=InputType.USER_MESSAGE,
+            )
+
+            event_repo = EventRepository(session)
+            tag = f"tag-{trace_id}"
+            await event_repo.create_many([
+                EventCreate(
+                    trace_id=trace_id,
+                    actor=Actor.PERCEPTION,
+                    stream=Stream.SUBCONSCIOUS,
+                    event_type=EventType.PERCEPT,
+                    tags=[tag, "percept"],
+                ),
+                EventCreate(
+                    trace_id=trace_id,
+                    actor=Actor.WORKSPACE,
+                    stream=Stream.CONSCIOUS,
+                    event_type=EventType.WORKSPACE_UPDATE,
+                    tags=["workspace"],
+                ),
+            ])
+
+            tagged = await event_repo.list_by_tag(tag)
+            assert len(tagged) == 1
+            assert tagged[0].actor == Actor.PERCEPTION
+
+    async def test_bulk_insert_copy(self, setup_db):
+        """Test bulk inserting events through COPY."""
+        trace_id = uuid4()
+
+        async with get_session() as session:
+            trace_repo = TraceRepository(session)
+            await trace_repo.create(
+                trace_id=trace_id,
+                input_type=InputType.USER_MESSAGE,
+            )
+
+            event_repo = EventRepository(session)
+            events_to_create = [
+                EventCreate(
+                    trace_id=trace_id,
+                    actor=Actor.PERCEPTION,
+                    stream=Stream.SUBCONSCIOUS,
+                    event_type=EventType.PERCEPT,
+                    content_json={"step": i},
+                    tags=["bulk"],
+                )
+                for i in range(COPY_MIN_ROWS)
+            ]
+            event_ids = await event_repo.bulk_insert_copy(events_to_create)
+
+            events = await event_repo.list_by_trace(trace_id)
+            assert len(event_ids) == COPY_MIN_ROWS
+            assert {e.event_id for e in events} == set(event_ids)
+            assert sorted(e.content_json["step"] for e in events) == list(range(COPY_MIN_ROWS))
+
+    async def test_create_many_in_batches(self, setup_db):
+        """Test create_many across several flush batches."""
+        trace_id = uuid4()
+
+        async with get_session() as session:
+            await TraceRepository(session).create(
+                trace_id=trace_id,
+                input_type=InputType.USER_MESSAGE,
+            )
+
+            event_repo = EventRepository(session)
+            events_to_create = [
+                EventCreate(
+                    trace_id=trace_id,
+                    actor=Actor.PERCEPTION,
+                    stream=Stream.SUBCONSCIOUS,
+                    event_type=EventType.PERCEPT,
+                    content_json={"step": i},
+                )
+                for i in range(5)
+            ]
+            models = await event_repo.create_many(events_to_create, batch_size=2)
+
+            assert len(models) == 5
+            assert len(await event_repo.list_by_trace(trace_id)) == 5
+
+    async def test_list_events_by_json_contains(self, setup_db):
+        """Test listing events by content_json containment."""
+        trace_id = uuid4()
+
+        async with get_session() as session:
+            await TraceRepository(session).create(
+                trace_id=trace_id,
+                input_type=InputType.USER_MESSAGE,
+            )
+
+            event_repo = EventRepository(session)
+            marker = str(trace_id)
+            await event_repo.create_many([
+                EventCreate(
+                    trace_id=trace_id,
+                    actor=Actor.PERCEPTION,
+                    stream=Stream.SUBCONSCIOUS,
+                    event_type=EventType.PERCEPT,
+                    content_json={"marker": marker, "kind": "a"},
+                ),
+                EventCreate(
+                    trace_id=trace_id,
+                    actor=Actor.PERCEPTION,
+                    stream=Stream.SUBCONSCIOUS,
+                    event_type=EventType.PERCEPT,
+                    content_json={"marker": marker, "kind": "b"},
+                ),
+            ])
+
+            matches = await event_repo.list_by_json_contains({"marker": marker, "kind": "b"})
+            assert len(matches) == 1
+            assert matches[0].content_json["kind"] == "b"
+
+            by_marker = await event_repo.filter_json_eq("marker", marker)
+            assert len(by_marker) == 2
+
+
+    async def test_bulk_insert_small_batch(self, setup_db):
+        """Test that small bulk inserts (UNNEST path) keep every column."""
+        trace_id = uuid4()
+
+        async with get_session() as session:
+            await TraceRepository(session).create(
+                trace_id=trace_id,
+                input_type=InputType.USER_MESSAGE,
+            )
+
+            event_repo = EventRepository(session)
+            event_ids = await event_repo.bulk_insert_copy([
+                EventCreate(
+                    trace_id=trace_id,
+                    actor=Actor.SPEAKER,
+                    stream=Stream.EXTERNAL,
+                    event_type=EventType.MESSAGE_OUT,
+                    content_text="hello",
+                    content_json={"text": "hello"},
+                    tokens_in=3,
+                    cost_usd=0.5,
+                    tags=["a", "b"],
+                ),
+                EventCreate(
+                    trace_id=trace_id,
+                    actor=Actor.SYSTEM,
+                    stream=Stream.CONSCIOUS,
+                    event_type=EventType.TICK,
+                ),
+            ])
+
+            events = {e.event_id: e for e in await event_repo.list_by_trace(trace_id)}
+            first, second = events[event_ids[0]], events[event_ids[1]]
+            assert first.actor == Actor.SPEAKER
+            assert first.content_json == {"text": "hello"}
+            assert first.tags == ["a", "b"]
+            assert first.cost_usd == 0.5
+            assert second.tags == []
+            assert second.content_json is None
+
+@pytest.mark.asyncio
+class TestSystemStateRepository:
+    """Tests for SystemStateRepository."""
+
+    async def test_set_upserts_value(self, setup_db):
+        """Test that set inserts a new key and overwrites an existing one."""
+        key = f"test-{uuid4()}"
+
+        async with get_session() as session:
+            repo = SystemStateRepository(session)
+            await repo.set(key, "first")
+            assert await repo.get(key) == "first"
+
+            await repo.set(key, "second")
+            assert await repo.get(key) == "second"
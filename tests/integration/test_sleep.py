@@ -12,6 +12,7 @@ from uuid import uuid4
 
 from sima_core.types import Actor, EventType, InputType, Stream
 from sima_core.events import EventCreate
+from sima_storage.access import MemoryAccessBuffer
 from sima_storage.database import get_session, init_db, close_db
 from sima_storage.repository import TraceRepository, EventRepository, MemoryRepository
 
@@ -294,3 +295,29 @@ class TestMemoryRepository:
             assert updated is not None
             assert updated.access_count == initial_count + 1
             assert updated.last_accessed_at is not None
+
+    async def test_record_accesses_batch(self, setup_db):
+        """Test applying a batch of buffered memory accesses."""
+        buffer = MemoryAccessBuffer(flush_every=100)
+
+        async with get_session() as session:
+            repo = MemoryRepository(session)
+            memory = await repo.create(
+                memory_id=uuid4(),
+                memory_type=MemoryType.SEMANTIC,
+                content="Test memory for batched access tracking.",
+            )
+            initial_count = memory.access_count
+
+        buffer.record(memory.memory_id)
+        buffer.record(memory.memory_id)
+
+        async with get_session() as session:
+            await MemoryRepository(session).record_accesses(buffer.drain())
+
+        async with get_session() as session:
+            updated = await MemoryRepository(session).get(memory.memory_id)
+
+            assert updated is not None
+            assert updated.access_count == initial_count + 2
+            assert updated.last_accessed_at is not None
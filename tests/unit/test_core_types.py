@@ -2,9 +2,26 @@
 Unit tests for sima_core types.
 """
 
+import time
+
 import pytest
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 
-from sima_core.types import Actor, EventType, InputType, Stream
+from sima_core.events import Event, EventCreate
+from sima_core.ids import POOL_SIZE, generate_id, generate_ids_bulk
+from sima_core.time import format_timestamp, parse_timestamp, utc_now
+from sima_core.types import (
+    Actor,
+    EventType,
+    InputType,
+    Stream,
+    VALID_ACTORS,
+    VALID_EVENT_TYPES,
+    VALID_INPUT_TYPES,
+    VALID_STREAMS,
+)
 
 
 class TestEnumValues:
@@ -62,3 +79,160 @@ class TestEnumStringConversion:
         assert isinstance(Actor.PERCEPTION, str)
         assert isinstance(EventType.PERCEPT, str)
         assert isinstance(InputType.USER_MESSAGE, str)
+
+
+class TestValidValueSets:
+    """Test the raw value sets used for membership checks."""
+
+    def test_sets_match_enums(self):
+        """Each set should hold exactly the enum values."""
+        assert VALID_STREAMS == {s.value for s in Stream}
+        assert VALID_ACTORS == {a.value for a in Actor}
+        assert VALID_EVENT_TYPES == {e.value for e in EventType}
+        assert VALID_INPUT_TYPES == {i.value for i in InputType}
+
+    def test_membership(self):
+        """Raw strings and enum members should both be found."""
+        assert "conscious" in VALID_STREAMS
+        assert Stream.CONSCIOUS in VALID_STREAMS
+        assert "all" not in VALID_STREAMS
+        assert None not in VALID_STREAMS
+
+
+class TestEvents:
+    """Test event construction."""
+
+    def test_event_from_create_copies_fields(self):
+        """Event.from_create should carry over every EventCreate field."""
+        trace_id = uuid4()
+        create = EventCreate(
+            trace_id=trace_id,
+            actor=Actor.PERCEPTION,
+            stream=Stream.SUBCONSCIOUS,
+            event_type=EventType.PERCEPT,
+            content_json={"step": 1},
+            tokens_in=10,
+            tags=["a"],
+        )
+        event = Event.from_create(create)
+
+        assert event.trace_id == trace_id
+        assert event.actor == Actor.PERCEPTION
+        assert event.content_json == {"step": 1}
+        assert event.tokens_in == 10
+        assert event.tags == ["a"]
+        assert event.event_id is not None
+        assert event.ts.tzinfo is not None
+
+    def test_event_from_create_covers_all_create_fields(self):
+        """Every EventCreate field should be copied, not just the common ones."""
+        create = EventCreate(
+            trace_id=uuid4(),
+            actor=Actor.SYSTEM,
+            stream=Stream.SUBCONSCIOUS,
+            event_type=EventType.PERCEPT,
+        )
+        for f in fields(EventCreate):
+            if getattr(create, f.name) is None:
+                setattr(create, f.name, f"sentinel-{f.name}")
+
+        event = Event.from_create(create)
+
+        for f in fields(EventCreate):
+            assert getattr(event, f.name) == getattr(create, f.name)
+
+    def test_event_create_defaults(self):
+        """Optional fields should default to None and tags to a fresh list."""
+        a = EventCreate(
+            trace_id=uuid4(),
+            actor=Actor.SYSTEM,
+            stream=Stream.SUBCONSCIOUS,
+            event_type=EventType.TICK,
+        )
+        b = EventCreate(
+            trace_id=uuid4(),
+            actor=Actor.SYSTEM,
+            stream=Stream.SUBCONSCIOUS,
+            event_type=EventType.TICK,
+        )
+        assert a.content_text is None
+        assert a.tags == []
+        assert a.tags is not b.tags
+
+    def test_event_to_dict(self):
+        """to_dict should return a plain dict of all fields."""
+        create = EventCreate(
+            trace_id=uuid4(),
+            actor=Actor.SPEAKER,
+            stream=Stream.EXTERNAL,
+            event_type=EventType.MESSAGE_OUT,
+            content_text="hi",
+        )
+        data = Event.from_create(create).to_dict()
+
+        assert data["content_text"] == "hi"
+        assert "event_id" in data
+        assert "ts" in data
+
+
+class TestIds:
+    """Test ID generation."""
+
+    def test_generate_id_is_uuid7(self):
+        """Generated IDs should be version 7 UUIDs carrying the current time."""
+        before = time.time_ns() // 1_000_000
+        uid = generate_id()
+        after = time.time_ns() // 1_000_000
+        assert uid.version == 7
+        assert uid.variant == "specified in RFC 4122"
+        assert before <= uid.int >> 80 <= after
+
+    def test_generate_id_time_ordered(self):
+        """IDs from later milliseconds should sort after earlier ones."""
+        first = generate_id()
+        time.sleep(0.002)
+        second = generate_id()
+        assert first < second
+
+    def test_generate_id_unique_across_pool_refill(self):
+        """IDs should stay unique when the byte pool is refilled."""
+        ids = {generate_id() for _ in range(POOL_SIZE * 3)}
+        assert len(ids) == POOL_SIZE * 3
+
+    def test_generate_ids_bulk(self):
+        """Bulk generation should return n distinct version 7 UUIDs."""
+        ids = generate_ids_bulk(10)
+        assert len(ids) == 10
+        assert len(set(ids)) == 10
+        assert all(uid.version == 7 for uid in ids)
+        assert generate_ids_bulk(0) == []
+
+
+class TestTime:
+    """Test timestamp helpers."""
+
+    def test_utc_now_is_aware_utc(self):
+        """utc_now should return a timezone-aware UTC datetime."""
+        now = utc_now()
+        assert now.tzinfo is timezone.utc
+        assert abs(now - datetime.now(timezone.utc)) < timedelta(seconds=5)
+
+    @pytest.mark.parametrize(
+        "dt",
+        [
+            datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+            datetime(2026, 1, 2, 3, 4, 5, 999999, tzinfo=timezone.utc),
+            datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            datetime(2026, 1, 2, 3, 4, 6, 1, tzinfo=timezone.utc),
+            datetime(2026, 1, 2, 3, 4, 5, 7, tzinfo=timezone(timedelta(hours=2))),
+            datetime(2026, 1, 2, 3, 4, 5, 7),
+        ],
+    )
+    def test_format_timestamp_matches_isoformat(self, dt):
+        """format_timestamp should match isoformat() exactly."""
+        assert format_timestamp(dt) == dt.isoformat()
+
+    def test_format_timestamp_roundtrip(self):
+        """Formatted timestamps should parse back to the same instant."""
+        now = utc_now()
+        assert parse_timestamp(format_timestamp(now)) == now
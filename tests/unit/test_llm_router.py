@@ -0,0 +1,675 @@
+"""
+Unit tests for the sima_llm router tool loop.
+
+Provider calls are replaced with scripted responses, so no API keys
+or network access are needed.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from sima_llm import (
+    DATETIME_TOOL_DEFINITION,
+    PRAY_TOOL_DEFINITION,
+    LLMResponse,
+    LLMRouter,
+    close_provider_clients,
+    register_tool,
+)
+from sima_llm.router import (
+    _LOOP_CLIENTS,
+    _PROVIDER_CLIENTS,
+    Message,
+    _get_sync_executor,
+    _provider_tools,
+    _to_bedrock_messages,
+    _to_google_messages,
+)
+from sima_llm.tools import ASYNC_TOOL_EXECUTORS, TOOL_EXECUTORS, TOOL_REGISTRY
+
+
+def _tool_call(call_id: str, name: str, arguments: str) -> dict:
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {"name": name, "arguments": arguments},
+    }
+
+
+class ScriptedRouter(LLMRouter):
+    """Router whose provider returns pre-scripted responses."""
+
+    def __init__(self, responses: list[LLMResponse], **kwargs):
+        super().__init__(**kwargs)
+        self._responses = list(responses)
+        self.calls: list[dict] = []
+
+    async def _call_provider(self, **kwargs) -> LLMResponse:
+        # Snapshot messages, the conversation list keeps growing
+        kwargs["messages"] = [dict(m) for m in kwargs["messages"]]
+        self.calls.append(kwargs)
+        return self._responses.pop(0)
+
+
+class TestToolLoop:
+    """Tests for tool execution and conversation continuation."""
+
+    @pytest.mark.asyncio
+    async def test_no_tool_calls_returns_first_response(self):
+        """A plain response should be returned without another round."""
+        router = ScriptedRouter([LLMResponse(content="hi")])
+        response = await router.complete(messages=[{"role": "user", "content": "hello"}])
+
+        assert response.content == "hi"
+        assert response.tool_results == []
+        assert len(router.calls) == 1
+        assert router.calls[0]["messages"] == [{"role": "user", "content": "hello"}]
+
+    @pytest.mark.asyncio
+    async def test_tool_call_appends_assistant_and_tool_messages(self):
+        """Executed tool calls should be appended as plain message dicts."""
+        router = ScriptedRouter([
+            LLMResponse(
+                content=None,
+                tool_calls=[_tool_call("call_1", "get_current_datetime", '{"format": "iso"}')],
+            ),
+            LLMResponse(content="done"),
+        ])
+        response = await router.complete(
+            messages=[{"role": "user", "content": "what time is it?"}],
+            tools=["get_current_datetime"],
+        )
+
+        assert response.content == "done"
+        assert len(response.tool_results) == 1
+        assert response.tool_results[0]["tool_name"] == "get_current_datetime"
+        assert response.tool_results[0]["arguments"] == {"format": "iso"}
+        assert "datetime_iso" in response.tool_results[0]["result"]
+
+        second = router.calls[1]["messages"]
+        assert second[1] == {
+            "role": "assistant",
+            "tool_calls": [_tool_call("call_1", "get_current_datetime", '{"format": "iso"}')],
+        }
+        assert second[2]["role"] == "tool"
+        assert second[2]["tool_call_id"] == "call_1"
+        assert second[2]["name"] == "get_current_datetime"
+        assert "datetime_iso" in json.loads(second[2]["content"])
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_records_error(self):
+        """Errors from tool execution should be reported back to the model."""
+        router = ScriptedRouter([
+            LLMResponse(content=None, tool_calls=[_tool_call("call_1", "nope", "{}")]),
+            LLMResponse(content="ok"),
+        ])
+        response = await router.complete(messages=[{"role": "user", "content": "x"}])
+
+        assert "error" in response.tool_results[0]
+        tool_msg = router.calls[1]["messages"][2]
+        assert "error" in json.loads(tool_msg["content"])
+
+    @pytest.mark.asyncio
+    async def test_malformed_arguments_become_empty_dict(self):
+        """Unparseable tool arguments should fall back to an empty dict."""
+        router = ScriptedRouter([
+            LLMResponse(
+                content=None,
+                tool_calls=[_tool_call("call_1", "get_current_datetime", "{not json")],
+            ),
+            LLMResponse(content="ok"),
+        ])
+        response = await router.complete(messages=[{"role": "user", "content": "x"}])
+
+        assert response.tool_results[0]["arguments"] == {}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("arguments", ["", "   ", "null", "not json", '["a"]'])
+    async def test_non_object_arguments_become_empty_dict(self, arguments):
+        """Arguments that are not a JSON object should be skipped unparsed."""
+        router = ScriptedRouter([
+            LLMResponse(
+                content=None,
+                tool_calls=[_tool_call("call_1", "get_current_datetime", arguments)],
+            ),
+            LLMResponse(content="ok"),
+        ])
+        response = await router.complete(messages=[{"role": "user", "content": "x"}])
+
+        assert response.tool_results[0]["arguments"] == {}
+
+    @pytest.mark.asyncio
+    async def test_max_iterations_final_call_without_tools(self):
+        """After max iterations a final call is made with tools disabled."""
+        looping = LLMResponse(
+            content=None,
+            tool_calls=[_tool_call("call_1", "get_current_datetime", "{}")],
+        )
+        router = ScriptedRouter(
+            [looping, looping, LLMResponse(content="final")],
+            max_tool_iterations=2,
+        )
+        response = await router.complete(
+            messages=[{"role": "user", "content": "x"}],
+            tools=["get_current_datetime"],
+        )
+
+        assert response.content == "final"
+        assert len(response.tool_results) == 2
+        assert router.calls[-1]["tools"] is None
+
+    @pytest.mark.asyncio
+    async def test_auto_execute_disabled_returns_tool_calls(self):
+        """With auto_execute_tools=False the tool calls are returned untouched."""
+        router = ScriptedRouter([
+            LLMResponse(
+                content=None,
+                tool_calls=[_tool_call("call_1", "get_current_datetime", "{}")],
+            ),
+        ])
+        response = await router.complete(
+            messages=[{"role": "user", "content": "x"}],
+            auto_execute_tools=False,
+        )
+
+        assert len(response.tool_calls) == 1
+        assert response.tool_results == []
+        assert len(router.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_executors_run_concurrently_in_call_order(self):
+        """Async executors should overlap and results keep call order."""
+        started: list[str] = []
+        release = asyncio.Event()
+
+        async def slow_tool(arguments):
+            started.append(arguments["tag"])
+            if len(started) == 2:
+                release.set()
+            # Both calls must be in flight before either can finish
+            await asyncio.wait_for(release.wait(), timeout=1.0)
+            return {"tag": arguments["tag"]}
+
+        ASYNC_TOOL_EXECUTORS["unit_test_slow_tool"] = slow_tool
+        try:
+            router = ScriptedRouter([
+                LLMResponse(
+                    content=None,
+                    tool_calls=[
+                        _tool_call("call_a", "unit_test_slow_tool", '{"tag": "a"}'),
+                        _tool_call("call_b", "unit_test_slow_tool", '{"tag": "b"}'),
+                    ],
+                ),
+                LLMResponse(content="ok"),
+            ])
+            response = await router.complete(messages=[{"role": "user", "content": "x"}])
+        finally:
+            ASYNC_TOOL_EXECUTORS.pop("unit_test_slow_tool", None)
+
+        assert [r["result"]["tag"] for r in response.tool_results] == ["a", "b"]
+        tool_msgs = router.calls[1]["messages"][2:]
+        assert [m["tool_call_id"] for m in tool_msgs] == ["call_a", "call_b"]
+
+    @pytest.mark.asyncio
+    async def test_conversation_is_appended_not_reserialized(self):
+        """Each round should reuse earlier message dicts and only add new ones."""
+        seen: list[list[int]] = []
+
+        class RecordingRouter(ScriptedRouter):
+            async def _call_provider(self, **kwargs):
+                seen.append([id(m) for m in kwargs["messages"]])
+                return await super()._call_provider(**kwargs)
+
+        looping = LLMResponse(
+            content=None,
+            tool_calls=[_tool_call("call_1", "get_current_datetime", "{}")],
+        )
+        router = RecordingRouter([looping, looping, LLMResponse(content="done")])
+        await router.complete(messages=[Message(role="user", content="x")])
+
+        assert [len(ids) for ids in seen] == [1, 3, 5]
+        assert seen[1][:1] == seen[0]
+        assert seen[2][:3] == seen[1]
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None, usage=None):
+    choices = []
+    if content is not None or tool_calls is not None or finish_reason is not None:
+        delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+        choices = [SimpleNamespace(delta=delta, finish_reason=finish_reason)]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+def _tc_delta(index, call_id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index,
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+class StreamingRouter(LLMRouter):
+    """Router whose OpenAI client streams scripted chunks."""
+
+    def __init__(self, streams, **kwargs):
+        super().__init__(**kwargs)
+        self.requests: list[dict] = []
+        router = self
+
+        async def create(**request):
+            router.requests.append(request)
+            return streams.pop(0)()
+
+        self._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+    def _get_client(self, provider):
+        return self._client
+
+
+class TestStreaming:
+    """Tests for streamed OpenAI responses with early tool dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_tool_call_starts_before_stream_ends(self):
+        """A finished tool call should run while later calls still stream."""
+        first_started = asyncio.Event()
+
+        async def record_tool(arguments):
+            if arguments["tag"] == "a":
+                first_started.set()
+            return {"tag": arguments["tag"]}
+
+        async def tool_stream():
+            yield _chunk(tool_calls=[_tc_delta(0, "call_a", "unit_test_stream_tool", '{"tag"')])
+            yield _chunk(tool_calls=[_tc_delta(0, arguments=': "a"}')])
+            yield _chunk(tool_calls=[_tc_delta(1, "call_b", "unit_test_stream_tool", '{"tag": "b"}')])
+            # The stream only finishes once call_a is already running
+            await asyncio.wait_for(first_started.wait(), timeout=1.0)
+            yield _chunk(finish_reason="tool_calls")
+            yield _chunk(usage=SimpleNamespace(prompt_tokens=3, completion_tokens=4, total_tokens=7))
+
+        async def text_stream():
+            yield _chunk(content="do")
+            yield _chunk(content="ne", finish_reason="stop")
+
+        ASYNC_TOOL_EXECUTORS["unit_test_stream_tool"] = record_tool
+        try:
+            router = StreamingRouter([tool_stream, text_stream], stream_tool_calls=True)
+            response = await router.complete(
+                messages=[{"role": "user", "content": "x"}],
+                tools=["get_current_datetime"],
+            )
+        finally:
+            ASYNC_TOOL_EXECUTORS.pop("unit_test_stream_tool", None)
+
+        assert response.content == "done"
+        assert [r["result"]["tag"] for r in response.tool_results] == ["a", "b"]
+        assert router.requests[0]["stream"] is True
+        assistant = router.requests[1]["messages"][1]
+        assert assistant["tool_calls"][0]["function"]["arguments"] == '{"tag": "a"}'
+        assert [m["tool_call_id"] for m in router.requests[1]["messages"][2:]] == ["call_a", "call_b"]
+
+    @pytest.mark.asyncio
+    async def test_calls_without_ids_keep_their_results(self):
+        """Early-dispatched calls are matched to results by position, not id."""
+
+        async def record_tool(arguments):
+            return {"tag": arguments["tag"]}
+
+        async def tool_stream():
+            yield _chunk(tool_calls=[_tc_delta(0, None, "unit_test_stream_tool", '{"tag": "a"}')])
+            yield _chunk(tool_calls=[_tc_delta(1, None, "unit_test_stream_tool", '{"tag": "b"}')])
+            yield _chunk(tool_calls=[_tc_delta(2, None, "unit_test_stream_tool", '{"tag": "c"}')])
+            yield _chunk(finish_reason="tool_calls")
+
+        async def text_stream():
+            yield _chunk(content="done", finish_reason="stop")
+
+        ASYNC_TOOL_EXECUTORS["unit_test_stream_tool"] = record_tool
+        try:
+            router = StreamingRouter([tool_stream, text_stream], stream_tool_calls=True)
+            response = await router.complete(
+                messages=[{"role": "user", "content": "x"}],
+                tools=["get_current_datetime"],
+            )
+        finally:
+            ASYNC_TOOL_EXECUTORS.pop("unit_test_stream_tool", None)
+
+        assert [r["result"]["tag"] for r in response.tool_results] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_stream_error_cancels_dispatched_calls(self):
+        """A stream failing after a call was dispatched cancels that call."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def blocking_tool(arguments):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {}
+
+        async def failing_stream():
+            yield _chunk(tool_calls=[_tc_delta(0, "call_a", "unit_test_stream_tool", "{}")])
+            yield _chunk(tool_calls=[_tc_delta(1, "call_b", "unit_test_stream_tool", "{}")])
+            await asyncio.wait_for(started.wait(), timeout=1.0)
+            raise RuntimeError("stream dropped")
+
+        ASYNC_TOOL_EXECUTORS["unit_test_stream_tool"] = blocking_tool
+        try:
+            router = StreamingRouter([failing_stream], stream_tool_calls=True)
+            with pytest.raises(RuntimeError, match="stream dropped"):
+                await router.complete(
+                    messages=[{"role": "user", "content": "x"}],
+                    tools=["get_current_datetime"],
+                )
+            await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+        finally:
+            ASYNC_TOOL_EXECUTORS.pop("unit_test_stream_tool", None)
+
+    @pytest.mark.asyncio
+    async def test_no_streaming_by_default(self):
+        """Tool calls are not dispatched early unless enabled."""
+        seen = []
+
+        async def create(**request):
+            seen.append(request)
+            return SimpleNamespace(
+                choices=[
+                    SimpleNamespace(
+                        message=SimpleNamespace(content="ok", tool_calls=None),
+                        finish_reason="stop",
+                    )
+                ],
+                usage=None,
+            )
+
+        router = StreamingRouter([])
+        router._client.chat.completions.create = create
+        await router.complete(
+            messages=[{"role": "user", "content": "x"}],
+            tools=["get_current_datetime"],
+        )
+
+        assert "stream" not in seen[0]
+
+    @pytest.mark.asyncio
+    async def test_no_streaming_without_tools(self):
+        """Without tool definitions the plain request path is used."""
+        response_obj = SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    message=SimpleNamespace(content="hi", tool_calls=None),
+                    finish_reason="stop",
+                )
+            ],
+            usage=None,
+        )
+
+        async def create(**request):
+            assert "stream" not in request
+            return response_obj
+
+        router = StreamingRouter([])
+        router._client.chat.completions.create = create
+        response = await router.complete(messages=[{"role": "user", "content": "x"}])
+
+        assert response.content == "hi"
+
+    @pytest.mark.asyncio
+    async def test_stream_tool_calls_disabled(self):
+        """stream_tool_calls=False should keep the non-streaming request."""
+        seen = []
+
+        async def create(**request):
+            seen.append(request)
+            return SimpleNamespace(
+                choices=[
+                    SimpleNamespace(
+                        message=SimpleNamespace(content="ok", tool_calls=None),
+                        finish_reason="stop",
+                    )
+                ],
+                usage=None,
+            )
+
+        router = StreamingRouter([], stream_tool_calls=False)
+        router._client.chat.completions.create = create
+        await router.complete(
+            messages=[{"role": "user", "content": "x"}],
+            tools=["get_current_datetime"],
+        )
+
+        assert "stream" not in seen[0]
+
+
+class TestProviderTools:
+    """Tests for cached provider-shaped tool definitions."""
+
+    def test_openai_format_is_passthrough(self):
+        """OpenAI-compatible providers get the definitions unchanged."""
+        defs = _provider_tools("openai", ["get_current_datetime"])
+        assert defs == [DATETIME_TOOL_DEFINITION]
+
+    def test_google_format(self):
+        """Google gets a single function_declarations block."""
+        defs = _provider_tools("google", ["get_current_datetime", "pray"])
+        names = [d["name"] for d in defs[0]["function_declarations"]]
+        assert names == ["get_current_datetime", "pray"]
+
+    def test_bedrock_format(self):
+        """Bedrock gets a toolConfig dict with toolSpec entries."""
+        defs = _provider_tools("bedrock", ["pray"])
+        spec = defs["tools"][0]["toolSpec"]
+        assert spec["name"] == "pray"
+        assert spec["inputSchema"]["json"] == PRAY_TOOL_DEFINITION["function"]["parameters"]
+
+    def test_unknown_tools_give_none(self):
+        """No matching definitions should disable tools."""
+        assert _provider_tools("google", ["does_not_exist"]) is None
+
+    def test_cached_between_calls(self):
+        """Repeated lookups should return the same cached object."""
+        first = _provider_tools("bedrock", ["get_current_datetime"])
+        assert _provider_tools("bedrock", ["get_current_datetime"]) is first
+
+    def test_register_tool_invalidates_cache(self):
+        """Registering a tool should make it visible to cached lookups."""
+        name = "unit_test_echo_tool"
+        assert _provider_tools("openai", [name]) is None
+
+        definition = {
+            "type": "function",
+            "function": {
+                "name": name,
+                "description": "Echo",
+                "parameters": {"type": "object", "properties": {}},
+            },
+        }
+        register_tool(name, definition, lambda args: args or {})
+        try:
+            assert _provider_tools("openai", [name]) == [definition]
+        finally:
+            TOOL_REGISTRY.pop(name, None)
+            TOOL_EXECUTORS.pop(name, None)
+
+
+class TestProviderClients:
+    """Tests for process-wide provider client sharing."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_clients(self):
+        pytest.importorskip("openai")
+        _PROVIDER_CLIENTS.clear()
+        _LOOP_CLIENTS.clear()
+        yield
+        _PROVIDER_CLIENTS.clear()
+        _LOOP_CLIENTS.clear()
+
+    @pytest.mark.asyncio
+    async def test_routers_share_client_for_same_key(self):
+        """Two routers with the same key should get the same client."""
+        a = LLMRouter(api_keys={"openai": "sk-test"})
+        b = LLMRouter(api_keys={"openai": "sk-test"})
+        assert a._get_client("openai") is b._get_client("openai")
+
+    @pytest.mark.asyncio
+    async def test_different_keys_get_different_clients(self):
+        """Clients must not be shared across API keys."""
+        a = LLMRouter(api_keys={"openai": "sk-one"})
+        b = LLMRouter(api_keys={"openai": "sk-two"})
+        assert a._get_client("openai") is not b._get_client("openai")
+        keys = _LOOP_CLIENTS[asyncio.get_running_loop()]
+        assert all("sk-" not in key[1] for key in keys)
+
+    def test_async_client_recreated_on_new_loop(self):
+        """A client created on one event loop is replaced on another."""
+        router = LLMRouter(api_keys={"openai": "sk-test"})
+
+        async def get():
+            return router._get_client("openai")
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_loop_keeps_client_while_another_loop_runs(self):
+        """Using another loop meanwhile must not replace this loop's client."""
+        router = LLMRouter(api_keys={"openai": "sk-test"})
+
+        async def get():
+            return router._get_client("openai")
+
+        first = router._get_client("openai")
+        other = await asyncio.to_thread(asyncio.run, get())
+        assert other is not first
+        assert router._get_client("openai") is first
+
+    @pytest.mark.asyncio
+    async def test_close_provider_clients(self):
+        """Closing drops this loop's clients so the next call builds a new one."""
+        router = LLMRouter(api_keys={"openai": "sk-test"})
+        first = router._get_client("openai")
+
+        await close_provider_clients()
+
+        assert first.is_closed()
+        assert router._get_client("openai") is not first
+
+
+class TestCompleteSync:
+    """Tests for the synchronous wrapper."""
+
+    def test_complete_sync_without_loop(self):
+        """complete_sync should work with no running loop."""
+        router = ScriptedRouter([LLMResponse(content="hi")])
+        assert router.complete_sync(messages=[{"role": "user", "content": "x"}]).content == "hi"
+
+    @pytest.mark.asyncio
+    async def test_complete_sync_inside_loop_reuses_executor(self):
+        """Inside a running loop, calls should share one executor."""
+        router = ScriptedRouter([LLMResponse(content="a"), LLMResponse(content="b")])
+        first = router.complete_sync(messages=[{"role": "user", "content": "x"}])
+        executor = _get_sync_executor()
+        second = router.complete_sync(messages=[{"role": "user", "content": "y"}])
+
+        assert (first.content, second.content) == ("a", "b")
+        assert _get_sync_executor() is executor
+
+
+class TestMessage:
+    """Tests for the Message input type."""
+
+    def test_to_dict_omits_unset_fields(self):
+        """Only role and set fields should be emitted."""
+        assert Message(role="user", content="hi").to_dict() == {"role": "user", "content": "hi"}
+        assert Message(role="tool", content="{}", tool_call_id="c1", name="t").to_dict() == {
+            "role": "tool",
+            "content": "{}",
+            "tool_call_id": "c1",
+            "name": "t",
+        }
+
+    @pytest.mark.asyncio
+    async def test_message_instances_accepted_by_complete(self):
+        """complete() should accept Message instances as input."""
+        router = ScriptedRouter([LLMResponse(content="ok")])
+        await router.complete(messages=[Message(role="user", content="hi")])
+        assert router.calls[0]["messages"] == [{"role": "user", "content": "hi"}]
+
+
+CONVERSATION = [
+    {"role": "system", "content": "be brief"},
+    {"role": "user", "content": "time?"},
+    {
+        "role": "assistant",
+        "tool_calls": [_tool_call("call_1", "get_current_datetime", '{"format": "iso"}')],
+    },
+    {"role": "tool", "content": '{"now": "t"}', "tool_call_id": "call_1", "name": "get_current_datetime"},
+    {"role": "assistant", "content": "it is t"},
+]
+
+
+class TestMessageConversion:
+    """Tests for provider-specific message conversion."""
+
+    def test_google(self):
+        """System goes to the instruction, tools become function responses."""
+        contents, system = _to_google_messages(CONVERSATION)
+
+        assert system == "be brief"
+        assert [c["role"] for c in contents] == ["user", "model", "function", "model"]
+        assert contents[0]["parts"] == ["time?"]
+        assert contents[2]["parts"][0]["function_response"] == {
+            "name": "get_current_datetime",
+            "response": {"now": "t"},
+        }
+        assert contents[3]["parts"] == ["it is t"]
+
+    def test_bedrock(self):
+        """Tool calls become toolUse blocks and results toolResult blocks."""
+        converted, system = _to_bedrock_messages(CONVERSATION)
+
+        assert system == [{"text": "be brief"}]
+        assert [m["role"] for m in converted] == ["user", "assistant", "user", "assistant"]
+        assert converted[1]["content"] == [
+            {
+                "toolUse": {
+                    "toolUseId": "call_1",
+                    "name": "get_current_datetime",
+                    "input": {"format": "iso"},
+                }
+            }
+        ]
+        assert converted[2]["content"][0]["toolResult"] == {
+            "toolUseId": "call_1",
+            "content": [{"json": {"now": "t"}}],
+        }
+        assert converted[3]["content"] == [{"text": "it is t"}]
+
+
+class TestLLMResponse:
+    """Tests for the LLMResponse container."""
+
+    def test_slotted(self):
+        """LLMResponse should not carry a per-instance __dict__."""
+        response = LLMResponse(content="x")
+        assert not hasattr(response, "__dict__")
+        with pytest.raises(AttributeError):
+            response.unknown = 1
+
+    def test_defaults_are_fresh(self):
+        """Mutable defaults must not be shared between instances."""
+        a, b = LLMResponse(content=None), LLMResponse(content=None)
+        a.tool_calls.append({})
+        a.usage["total_tokens"] = 1
+        assert b.tool_calls == [] and b.usage == {}
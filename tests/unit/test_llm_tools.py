@@ -0,0 +1,192 @@
+"""
+Unit tests for sima_llm built-in tools.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from sima_llm import tools
+from sima_llm.tools import (
+    DATETIME_TOOL_DEFINITION,
+    PRAY_TOOL_DEFINITION,
+    TOOL_EXECUTORS,
+    TOOL_REGISTRY,
+    _format_utc_offset,
+    _get_zoneinfo,
+    execute_datetime_tool,
+    execute_pray_tool,
+    get_tool_definition,
+    get_tool_definitions,
+    register_tool,
+)
+
+
+class TestDatetimeTool:
+    """Tests for the get_current_datetime tool."""
+
+    def test_timezone_is_used(self):
+        """A valid IANA timezone should be reported back."""
+        result = execute_datetime_tool({"timezone": "Asia/Jerusalem"})
+        assert result["timezone"] == "Asia/Jerusalem"
+        assert datetime.fromisoformat(result["datetime_iso"]).tzinfo is not None
+
+    def test_unknown_timezone_falls_back_to_utc(self):
+        """Unknown timezones should fall back to UTC."""
+        result = execute_datetime_tool({"timezone": "Mars/Olympus_Mons"})
+        assert result["timezone"] == "UTC"
+        assert result["timezone_offset"] == "+0000"
+
+    def test_zoneinfo_lookup_is_cached(self):
+        """Repeated lookups should hit the cache, including fallbacks."""
+        _get_zoneinfo.cache_clear()
+        _get_zoneinfo("Europe/London")
+        _get_zoneinfo("Europe/London")
+        _get_zoneinfo("Not/AZone")
+        _get_zoneinfo("Not/AZone")
+
+        info = _get_zoneinfo.cache_info()
+        assert (info.hits, info.misses) == (2, 2)
+
+    def test_fields_match_strftime(self):
+        """Hand-formatted fields should match their strftime equivalents."""
+        result = execute_datetime_tool({"timezone": "America/New_York"})
+        now = datetime.fromisoformat(result["datetime_iso"])
+
+        assert result["date"] == now.strftime("%Y-%m-%d")
+        assert result["time"] == now.strftime("%H:%M:%S")
+        assert result["day_of_week"] == now.strftime("%A")
+        assert result["day_of_week_short"] == now.strftime("%a")
+        assert result["timezone_offset"] == now.strftime("%z")
+
+    @pytest.mark.parametrize(
+        "offset",
+        [
+            timedelta(0),
+            timedelta(hours=5, minutes=30),
+            timedelta(hours=-3, minutes=-30),
+            timedelta(hours=-10),
+            timedelta(hours=1, seconds=15),
+        ],
+    )
+    def test_format_utc_offset(self, offset):
+        """Offsets should be formatted exactly like %z."""
+        dt = datetime(2024, 1, 1, tzinfo=timezone(offset))
+        assert _format_utc_offset(dt) == dt.strftime("%z")
+
+    @pytest.mark.parametrize(
+        ("output_format", "keys"),
+        [
+            ("iso", {"datetime_iso", "unix_timestamp", "timezone"}),
+            ("time_only", {"time", "hour", "minute", "second", "timezone", "timezone_offset"}),
+            (
+                "date_only",
+                {"date", "day_of_week", "is_weekend", "week_number", "day_of_year", "timezone"},
+            ),
+        ],
+    )
+    def test_format_returns_only_its_fields(self, output_format, keys):
+        """Each format should return exactly its documented fields."""
+        result = execute_datetime_tool({"format": output_format})
+        assert set(result) == keys
+
+    def test_full_is_default_and_consistent(self):
+        """The full format should be the default and internally consistent."""
+        result = execute_datetime_tool()
+        now = datetime.fromisoformat(result["datetime_iso"])
+
+        assert len(result) == 14
+        assert result["week_number"] == now.isocalendar()[1]
+        assert result["day_of_year"] == now.timetuple().tm_yday
+        assert result["is_weekend"] == (now.weekday() >= 5)
+
+
+class TestToolDefinitions:
+    """Tests for tool definition lookup."""
+
+    def test_builtin_definitions(self):
+        """Built-in tools resolve to their module-level definitions."""
+        assert get_tool_definition("get_current_datetime") is DATETIME_TOOL_DEFINITION
+        assert get_tool_definition("pray") is PRAY_TOOL_DEFINITION
+
+    def test_unknown_tool(self):
+        """Unknown names resolve to None."""
+        assert get_tool_definition("nope") is None
+
+    def test_registered_tool(self):
+        """Registered tools are found, but cannot shadow built-ins."""
+        definition = {"type": "function", "function": {"name": "unit_test_tool"}}
+        register_tool("unit_test_tool", definition, lambda args: {})
+        register_tool("pray", {"type": "function"}, execute_pray_tool)
+        try:
+            assert get_tool_definition("unit_test_tool") is definition
+            assert get_tool_definition("pray") is PRAY_TOOL_DEFINITION
+        finally:
+            TOOL_REGISTRY.pop("unit_test_tool", None)
+            TOOL_EXECUTORS.pop("unit_test_tool", None)
+            TOOL_REGISTRY.pop("pray", None)
+            TOOL_EXECUTORS["pray"] = execute_pray_tool
+
+    def test_get_tool_definitions_skips_unknown_and_keeps_order(self):
+        """Unknown names are dropped; the rest keep the requested order."""
+        assert get_tool_definitions(["pray", "nope", "get_current_datetime"]) == [
+            PRAY_TOOL_DEFINITION,
+            DATETIME_TOOL_DEFINITION,
+        ]
+
+    @pytest.mark.parametrize(
+        "day",
+        [date(2024, 1, 1), date(2024, 12, 31), date(2023, 12, 31), date(2021, 1, 3), date(2024, 2, 29)],
+    )
+    def test_calendar_fields_at_year_edges(self, monkeypatch, day):
+        """week_number and day_of_year should match the standard library."""
+        fixed = datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc)
+        monkeypatch.setattr(tools, "time", SimpleNamespace(time=fixed.timestamp))
+
+        result = execute_datetime_tool({"format": "date_only"})
+
+        assert result["week_number"] == fixed.isocalendar()[1]
+        assert result["day_of_year"] == fixed.timetuple().tm_yday
+
+    def test_offset_cache_follows_dst_transition(self, monkeypatch):
+        """A cached offset must not be reused once the minute changes."""
+        tools._OFFSET_CACHE.clear()
+        # 2024-03-31 01:00 UTC: Europe/London switches from GMT to BST
+        transition = datetime(2024, 3, 31, 1, tzinfo=timezone.utc).timestamp()
+        clock = SimpleNamespace(time=lambda: transition - 30)
+        monkeypatch.setattr(tools, "time", clock)
+
+        before = execute_datetime_tool({"timezone": "Europe/London", "format": "time_only"})
+        clock.time = lambda: transition - 1
+        cached = execute_datetime_tool({"timezone": "Europe/London", "format": "time_only"})
+        clock.time = lambda: transition + 1
+        after = execute_datetime_tool({"timezone": "Europe/London", "format": "time_only"})
+
+        assert (before["timezone_offset"], before["time"]) == ("+0000", "00:59:30")
+        assert (cached["timezone_offset"], cached["time"]) == ("+0000", "00:59:59")
+        assert (after["timezone_offset"], after["time"]) == ("+0100", "02:00:01")
+
+    def test_unknown_timezone_skips_zoneinfo_lookup(self, monkeypatch):
+        """Names missing from the tz database never reach ZoneInfo()."""
+        _get_zoneinfo.cache_clear()
+        requested = []
+        real_zoneinfo = tools.zoneinfo.ZoneInfo
+
+        def tracking(key):
+            requested.append(key)
+            return real_zoneinfo(key)
+
+        monkeypatch.setattr(tools.zoneinfo, "ZoneInfo", tracking)
+        try:
+            assert _get_zoneinfo("Nowhere/Special")[1] == "UTC"
+        finally:
+            _get_zoneinfo.cache_clear()
+
+        assert requested == ["UTC"]
+
+    def test_unix_timestamp_matches_datetime(self):
+        """unix_timestamp should be the same instant as datetime_iso."""
+        result = execute_datetime_tool({"timezone": "Asia/Tokyo", "format": "iso"})
+        now = datetime.fromisoformat(result["datetime_iso"])
+        assert result["unix_timestamp"] == int(now.timestamp())
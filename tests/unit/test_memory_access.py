@@ -0,0 +1,74 @@
+"""
+Unit tests for buffered memory access tracking.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from sima_storage import access as access_module
+from sima_storage.access import MemoryAccessBuffer
+
+
+class TestMemoryAccessBuffer:
+    """Tests for MemoryAccessBuffer."""
+
+    def test_counts_repeated_accesses(self):
+        buffer = MemoryAccessBuffer(flush_every=100)
+        a, b = uuid4(), uuid4()
+
+        buffer.record(a)
+        buffer.record(a)
+        buffer.record(b)
+
+        assert buffer.pending == 3
+        batch = buffer.drain()
+        assert batch[a][0] == 2
+        assert batch[b][0] == 1
+
+    def test_keeps_latest_access_time(self):
+        buffer = MemoryAccessBuffer(flush_every=100)
+        memory_id = uuid4()
+
+        buffer.record(memory_id)
+        first = buffer._last_accessed[memory_id]
+        buffer.record(memory_id)
+
+        _, last_accessed = buffer.drain()[memory_id]
+        assert last_accessed >= first
+
+    def test_due_after_flush_every_accesses(self):
+        buffer = MemoryAccessBuffer(flush_every=3, flush_seconds=3600)
+        memory_id = uuid4()
+
+        assert not buffer.due
+        buffer.record(memory_id)
+        buffer.record(memory_id)
+        assert not buffer.due
+        buffer.record(memory_id)
+        assert buffer.due
+
+    def test_due_after_flush_seconds(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(access_module.time, "monotonic", lambda: clock[0])
+        buffer = MemoryAccessBuffer(flush_every=100, flush_seconds=30)
+
+        buffer.record(uuid4())
+        assert not buffer.due
+        clock[0] += 30
+        assert buffer.due
+
+    def test_drain_resets(self):
+        buffer = MemoryAccessBuffer(flush_every=1)
+        buffer.record(uuid4())
+        assert buffer.due
+
+        buffer.drain()
+
+        assert buffer.pending == 0
+        assert not buffer.due
+        assert buffer.drain() == {}
+
+    def test_rejects_zero_flush_every(self):
+        with pytest.raises(ValueError):
+            MemoryAccessBuffer(flush_every=0)
@@ -0,0 +1,277 @@
+"""
+Unit tests for the sima_prompts registry and renderer.
+"""
+
+import os
+
+import pytest
+from jinja2 import FileSystemBytecodeCache, Template
+
+from sima_prompts import PromptConfig, PromptRegistry, clear_render_cache, render_prompt, renderer
+from sima_prompts import environment
+from sima_prompts.environment import compile_template, has_template_syntax
+from sima_prompts.renderer import render_messages
+
+
+PROMPT_YAML = """\
+name: test_module
+version: "1.2.0"
+schema_file: schemas/test.json
+tools: [get_current_datetime]
+messages:
+  - role: system
+    content: "You are {{ name }}."
+  - role: user
+    content: |
+      {% for s in senses %}- {{ s }}
+      {% endfor %}
+"""
+
+
+@pytest.fixture
+def registry(tmp_path):
+    (tmp_path / "test_module.yaml").write_text(PROMPT_YAML)
+    return PromptRegistry(tmp_path)
+
+
+class TestRegistry:
+    """Tests for loading prompt YAML files."""
+
+    def test_load(self, registry):
+        """Fields should be read from the YAML file."""
+        config = registry.load("test_module")
+
+        assert config.name == "test_module"
+        assert config.version == "1.2.0"
+        assert config.tools == ["get_current_datetime"]
+        assert [m["role"] for m in config.messages] == ["system", "user"]
+
+    def test_roles_and_contents_parallel_messages(self, registry):
+        """roles and contents mirror messages in order."""
+        config = registry.load("test_module")
+        assert config.roles == [m["role"] for m in config.messages]
+        assert config.contents == [m["content"] for m in config.messages]
+
+    def test_templates_compiled_at_load(self, registry):
+        """Each message should have a compiled template after loading."""
+        config = registry.load("test_module")
+        assert len(config.templates) == 2
+        assert all(isinstance(t, Template) for t in config.templates)
+
+    def test_load_utf8(self, tmp_path):
+        """Non-ASCII prompt text should survive the byte-level YAML load."""
+        (tmp_path / "unicode.yaml").write_text(
+            'messages:\n  - role: user\n    content: "שלום — ☀"\n', encoding="utf-8"
+        )
+        config = PromptRegistry(tmp_path).load("unicode")
+        assert config.messages[0]["content"] == "שלום — ☀"
+
+    def test_load_is_cached(self, registry):
+        """Loading twice should return the cached config."""
+        assert registry.load("test_module") is registry.load("test_module")
+
+    def test_repo_prompts_compile(self):
+        """Every prompt shipped in prompts/ should load and compile."""
+        registry = PromptRegistry()
+        modules = registry.list_modules()
+        assert modules
+
+        for module in modules:
+            config = registry.load(module)
+            for msg, template in zip(config.messages, config.templates):
+                if has_template_syntax(msg["content"]):
+                    assert isinstance(template, Template), module
+
+    def test_list_modules(self, registry, tmp_path):
+        """YAML files are listed by stem, other files are ignored."""
+        (tmp_path / "other.yml").write_text("messages: []")
+        (tmp_path / "notes.txt").write_text("")
+        assert registry.list_modules() == ["other", "test_module"]
+
+    def test_list_modules_refreshes_when_directory_changes(self, registry, tmp_path):
+        """Adding a file changes the directory mtime and the listing."""
+        assert registry.list_modules() == ["test_module"]
+        (tmp_path / "added.yaml").write_text("messages: []")
+        os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 1_000_000_000))
+        assert registry.list_modules() == ["added", "test_module"]
+
+    def test_list_modules_missing_dir(self, tmp_path):
+        """A missing prompts directory has no modules."""
+        assert PromptRegistry(tmp_path / "missing").list_modules() == []
+
+    def test_missing_module(self, registry):
+        """Unknown modules should raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            registry.load("nope")
+
+
+class TestRenderer:
+    """Tests for rendering prompt templates."""
+
+    def test_render_prompt(self, registry):
+        """Variables, loops and roles should render."""
+        config = registry.load("test_module")
+        messages = render_prompt(config, {"name": "SIMA", "senses": ["a", "b"]})
+
+        assert messages[0] == {"role": "system", "content": "You are SIMA."}
+        assert messages[1]["role"] == "user"
+        assert "- a" in messages[1]["content"] and "- b" in messages[1]["content"]
+
+    def test_undefined_variable_falls_back_to_raw(self, registry):
+        """A render error should leave the raw template content."""
+        config = registry.load("test_module")
+        messages = render_prompt(config, {"senses": []})
+        assert messages[0]["content"] == "You are {{ name }}."
+
+    def test_syntax_error_falls_back_to_raw(self):
+        """Templates that fail to compile are returned as-is."""
+        config = PromptConfig(
+            name="broken",
+            version="1",
+            schema_file="",
+            messages=[{"role": "user", "content": "{% if %}"}],
+        )
+        assert render_prompt(config, {}) == [{"role": "user", "content": "{% if %}"}]
+
+    def test_hand_built_config_is_compiled_on_first_render(self):
+        """Configs not loaded by the registry get templates on first use."""
+        config = PromptConfig(
+            name="manual",
+            version="1",
+            schema_file="",
+            messages=[{"role": "user", "content": "hi {{ who }}"}],
+        )
+        assert render_prompt(config, {"who": "there"})[0]["content"] == "hi there"
+        assert len(config.templates) == 1
+
+    def test_edited_messages_are_rendered(self):
+        """Reassigning messages after a render is picked up, even at the same length."""
+        config = PromptConfig(
+            name="manual",
+            version="1",
+            schema_file="",
+            messages=[{"role": "user", "content": "hi {{ who }}"}],
+        )
+        assert render_prompt(config, {"who": "there"})[0]["content"] == "hi there"
+
+        config.messages = [{"role": "user", "content": "bye {{ who }}"}]
+        assert render_prompt(config, {"who": "there"})[0]["content"] == "bye there"
+
+        config.messages = [{"role": "system", "content": "{{ who }}!"}]
+        assert render_prompt(config, {"who": "there"}) == [
+            {"role": "system", "content": "there!"}
+        ]
+        assert config.roles == ["system"]
+
+    @pytest.mark.parametrize(
+        "content",
+        ["plain text", "trailing newline\n", "windows\r\nlines\r\n", "{ not jinja }", ""],
+    )
+    def test_static_content_is_prerendered(self, content):
+        """Static messages skip Jinja at render time but render identically."""
+        compiled = compile_template(content)
+        assert isinstance(compiled, str)
+
+        config = PromptConfig(
+            name="static",
+            version="1",
+            schema_file="",
+            messages=[{"role": "user", "content": content}],
+        )
+        assert render_prompt(config, {})[0]["content"] == Template(content).render()
+
+    def test_render_messages(self):
+        """render_messages should render ad-hoc message lists."""
+        messages = render_messages([{"role": "user", "content": "{{ x }}!"}], {"x": 1})
+        assert messages == [{"role": "user", "content": "1!"}]
+
+
+class TestRenderCache:
+    """Tests for memoized rendering."""
+
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        clear_render_cache()
+        yield
+        clear_render_cache()
+
+    def _config(self, content="{{ v }}"):
+        return PromptConfig(
+            name="cached",
+            version="1",
+            schema_file="",
+            messages=[{"role": "user", "content": content}],
+        )
+
+    def test_repeat_render_is_cached(self, monkeypatch):
+        """Identical variables should not render twice."""
+        config = self._config()
+        calls = []
+        original = renderer._render
+
+        def counting(config, variables):
+            calls.append(variables)
+            return original(config, variables)
+
+        monkeypatch.setattr(renderer, "_render", counting)
+        first = render_prompt(config, {"v": [1, {"a": None}]})
+        second = render_prompt(config, {"v": [1, {"a": None}]})
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_results_are_copies(self):
+        """Mutating a returned message must not affect later renders."""
+        config = self._config()
+        render_prompt(config, {"v": "x"})[0]["content"] = "changed"
+        assert render_prompt(config, {"v": "x"})[0]["content"] == "x"
+
+    @pytest.mark.parametrize(
+        ("a", "b"),
+        [(1, 1.0), (1, True), (0.0, -0.0), ([1], (1,)), ({"x": 1, "y": 2}, {"y": 2, "x": 1})],
+    )
+    def test_equal_but_differently_rendered_values_are_not_shared(self, a, b):
+        """Values that compare equal but render differently get separate entries."""
+        config = self._config("{{ v }}{% if v is mapping %}{% for k in v %}{{ k }}{% endfor %}{% endif %}")
+        assert render_prompt(config, {"v": a}) == render_messages(config.messages, {"v": a})
+        assert render_prompt(config, {"v": b}) == render_messages(config.messages, {"v": b})
+
+    def test_non_plain_values_are_not_cached(self):
+        """Arbitrary objects are rendered every time."""
+
+        class Counter:
+            n = 0
+
+            def __str__(self):
+                Counter.n += 1
+                return str(Counter.n)
+
+        config = self._config()
+        counter = Counter()
+        assert render_prompt(config, {"v": counter})[0]["content"] == "1"
+        assert render_prompt(config, {"v": counter})[0]["content"] == "2"
+
+    def test_configs_do_not_share_entries(self):
+        """The same variables on different configs render separately."""
+        assert render_prompt(self._config("a{{ v }}"), {"v": 1})[0]["content"] == "a1"
+        assert render_prompt(self._config("b{{ v }}"), {"v": 1})[0]["content"] == "b1"
+
+
+class TestTemplateCompilation:
+    """Tests for shared template compilation."""
+
+    def test_identical_sources_share_a_template(self):
+        """Compiling the same source twice reuses the compiled template."""
+        source = "shared {{ x }}"
+        assert compile_template(source) is compile_template(source)
+
+    def test_bytecode_is_written_to_cache_dir(self, tmp_path, monkeypatch):
+        """Newly compiled templates are stored in the bytecode cache."""
+        monkeypatch.setattr(environment.env, "bytecode_cache", FileSystemBytecodeCache(str(tmp_path)))
+        compile_template(f"fresh {{{{ x }}}} {tmp_path}")
+        assert list(tmp_path.iterdir())
+
+    def test_loader_does_not_retain_sources(self):
+        """Sources are only held by the loader while compiling."""
+        compile_template("transient {{ y }}")
+        assert environment._loader.sources == {}
@@ -0,0 +1,248 @@
+"""
+Unit tests for the S3 helpers.
+
+The S3 client is replaced with an in-memory fake, so no AWS access or
+LocalStack is needed.
+"""
+
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("aioboto3")
+
+from sima_storage import s3  # noqa: E402
+
+
+class FakeBody:
+    """Streaming body returned by FakeClient.get_object."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self) -> bytes:
+        return self.data
+
+
+class FakeClient:
+    """Records uploads and signs URLs with a counter."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.calls: list[str] = []
+        self.signed = 0
+
+    async def put_object(self, Bucket, Key, Body, ContentType):
+        self.calls.append("put_object")
+        self.objects[Key] = Body
+
+    async def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, Config=None):
+        self.calls.append("upload_fileobj")
+        self.objects[Key] = Fileobj.read()
+
+    async def get_object(self, Bucket, Key):
+        return {"Body": FakeBody(self.objects[Key])}
+
+    async def generate_presigned_url(self, method, Params, ExpiresIn):
+        self.signed += 1
+        return f"https://s3.test/{Params['Key']}?sig={self.signed}"
+
+
+class FakeClientContext:
+    """What aioboto3.Session().client() returns: an async context manager."""
+
+    def __init__(self, kwargs):
+        self.kwargs = kwargs
+        self.client = FakeClient()
+        self.exited = False
+
+    async def __aenter__(self):
+        return self.client
+
+    async def __aexit__(self, *exc):
+        self.exited = True
+
+
+@pytest.fixture(autouse=True)
+def _reset_s3(monkeypatch):
+    monkeypatch.delenv("S3_POOL_SIZE", raising=False)
+    s3.invalidate_s3_config()
+    s3._url_cache.clear()
+    monkeypatch.setattr(s3, "_client", None)
+    monkeypatch.setattr(s3, "_client_context", None)
+    monkeypatch.setattr(s3, "_client_loop", None)
+    monkeypatch.setattr(s3, "_client_lock", None)
+    yield
+    s3.invalidate_s3_config()
+    s3._url_cache.clear()
+
+
+@pytest.fixture
+def contexts(monkeypatch):
+    """Patch aioboto3 sessions and collect every client context created."""
+    created: list[FakeClientContext] = []
+
+    class FakeSession:
+        def client(self, service, **kwargs):
+            context = FakeClientContext(kwargs)
+            created.append(context)
+            return context
+
+    monkeypatch.setattr(s3.aioboto3, "Session", FakeSession)
+    return created
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Replace the shared client with a single FakeClient."""
+    fake = FakeClient()
+
+    async def get_client():
+        return fake
+
+    monkeypatch.setattr(s3, "get_s3_client", get_client)
+    return fake
+
+
+class TestS3Config:
+    """Tests for the cached S3 configuration."""
+
+    def test_cached_until_invalidated(self, monkeypatch):
+        monkeypatch.setenv("S3_POOL_SIZE", "8")
+        config = s3.get_s3_config()
+        assert config["pool_size"] == 8
+
+        monkeypatch.setenv("S3_POOL_SIZE", "16")
+        assert s3.get_s3_config() is config
+
+        s3.invalidate_s3_config()
+        assert s3.get_s3_config()["pool_size"] == 16
+
+
+class TestS3Client:
+    """Tests for the shared per-loop S3 client."""
+
+    @pytest.mark.asyncio
+    async def test_reused_within_loop(self, contexts):
+        first = await s3.get_s3_client()
+        assert await s3.get_s3_client() is first
+        assert len(contexts) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_use_creates_one_client(self, contexts):
+        clients = await asyncio.gather(*(s3.get_s3_client() for _ in range(5)))
+        assert len({id(c) for c in clients}) == 1
+        assert len(contexts) == 1
+
+    @pytest.mark.asyncio
+    async def test_pool_config(self, contexts, monkeypatch):
+        monkeypatch.setenv("S3_POOL_SIZE", "12")
+        s3.invalidate_s3_config()
+
+        await s3.get_s3_client()
+
+        config = contexts[0].kwargs["config"]
+        assert config.max_pool_connections == 12
+        assert config.retries["mode"] == "adaptive"
+
+    @pytest.mark.asyncio
+    async def test_close(self, contexts):
+        first = await s3.get_s3_client()
+        await s3.close_s3_client()
+
+        assert contexts[0].exited
+        assert await s3.get_s3_client() is not first
+
+    def test_new_loop_gets_new_client(self, contexts):
+        first = asyncio.run(s3.get_s3_client())
+        second = asyncio.run(s3.get_s3_client())
+        assert first is not second
+
+
+class TestPayloads:
+    """Tests for storing and retrieving JSON payloads."""
+
+    @pytest.mark.asyncio
+    async def test_small_payload_not_stored(self, client):
+        key = await s3.store_large_payload(uuid4(), uuid4(), {"a": 1}, size_threshold=100)
+        assert key is None
+        assert client.calls == []
+
+    @pytest.mark.asyncio
+    async def test_threshold_counts_bytes(self, client):
+        # Fewer than 50 characters but more than 50 bytes once encoded
+        payload = {"text": "☀" * 30}
+        key = await s3.store_large_payload(uuid4(), uuid4(), payload, size_threshold=50)
+        assert key is not None
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, client):
+        payload = {"text": "x" * 200, "n": [1, 2, 3]}
+        key = await s3.store_large_payload(uuid4(), uuid4(), payload, size_threshold=100)
+
+        assert client.calls == ["put_object"]
+        assert await s3.retrieve_payload(key) == payload
+
+    @pytest.mark.asyncio
+    async def test_large_body_uses_multipart(self, client, monkeypatch):
+        monkeypatch.setattr(s3, "MULTIPART_THRESHOLD", 1000)
+        payload = {"text": "x" * 2000}
+
+        key = await s3.store_large_payload(uuid4(), uuid4(), payload, size_threshold=100)
+
+        assert client.calls == ["upload_fileobj"]
+        assert json.loads(client.objects[key]) == payload
+
+    @pytest.mark.asyncio
+    async def test_trace_export_stringifies_unknown_types(self, client):
+        trace_id = uuid4()
+        key = await s3.store_trace_export(trace_id, {"trace_id": trace_id, 1: "one"})
+
+        assert json.loads(client.objects[key]) == {"trace_id": str(trace_id), "1": "one"}
+
+
+class TestPresignedUrls:
+    """Tests for the presigned URL cache."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(s3.time, "monotonic", lambda: now[0])
+        return now
+
+    @pytest.mark.asyncio
+    async def test_reused_while_half_lifetime_left(self, client, clock):
+        first = await s3.generate_presigned_url("k", expires_in=3600)
+
+        clock[0] += 1800
+        assert await s3.generate_presigned_url("k", expires_in=3600) == first
+        assert client.signed == 1
+
+    @pytest.mark.asyncio
+    async def test_resigned_once_under_half_lifetime(self, client, clock):
+        first = await s3.generate_presigned_url("k", expires_in=3600)
+
+        clock[0] += 1801
+        assert await s3.generate_presigned_url("k", expires_in=3600) != first
+        assert client.signed == 2
+
+    @pytest.mark.asyncio
+    async def test_keyed_by_expiry(self, client, clock):
+        await s3.generate_presigned_url("k", expires_in=3600)
+        await s3.generate_presigned_url("k", expires_in=60)
+        assert client.signed == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, client, clock, monkeypatch):
+        monkeypatch.setattr(s3, "PRESIGNED_URL_CACHE_SIZE", 3)
+        for i in range(10):
+            await s3.generate_presigned_url(f"k{i}")
+        assert len(s3._url_cache) <= 3
@@ -5,6 +5,9 @@ Tests interoceptive and environmental senses that provide
 awareness context to The Brain's cognitive loop.
 """
 
+import asyncio
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone, timedelta
@@ -13,6 +16,9 @@ from sima_brain.senses.heartbeat import HeartbeatSense, _read_proc_stat_cpu
 from sima_brain.senses.breathing import BreathingSense, _read_proc_meminfo
 from sima_brain.senses.thought_burden import ThoughtBurdenSense, estimate_tokens
 from sima_brain.senses.tiredness import TirednessSense
+from sima_brain.senses import collector as collector_module
+from sima_brain.senses import http as sense_http
+from sima_brain.senses import weather as weather_module
 from sima_brain.senses.weather import WeatherSense
 from sima_brain.senses.collector import SenseCollector
 
@@ -282,6 +288,148 @@ class TestWeatherSense:
         assert result["sun"]["sunrise"] == "08:32"
         assert result["sun"]["sunset"] == "17:05"
 
+    @pytest.mark.asyncio
+    async def test_fetch_uses_shared_client(self, monkeypatch):
+        """Fetches should go through the shared HTTP client."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"current": {"weather_code": 0}, "daily": {}})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(weather_module, "get_http_client", lambda: client)
+
+        sense = WeatherSense()
+        first = await sense._fetch_weather()
+        second = await sense._fetch_weather()
+        await client.aclose()
+
+        assert first["conditions"]["description"] == "clear sky"
+        assert second["conditions"]["code"] == 0
+        assert len(requests) == 2
+        assert requests[0].url.params["latitude"] == "52.3676"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_collects_share_one_fetch(self):
+        """Callers arriving during a refresh should await the same request."""
+        sense = WeatherSense()
+        calls = 0
+
+        async def fake_fetch(now=None):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"temperature": {"current": 12.0}}
+
+        with patch.object(sense, "_fetch_weather", fake_fetch):
+            results = await asyncio.gather(*(sense.collect() for _ in range(5)))
+
+        assert calls == 1
+        assert all(r == {"temperature": {"current": 12.0}} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_conditional_fetch_reuses_parsed_data_on_304(self, monkeypatch):
+        """A 304 reply should return the previous data with a fresh sampled_at."""
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(dict(request.headers))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json={"current": {"weather_code": 3, "temperature_2m": 7.0}, "daily": {}},
+                headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"},
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(weather_module, "get_http_client", lambda: client)
+
+        sense = WeatherSense()
+        first = await sense._fetch_weather()
+        second = await sense._fetch_weather()
+        await client.aclose()
+
+        assert "if-none-match" not in seen_headers[0]
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert seen_headers[1]["if-modified-since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+        assert second["temperature"] == first["temperature"]
+        assert second["sampled_at"] >= first["sampled_at"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_stamps_one_timestamp(self):
+        """sampled_at and the cache timestamp should come from the same clock reading."""
+        sense = WeatherSense()
+        raw = {"current": {"weather_code": 0}, "daily": {}}
+
+        async def fake_fetch(now=None):
+            return sense._parse_response(raw, now.isoformat())
+
+        with patch.object(sense, "_fetch_weather", fake_fetch):
+            data = await sense.collect()
+
+        assert data["sampled_at"] == sense._cache_timestamp.isoformat()
+
+    def test_clear_cache_drops_validators(self):
+        """clear_cache should force an unconditional fetch next time."""
+        sense = WeatherSense()
+        sense._etag = '"v1"'
+        sense._last_fetched = {"temperature": {"current": 1}}
+
+        sense.clear_cache()
+
+        assert sense._etag is None
+        assert sense._last_fetched is None
+
+
+class TestSenseHttpClient:
+    """Tests for the shared sense HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_client_shared_within_loop(self):
+        """Calls on one loop should share a client until it is closed."""
+        client = sense_http.get_http_client()
+        assert sense_http.get_http_client() is client
+
+        await sense_http.close_http_client()
+        assert client.is_closed
+        assert sense_http.get_http_client() is not client
+        await sense_http.close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_client_timeouts(self):
+        """The shared client should fail fast on connect."""
+        client = sense_http.get_http_client()
+        assert client.timeout.connect == sense_http.CONNECT_TIMEOUT
+        assert client.timeout.read == sense_http.API_TIMEOUT
+        await sense_http.close_http_client()
+
+    def test_client_replaced_on_new_loop(self):
+        """A client from a finished loop is not reused by the next one."""
+
+        async def get():
+            return sense_http.get_http_client()
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+        assert first is not second
+        # Dropping a client from a dead loop must not raise
+        asyncio.run(sense_http.close_http_client())
+
+    @pytest.mark.asyncio
+    async def test_collector_close_closes_client(self):
+        """SenseCollector.close should release the shared client."""
+        client = sense_http.get_http_client()
+        await SenseCollector(weather_enabled=False).close()
+        assert client.is_closed
+
+    def test_response_json_decodes_body(self):
+        """response_json should decode the raw body like response.json()."""
+        response = httpx.Response(200, content=b'{"current": {"is_day": 1}}')
+        assert sense_http.response_json(response) == response.json()
+
+
 
 class TestSenseCollector:
     """Tests for the main sense collector orchestrator."""
@@ -305,6 +453,34 @@ class TestSenseCollector:
         # Weather should not be present (disabled)
         assert "weather" not in result
 
+    @pytest.mark.asyncio
+    async def test_collect_includes_weather_when_enabled(self):
+        """Weather gathered alongside the fast senses should land in the payload."""
+        collector = SenseCollector(weather_enabled=True, llm_model="gpt-4o")
+        weather = {"temperature": {"current": 9.5}}
+
+        with patch.object(collector.weather, "collect", AsyncMock(return_value=weather)):
+            result = await collector.collect()
+
+        assert result["weather"] == weather
+        assert "heartbeat_rate" in result
+
+    @pytest.mark.asyncio
+    async def test_slow_weather_falls_back_to_cache(self, monkeypatch):
+        """A weather fetch past the deadline should not hold up the tick."""
+        monkeypatch.setattr(collector_module, "SLOW_SENSE_DEADLINE", 0.01)
+        collector = SenseCollector(weather_enabled=True, llm_model="gpt-4o")
+        collector.weather._cached_data = {"temperature": {"current": 4.0}}
+
+        async def hung_collect():
+            await asyncio.sleep(1)
+
+        with patch.object(collector.weather, "collect", hung_collect):
+            result = await collector.collect()
+
+        assert result["weather"] == {"temperature": {"current": 4.0}}
+        assert "heartbeat_rate" in result
+
     @pytest.mark.asyncio
     async def test_collect_fast_only(self):
         """Should collect only fast senses when requested."""